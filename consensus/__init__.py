@@ -1,32 +1,70 @@
 # Consensys - Multi-agent code review with AI debate
 # This module provides the public API for the consensys package.
+#
+# Heavy submodules (CLI, orchestrator, anthropic SDK) are resolved lazily on
+# first attribute access (PEP 562) so that importing the package stays cheap.
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
 # Re-export the version
 from src import __version__
 
-# Re-export main CLI entry point
-from src.cli import main, cli
-
-# Re-export key components for programmatic use
-from src.orchestrator.debate import DebateOrchestrator
-from src.db.storage import Storage
-from src.agents.agent import Agent
-from src.agents.personas import PERSONAS, PERSONAS_BY_NAME, Persona
-from src.models.review import Review, Response, Vote, Consensus, VoteDecision
-
-__all__ = [
-    "__version__",
-    "main",
-    "cli",
-    "DebateOrchestrator",
-    "Storage",
-    "Agent",
-    "PERSONAS",
-    "PERSONAS_BY_NAME",
-    "Persona",
-    "Review",
-    "Response",
-    "Vote",
-    "Consensus",
-    "VoteDecision",
-]
+if TYPE_CHECKING:
+    from src.cli import main, cli
+    from src.orchestrator.debate import DebateOrchestrator, majority
+    from src.db.storage import Storage
+    from src.agents.agent import Agent
+    from src.agents.personas import PERSONAS, PERSONAS_BY_NAME, Persona
+    from src.models.review import Review, Response, Vote, Consensus, VoteDecision
+
+# Public name -> (module, attribute) for lazily resolved exports
+_LAZY: Dict[str, Tuple[str, str]] = {
+    # Main CLI entry point
+    "main": ("src.cli", "main"),
+    "cli": ("src.cli", "cli"),
+    # Key components for programmatic use
+    "DebateOrchestrator": ("src.orchestrator.debate", "DebateOrchestrator"),
+    "majority": ("src.orchestrator.debate", "majority"),
+    "Storage": ("src.db.storage", "Storage"),
+    "Agent": ("src.agents.agent", "Agent"),
+    "PERSONAS": ("src.agents.personas", "PERSONAS"),
+    "PERSONAS_BY_NAME": ("src.agents.personas", "PERSONAS_BY_NAME"),
+    "Persona": ("src.agents.personas", "Persona"),
+    "Review": ("src.models.review", "Review"),
+    "Response": ("src.models.review", "Response"),
+    "Vote": ("src.models.review", "Vote"),
+    "Consensus": ("src.models.review", "Consensus"),
+    "VoteDecision": ("src.models.review", "VoteDecision"),
+}
+
+__all__ = ["__version__", *_LAZY]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve a public attribute on first access.
+
+    The resolved value is cached in the module globals so subsequent
+    lookups bypass this hook entirely.
+
+    Args:
+        name: Attribute name being looked up
+
+    Returns:
+        The attribute from its defining submodule
+
+    Raises:
+        AttributeError: If the name is not part of the public API
+    """
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the public API, including attributes not yet loaded."""
+    return sorted(set(globals()) | set(__all__))
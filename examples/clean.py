@@ -7,6 +7,7 @@ Consensys review. Run `consensys review examples/clean.py` to verify.
 This code addresses all vulnerabilities shown in vulnerable.py with proper fixes.
 """
 
+import functools
 import hashlib
 import hmac
 import os
@@ -64,35 +65,44 @@ def load_user_data(json_data: str) -> dict:
 
 
 # Configuration from Environment Variables
-@dataclass
+# GOOD: Read the environment once at import, not on every construction
+_DB_HOST = os.environ.get("DB_HOST", "localhost")
+_DB_USERNAME = os.environ.get("DB_USERNAME", "")
+_DB_PASSWORD = os.environ.get("DB_PASSWORD", "")
+_API_KEY = os.environ.get("API_KEY", "")
+
+
+@dataclass(frozen=True)
 class DatabaseConfig:
     """Database configuration from environment variables."""
 
     # GOOD: Load secrets from environment, not source code
-    host: str = ""
-    username: str = ""
-    password: str = ""
-    api_key: str = ""
+    host: str = _DB_HOST
+    username: str = _DB_USERNAME
+    password: str = _DB_PASSWORD
+    api_key: str = _API_KEY
 
     def __post_init__(self):
-        self.host = os.environ.get("DB_HOST", "localhost")
-        self.username = os.environ.get("DB_USERNAME", "")
-        self.password = os.environ.get("DB_PASSWORD", "")
-        self.api_key = os.environ.get("API_KEY", "")
-
         if not self.username or not self.password:
             raise ValueError("Database credentials must be set in environment")
 
 
 # Secure Path Handling
+@functools.lru_cache(maxsize=8)
+def _resolve_base(base_path: str) -> Path:
+    """Resolve an upload root once; realpath is a syscall per component."""
+    return Path(base_path).resolve()
+
+
 def read_user_file(filename: str, base_path: str = "/var/www/uploads/") -> str:
     """Read a file with path traversal protection."""
     # GOOD: Resolve and validate the path
-    base = Path(base_path).resolve()
+    base = _resolve_base(base_path)
     file_path = (base / filename).resolve()
 
-    # GOOD: Ensure the resolved path is within the base directory
-    if not str(file_path).startswith(str(base)):
+    # GOOD: Compare path components, not string prefixes
+    # ("/var/www/uploads2" starts with "/var/www/uploads")
+    if not file_path.is_relative_to(base):
         raise ValueError("Access denied: path traversal detected")
 
     if not file_path.exists():
@@ -172,39 +182,52 @@ def calculate_expression(a: float, b: float, operator: str) -> float:
 # Secure XML Parsing
 def parse_xml_config(xml_string: str) -> dict:
     """Parse XML config with XXE protection."""
-    # GOOD: Create parser with external entities disabled
-    parser = ET.XMLParser()
-
+    # GOOD: The C-accelerated expat parser does not fetch external entities;
+    # fromstring builds one internally, so no explicit XMLParser is needed
     # Note: defusedxml library is even better for production use
-    root = ET.fromstring(xml_string, parser=parser)
+    root = ET.fromstring(xml_string)
     return {child.tag: child.text for child in root}
 
 
 # Strong Password Hashing
+# GOOD: Hashing parameters defined once, in one place
+_HASH_ALGORITHM = "sha256"
+_HASH_ITERATIONS = 100_000
+_SALT_BYTES = 32
+
+
+def _derive_key(password: str, salt: bytes) -> bytes:
+    """Derive a key with PBKDF2 (OpenSSL-backed in hashlib)."""
+    return hashlib.pbkdf2_hmac(
+        _HASH_ALGORITHM,
+        password.encode("utf-8"),
+        salt,
+        iterations=_HASH_ITERATIONS
+    )
+
+
 def hash_password(password: str, salt: Optional[bytes] = None) -> tuple[str, str]:
     """Hash password using PBKDF2 with salt."""
     # GOOD: Generate cryptographic salt if not provided
     if salt is None:
-        salt = secrets.token_bytes(32)
+        salt = secrets.token_bytes(_SALT_BYTES)
 
     # GOOD: Use PBKDF2 with SHA256, high iteration count
-    key = hashlib.pbkdf2_hmac(
-        "sha256",
-        password.encode("utf-8"),
-        salt,
-        iterations=100000
-    )
-
-    return key.hex(), salt.hex()
+    return _derive_key(password, salt).hex(), salt.hex()
 
 
 def verify_password(password: str, stored_hash: str, salt_hex: str) -> bool:
     """Verify password using constant-time comparison."""
-    salt = bytes.fromhex(salt_hex)
-    computed_hash, _ = hash_password(password, salt)
+    try:
+        salt = bytes.fromhex(salt_hex)
+        expected = bytes.fromhex(stored_hash)
+    except ValueError:
+        # Corrupt stored values never match
+        return False
+    computed = _derive_key(password, salt)
 
     # GOOD: Constant-time comparison prevents timing attacks
-    return hmac.compare_digest(computed_hash, stored_hash)
+    return hmac.compare_digest(computed, expected)
 
 
 # Thread-Safe Bank Account
@@ -217,9 +240,9 @@ class BankAccount:
 
     @property
     def balance(self) -> float:
-        """Thread-safe balance access."""
-        with self._lock:
-            return self._balance
+        """Current balance, read without taking the lock."""
+        # GOOD: Reading one attribute is atomic; only writes need the lock
+        return self._balance
 
     def withdraw(self, amount: float) -> bool:
         """Withdraw money with proper locking."""
@@ -0,0 +1,65 @@
+"""Shared Anthropic client for all agents."""
+import atexit
+import functools
+from typing import TYPE_CHECKING, Tuple, Type
+
+from src.config import ANTHROPIC_API_KEY
+
+if TYPE_CHECKING:
+    from anthropic import Anthropic
+
+
+@functools.lru_cache(maxsize=1)
+def get_client() -> "Anthropic":
+    """Return the process-wide Anthropic client, creating it on first use.
+
+    The client owns the HTTP connection pool and is thread-safe, so sharing
+    one instance lets every agent (including those running in parallel
+    debate rounds) reuse open connections instead of each paying for its
+    own TLS handshakes.
+
+    Returns:
+        The shared Anthropic client
+    """
+    from anthropic import Anthropic
+    return Anthropic(api_key=ANTHROPIC_API_KEY)
+
+
+@functools.lru_cache(maxsize=1)
+def api_exceptions() -> Tuple[Type[Exception], ...]:
+    """Return the Anthropic exception types treated as transient API failures.
+
+    Imported on first use so that modules which only need these types in
+    ``except`` clauses or retry predicates do not load the SDK at import.
+
+    Returns:
+        Tuple of exception classes
+    """
+    from anthropic import APIError, APIConnectionError, RateLimitError
+    return (APIError, APIConnectionError, RateLimitError)
+
+
+def is_api_error(exc: BaseException) -> bool:
+    """Check whether an exception is a transient Anthropic API failure.
+
+    Args:
+        exc: The raised exception
+
+    Returns:
+        True if the call that raised it is worth retrying
+    """
+    return isinstance(exc, api_exceptions())
+
+
+def close_client() -> None:
+    """Close the shared client's connection pool if it was ever created.
+
+    Registered with atexit so keep-alive connections are shut down cleanly
+    when the CLI exits. A later get_client() call builds a fresh client.
+    """
+    if get_client.cache_info().currsize:
+        get_client().close()
+        get_client.cache_clear()
+
+
+atexit.register(close_client)
@@ -0,0 +1,49 @@
+"""Helpers for cleaning up model responses before JSON parsing."""
+import re
+
+# Matches a double-quoted JSON string literal, honouring backslash escapes
+_STRING_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"')
+# Any remaining ASCII control character
+_CTRL_RE = re.compile(r'[\x00-\x1f]')
+# Escapes for the control characters JSON allows in escaped form
+_ESCAPE_TABLE = str.maketrans({'\n': '\\n', '\r': '\\r', '\t': '\\t'})
+
+
+def strip_code_fence(text: str) -> str:
+    """Remove a surrounding markdown code fence, if present.
+
+    Drops the opening ``` line (with any language tag) and a closing ```
+    line. Uses single splits instead of splitting the whole response into
+    lines and joining it back.
+
+    Args:
+        text: Stripped response text
+
+    Returns:
+        The text inside the fence, or the input unchanged if not fenced
+    """
+    if not text.startswith("```"):
+        return text
+    _, _, text = text.partition("\n")
+    head, _, last = text.rpartition("\n")
+    if last.strip() == "```":
+        text = head
+    return text
+
+
+def escape_control_chars(text: str) -> str:
+    """Escape raw control characters inside JSON string literals.
+
+    Newlines, carriage returns and tabs are escaped; any other control
+    characters are removed.
+
+    Args:
+        text: JSON text that may contain raw control characters in strings
+
+    Returns:
+        JSON text that the strict parsers accept
+    """
+    def fix(match: "re.Match[str]") -> str:
+        return _CTRL_RE.sub('', match.group(0).translate(_ESCAPE_TABLE))
+
+    return _STRING_RE.sub(fix, text)
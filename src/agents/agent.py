@@ -4,10 +4,11 @@ import time
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, List, Tuple
 
-from anthropic import Anthropic, APIError, APIConnectionError, RateLimitError
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception
 
-from src.config import ANTHROPIC_API_KEY, DEFAULT_MODEL, MAX_TOKENS
+from src.config import DEFAULT_MODEL, MAX_TOKENS
+from src.agents._client import get_client, is_api_error
+from src.agents._parsing import escape_control_chars, strip_code_fence
 from src.agents.personas import Persona
 from src.models.review import VoteDecision
 from src.languages import LanguageInfo, get_language_prompt_hints, GENERIC
@@ -54,7 +55,7 @@ class Agent:
             session_id: Optional session ID for metrics tracking
         """
         self.persona = persona
-        self.client = Anthropic(api_key=ANTHROPIC_API_KEY)
+        self.client = get_client()
         self.model = DEFAULT_MODEL
         self.max_tokens = MAX_TOKENS
         self.session_id = session_id or ""
@@ -137,7 +138,7 @@ IMPORTANT: Respond ONLY with valid JSON. No markdown, no explanation outside the
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((APIError, APIConnectionError, RateLimitError)),
+        retry=retry_if_exception(is_api_error),
         reraise=True
     )
     def _call_api(self, system_prompt: str, user_message: str, operation: str = "review") -> str:
@@ -272,34 +273,12 @@ IMPORTANT: Respond ONLY with valid JSON. No markdown, no explanation outside the
         Returns:
             Parsed JSON dictionary
         """
-        text = response.strip()
-
         # Handle markdown code blocks
-        if text.startswith("```"):
-            lines = text.split("\n")
-            # Remove first line (```json or ```)
-            lines = lines[1:]
-            # Remove last line (```)
-            if lines and lines[-1].strip() == "```":
-                lines = lines[:-1]
-            text = "\n".join(lines)
+        text = strip_code_fence(response.strip())
 
         # Fix control characters inside JSON strings
         # Replace actual newlines/tabs inside strings with escaped versions
-        import re
-
-        def fix_control_chars(match):
-            """Escape control characters inside JSON string values."""
-            s = match.group(0)
-            s = s.replace('\n', '\\n')
-            s = s.replace('\r', '\\r')
-            s = s.replace('\t', '\\t')
-            # Remove other control characters
-            s = re.sub(r'[\x00-\x1f]', '', s)
-            return s
-
-        # Match JSON string values and fix control chars within them
-        text = re.sub(r'"[^"\\]*(?:\\.[^"\\]*)*"', fix_control_chars, text)
+        text = escape_control_chars(text)
 
         return json.loads(text)
 
@@ -442,7 +421,7 @@ class CodeFixer:
     """Fixes code based on consensus review feedback."""
 
     def __init__(self, session_id: Optional[str] = None):
-        self.client = Anthropic(api_key=ANTHROPIC_API_KEY)
+        self.client = get_client()
         self.model = DEFAULT_MODEL
         self.max_tokens = 4096  # More tokens for code output
         self.session_id = session_id or ""
@@ -519,24 +498,11 @@ Rules:
                 operation="fix",
             )
 
-        text = response.content[0].text.strip()
-
         # Handle markdown code blocks
-        if text.startswith("```"):
-            lines = text.split("\n")
-            lines = lines[1:]
-            if lines and lines[-1].strip() == "```":
-                lines = lines[:-1]
-            text = "\n".join(lines)
+        text = strip_code_fence(response.content[0].text.strip())
 
         # Fix control characters
-        import re
-        def fix_ctrl(m):
-            s = m.group(0)
-            s = s.replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t')
-            s = re.sub(r'[\x00-\x1f]', '', s)
-            return s
-        text = re.sub(r'"[^"\\]*(?:\\.[^"\\]*)*"', fix_ctrl, text)
+        text = escape_control_chars(text)
 
         data = json.loads(text)
 
@@ -1,17 +1,40 @@
 """Expert persona definitions for the Consensys code review system."""
+import sys
 from dataclasses import dataclass, field
 from typing import List
 
 
-@dataclass
+@dataclass(frozen=True)
 class Persona:
-    """Defines an expert reviewer persona with distinct personality and focus areas."""
+    """Defines an expert reviewer persona with distinct personality and focus areas.
+
+    Personas are immutable and slotted: they are built once at import time
+    and their fields are read on every API call.
+    """
+    # Declared explicitly rather than via dataclass(slots=True) to keep 3.9 support
+    __slots__ = ("name", "role", "system_prompt", "priorities", "review_style")
+
     name: str
     role: str
     system_prompt: str
     priorities: List[str]
     review_style: str
 
+    def __post_init__(self) -> None:
+        # Names key PERSONAS_BY_NAME and friends; interning makes those
+        # lookups hit on identity. Bypass the frozen __setattr__.
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "role", sys.intern(self.role))
+
+    # The default slot-state restore used by copy and pickle goes through the
+    # frozen __setattr__, so state is saved and restored explicitly.
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
 
 # Security Expert - Focuses on vulnerabilities and secure coding practices
 SecurityExpert = Persona(
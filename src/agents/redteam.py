@@ -1,27 +1,58 @@
 """RedTeam agent for exploit generation and security testing."""
 import json
+import sys
 import time
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Callable, Tuple
 
-from anthropic import Anthropic, APIError, APIConnectionError, RateLimitError
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-
-from src.config import ANTHROPIC_API_KEY, DEFAULT_MODEL, MAX_TOKENS
+from src.config import DEFAULT_MODEL, MAX_TOKENS
+from src.agents._client import get_client, is_api_error
+from src.agents._parsing import escape_control_chars, strip_code_fence
 from src.agents.personas import Persona
 
+if TYPE_CHECKING:
+    from anthropic import Anthropic
+
+# Try to import orjson for faster parsing, fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON text with orjson when available, else the stdlib parser.
+
+    Raises:
+        ValueError: If the text is not valid JSON (both parsers' decode
+            errors subclass ValueError)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters get plain dataclasses
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_POC_WARNING = (
+    "[PoC ONLY] This exploit is for demonstration and authorized security testing only. "
+    "Do not use against systems without explicit permission."
+)
 
 # Supported vulnerability types
-VULNERABILITY_TYPES = [
+VULNERABILITY_TYPES = frozenset({
     "sql_injection",
     "xss",
     "command_injection",
     "path_traversal",
     "auth_bypass",
-]
+})
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ExploitResult:
     """Result of exploit generation for a vulnerability.
 
@@ -40,7 +71,7 @@ class ExploitResult:
     curl_command: str
     explanation: str
     success_indicators: List[str] = field(default_factory=list)
-    poc_warning: str = field(default="[PoC ONLY] This exploit is for demonstration and authorized security testing only. Do not use against systems without explicit permission.")
+    poc_warning: str = _POC_WARNING
 
 
 @dataclass
@@ -100,6 +131,75 @@ When generating exploits, be specific and practical. Real exploits that demonstr
 )
 
 
+# Vulnerability-specific guidance appended to the exploit system prompt
+_VULN_INSTRUCTIONS: Dict[str, str] = {
+    "sql_injection": """
+For SQL Injection, create:
+- A payload that extracts data (SELECT) or modifies data (UPDATE/DELETE)
+- Show how to bypass authentication or extract sensitive data
+- Include both error-based and blind injection techniques if applicable""",
+
+    "xss": """
+For XSS (Cross-Site Scripting), create:
+- A payload that executes JavaScript in the victim's browser
+- Show cookie theft, DOM manipulation, or phishing scenarios
+- Include both reflected and stored XSS payloads if applicable""",
+
+    "command_injection": """
+For Command Injection, create:
+- A payload that executes arbitrary shell commands
+- Show command chaining techniques (;, |, &&, ||, backticks)
+- Include payloads for different OS targets if applicable""",
+
+    "path_traversal": """
+For Path Traversal, create:
+- A payload that accesses files outside the intended directory
+- Show techniques to read sensitive files (/etc/passwd, config files)
+- Include URL encoding and null byte techniques if applicable""",
+
+    "auth_bypass": """
+For Authentication Bypass, create:
+- A technique to bypass login or access controls
+- Show JWT manipulation, session fixation, or logic flaws
+- Include default credentials or predictable tokens if applicable"""
+}
+
+
+def _format_exploit_prompt(persona_prompt: str, vulnerability_type: str) -> str:
+    """Build the system prompt for exploit generation.
+
+    Args:
+        persona_prompt: The persona's base system prompt
+        vulnerability_type: The type of vulnerability to exploit
+
+    Returns:
+        Complete system prompt string
+    """
+    specific = _VULN_INSTRUCTIONS.get(vulnerability_type, "")
+
+    return f"""{persona_prompt}
+
+{specific}
+
+IMPORTANT: Respond ONLY with valid JSON in this exact format:
+{{
+    "exploit_code": "The complete exploit code or script",
+    "payload": "The specific malicious payload",
+    "curl_command": "A curl command to test (or 'N/A' if not applicable)",
+    "explanation": "Detailed explanation of how this exploit works",
+    "success_indicators": ["indicator1", "indicator2"]
+}}
+
+Mark all code as [PoC] proof-of-concept. This is for authorized security testing only."""
+
+
+# Fully formatted exploit prompts, built once at import (only a handful of types)
+_EXPLOIT_PROMPTS: Dict[str, str] = {
+    vuln: _format_exploit_prompt(RedTeamPersona.system_prompt, vuln)
+    for vuln in _VULN_INSTRUCTIONS
+}
+
+
 class RedTeamAgent:
     """Agent that generates proof-of-concept exploits for identified vulnerabilities.
 
@@ -115,20 +215,55 @@ class RedTeamAgent:
             session_id: Optional session ID for tracking
         """
         self.persona = RedTeamPersona
-        self.client = Anthropic(api_key=ANTHROPIC_API_KEY)
         self.model = DEFAULT_MODEL
         self.max_tokens = MAX_TOKENS
         self.session_id = session_id or ""
+        # The anthropic SDK and tenacity are imported on first API use
+        self._client: Optional["Anthropic"] = None
+        self._retry_call: Optional[Callable[[str, str], str]] = None
+
+    @property
+    def client(self) -> "Anthropic":
+        """Anthropic client; the shared process-wide client unless overridden."""
+        if self._client is None:
+            self._client = get_client()
+        return self._client
+
+    @client.setter
+    def client(self, value: "Anthropic") -> None:
+        self._client = value
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((APIError, APIConnectionError, RateLimitError)),
-        reraise=True
-    )
     def _call_api(self, system_prompt: str, user_message: str) -> str:
         """Make a Claude API call with retry logic.
 
+        The retrying wrapper is built on first call so that importing this
+        module does not load tenacity.
+
+        Args:
+            system_prompt: The system prompt to use
+            user_message: The user message/query
+
+        Returns:
+            The assistant's response text
+        """
+        if self._retry_call is None:
+            from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception
+
+            self._retry_call = retry(
+                stop=stop_after_attempt(3),
+                wait=wait_exponential(multiplier=1, min=2, max=10),
+                retry=retry_if_exception(is_api_error),
+                reraise=True
+            )(self._raw_call)
+        return self._retry_call(system_prompt, user_message)
+
+    def _raw_call(self, system_prompt: str, user_message: str) -> str:
+        """Make a single streaming Claude API call without retries.
+
+        Exploit and patch responses are long; streaming lets the chunks be
+        collected while the rest of the response is still being generated
+        instead of blocking on one large body.
+
         Args:
             system_prompt: The system prompt to use
             user_message: The user message/query
@@ -136,15 +271,18 @@ class RedTeamAgent:
         Returns:
             The assistant's response text
         """
-        response = self.client.messages.create(
+        chunks: List[str] = []
+        with self.client.messages.stream(
             model=self.model,
             max_tokens=self.max_tokens,
             system=system_prompt,
             messages=[
                 {"role": "user", "content": user_message}
             ]
-        )
-        return response.content[0].text
+        ) as stream:
+            for text in stream.text_stream:
+                chunks.append(text)
+        return "".join(chunks)
 
     def _parse_json_response(self, response: str) -> Dict[str, Any]:
         """Parse JSON from API response, handling markdown code blocks.
@@ -155,29 +293,17 @@ class RedTeamAgent:
         Returns:
             Parsed JSON dictionary
         """
-        import re
-        text = response.strip()
-
         # Handle markdown code blocks
-        if text.startswith("```"):
-            lines = text.split("\n")
-            lines = lines[1:]
-            if lines and lines[-1].strip() == "```":
-                lines = lines[:-1]
-            text = "\n".join(lines)
+        text = strip_code_fence(response.strip())
 
-        # Fix control characters inside JSON strings
-        def fix_control_chars(match):
-            s = match.group(0)
-            s = s.replace('\n', '\\n')
-            s = s.replace('\r', '\\r')
-            s = s.replace('\t', '\\t')
-            s = re.sub(r'[\x00-\x1f]', '', s)
-            return s
-
-        text = re.sub(r'"[^"\\]*(?:\\.[^"\\]*)*"', fix_control_chars, text)
+        # Fast path: most responses are already valid JSON
+        try:
+            return _loads(text)
+        except ValueError:
+            pass
 
-        return json.loads(text)
+        # Fix control characters inside JSON strings
+        return _loads(escape_control_chars(text))
 
     def _build_exploit_prompt(self, vulnerability_type: str) -> str:
         """Build the system prompt for exploit generation.
@@ -188,55 +314,10 @@ class RedTeamAgent:
         Returns:
             Complete system prompt string
         """
-        vuln_instructions = {
-            "sql_injection": """
-For SQL Injection, create:
-- A payload that extracts data (SELECT) or modifies data (UPDATE/DELETE)
-- Show how to bypass authentication or extract sensitive data
-- Include both error-based and blind injection techniques if applicable""",
-
-            "xss": """
-For XSS (Cross-Site Scripting), create:
-- A payload that executes JavaScript in the victim's browser
-- Show cookie theft, DOM manipulation, or phishing scenarios
-- Include both reflected and stored XSS payloads if applicable""",
-
-            "command_injection": """
-For Command Injection, create:
-- A payload that executes arbitrary shell commands
-- Show command chaining techniques (;, |, &&, ||, backticks)
-- Include payloads for different OS targets if applicable""",
-
-            "path_traversal": """
-For Path Traversal, create:
-- A payload that accesses files outside the intended directory
-- Show techniques to read sensitive files (/etc/passwd, config files)
-- Include URL encoding and null byte techniques if applicable""",
-
-            "auth_bypass": """
-For Authentication Bypass, create:
-- A technique to bypass login or access controls
-- Show JWT manipulation, session fixation, or logic flaws
-- Include default credentials or predictable tokens if applicable"""
-        }
-
-        base = self.persona.system_prompt
-        specific = vuln_instructions.get(vulnerability_type, "")
-
-        return f"""{base}
-
-{specific}
-
-IMPORTANT: Respond ONLY with valid JSON in this exact format:
-{{
-    "exploit_code": "The complete exploit code or script",
-    "payload": "The specific malicious payload",
-    "curl_command": "A curl command to test (or 'N/A' if not applicable)",
-    "explanation": "Detailed explanation of how this exploit works",
-    "success_indicators": ["indicator1", "indicator2"]
-}}
-
-Mark all code as [PoC] proof-of-concept. This is for authorized security testing only."""
+        prompt = _EXPLOIT_PROMPTS.get(vulnerability_type)
+        if prompt is None or self.persona is not RedTeamPersona:
+            prompt = _format_exploit_prompt(self.persona.system_prompt, vulnerability_type)
+        return prompt
 
     def generate_exploit(
         self,
@@ -267,7 +348,7 @@ Mark all code as [PoC] proof-of-concept. This is for authorized security testing
         if vuln_lower not in VULNERABILITY_TYPES:
             raise ValueError(
                 f"Unsupported vulnerability type: {vulnerability}. "
-                f"Supported types: {', '.join(VULNERABILITY_TYPES)}"
+                f"Supported types: {', '.join(sorted(VULNERABILITY_TYPES))}"
             )
 
         system_prompt = self._build_exploit_prompt(vuln_lower)
@@ -299,7 +380,6 @@ This is for authorized penetration testing and security education only."""
             curl_command=data.get("curl_command", "N/A"),
             explanation=data.get("explanation", ""),
             success_indicators=data.get("success_indicators", []),
-            poc_warning="[PoC ONLY] This exploit is for demonstration and authorized security testing only. Do not use against systems without explicit permission."
         )
 
     def _build_patch_prompt(self, vulnerability_type: str) -> str:
@@ -433,5 +513,32 @@ Generate a secure patch that:
             before_after=data.get("before_after", ""),
         )
 
+    def analyze(
+        self,
+        code: str,
+        vulnerability: str,
+        context: Optional[str] = None
+    ) -> Tuple[ExploitResult, PatchResult]:
+        """Generate an exploit and the matching patch for one vulnerability.
+
+        Each vulnerability type is independent, so callers can run several
+        of these concurrently on a thread pool; the shared client is
+        thread-safe and the work is dominated by network I/O.
+
+        Args:
+            code: The vulnerable code to analyze
+            vulnerability: Type of vulnerability to exploit and patch
+            context: Optional context about the code
+
+        Returns:
+            Tuple of (ExploitResult, PatchResult)
+
+        Raises:
+            ValueError: If vulnerability type is not supported
+        """
+        exploit = self.generate_exploit(code=code, vulnerability=vulnerability, context=context)
+        patch = self.generate_patch(code=code, exploit=exploit, context=context)
+        return exploit, patch
+
     def __repr__(self) -> str:
         return f"RedTeamAgent(persona={self.persona.name})"
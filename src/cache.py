@@ -83,6 +83,14 @@ class ReviewCache:
                 CREATE INDEX IF NOT EXISTS idx_review_cache_lookup
                 ON review_cache(code_hash, persona)
             """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS fix_cache (
+                    fix_hash TEXT PRIMARY KEY,
+                    result_json TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    expires_at TEXT NOT NULL
+                )
+            """)
             conn.commit()
         finally:
             conn.close()
@@ -218,6 +226,75 @@ class ReviewCache:
         finally:
             conn.close()
 
+    @staticmethod
+    def hash_fix_request(
+        code: str,
+        issues: List[Dict[str, Any]],
+        suggestions: List[str],
+        context: Optional[str] = None
+    ) -> str:
+        """Generate a hash for everything a code fix is generated from.
+
+        Args:
+            code: The code to fix
+            issues: Issues the fix should address
+            suggestions: Suggestions the fix should apply
+            context: Optional context for the fix
+
+        Returns:
+            SHA256 hash string
+        """
+        content = json.dumps([code, context, issues, suggestions], sort_keys=True)
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get_fix(self, fix_hash: str) -> Optional[Dict[str, Any]]:
+        """Get a cached code fix if it exists and is not expired.
+
+        Args:
+            fix_hash: Hash from hash_fix_request
+
+        Returns:
+            The cached fix fields, or None if not found or expired
+        """
+        conn = self._get_connection()
+        try:
+            row = conn.execute(
+                "SELECT result_json, expires_at FROM fix_cache WHERE fix_hash = ?",
+                (fix_hash,)
+            ).fetchone()
+            if not row:
+                return None
+            if datetime.now() > datetime.fromisoformat(row["expires_at"]):
+                conn.execute("DELETE FROM fix_cache WHERE fix_hash = ?", (fix_hash,))
+                conn.commit()
+                return None
+            return json.loads(row["result_json"])
+        finally:
+            conn.close()
+
+    def set_fix(self, fix_hash: str, result: Dict[str, Any], ttl_seconds: Optional[int] = None):
+        """Cache a code fix.
+
+        Args:
+            fix_hash: Hash from hash_fix_request
+            result: JSON-serializable fix fields
+            ttl_seconds: Optional custom TTL, uses default if not provided
+        """
+        now = datetime.now()
+        expires_at = now + timedelta(seconds=ttl_seconds or self.ttl_seconds)
+        conn = self._get_connection()
+        try:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO fix_cache (fix_hash, result_json, created_at, expires_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (fix_hash, json.dumps(result), now.isoformat(), expires_at.isoformat())
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
     def invalidate(self, code_hash: str, persona: Optional[str] = None):
         """Invalidate cached reviews.
 
@@ -257,6 +334,8 @@ class ReviewCache:
                 (now,)
             )
             count = cursor.rowcount
+            cursor.execute("DELETE FROM fix_cache WHERE expires_at < ?", (now,))
+            count += cursor.rowcount
             conn.commit()
             return count
         finally:
@@ -273,6 +352,8 @@ class ReviewCache:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM review_cache")
             count = cursor.rowcount
+            cursor.execute("DELETE FROM fix_cache")
+            count += cursor.rowcount
             conn.commit()
             return count
         finally:
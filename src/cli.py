@@ -1,32 +1,37 @@
 """CLI interface for Consensys multi-agent code review."""
+import dataclasses
+import functools
+import importlib
+import json
+import os
+import shutil
 import sys
+import tempfile
+from datetime import datetime
+from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import click
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
+from rich.rule import Rule
+from rich.style import Style
 from rich.table import Table
-from rich.syntax import Syntax
 from rich.text import Text
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from src import __version__
-from src.orchestrator.debate import DebateOrchestrator
-from src.db.storage import Storage
-from src.models.review import VoteDecision, Severity
+from src.models.review import Consensus, Severity
+from src.display import AGREEMENT_COLORS, DECISION_COLORS, SEVERITY_COLORS
 from src.git.helpers import (
-    is_git_repo,
-    get_repo_root,
+    get_repo_info,
     get_uncommitted_changes,
     get_staged_changes,
     get_pr_info,
     post_pr_comment,
-    get_current_branch,
     extract_diff_context,
     DiffContext,
 )
-from src.export.exporter import DebateExporter
 from src.personas.custom import (
     load_custom_personas,
     save_custom_persona,
@@ -44,13 +49,274 @@ from src.personas.teams import (
 from src.agents.personas import Persona
 from src.languages import detect_language, get_syntax_highlight_language, SUPPORTED_LANGUAGES, EXTENSION_MAP
 
+if TYPE_CHECKING:
+    from pygments.lexer import Lexer
+    from src.db.storage import Storage
+    from src.orchestrator.debate import DebateOrchestrator
+    from src.export.exporter import DebateExporter
+
+# Heavy command dependencies -> (module, attribute), imported on first use so
+# that --help, history and other commands that never touch them start quickly
+_LAZY_IMPORTS: Dict[str, Tuple[str, str]] = {
+    "Storage": ("src.db.storage", "Storage"),
+    "DebateOrchestrator": ("src.orchestrator.debate", "DebateOrchestrator"),
+    "DebateExporter": ("src.export.exporter", "DebateExporter"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve a lazily imported module attribute on first access.
+
+    The value is cached in the module globals, which is also where tests
+    patch it, so later lookups see the cached (or patched) object.
+
+    Args:
+        name: Attribute name being looked up
+
+    Returns:
+        The attribute from its defining module
+
+    Raises:
+        AttributeError: If the name is not a lazy import
+    """
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def _lazy(name: str) -> Any:
+    """Get a lazily imported name from inside this module.
+
+    Function bodies cannot rely on module ``__getattr__`` for bare global
+    names, so command code goes through this helper instead.
+
+    Args:
+        name: Key of _LAZY_IMPORTS
+
+    Returns:
+        The imported (or patched) attribute
+    """
+    return globals()[name] if name in globals() else __getattr__(name)
+
 
 console = Console()
 
 
+@functools.lru_cache(maxsize=None)
+def _get_lexer(name: str) -> "Lexer":
+    """Get a shared Pygments lexer instance for a language.
+
+    Rich resolves a lexer by name on every ``Syntax`` construction; caching
+    the instance lets the code, fixed-code and replay panels reuse it.
+
+    Args:
+        name: Pygments lexer alias (e.g. "python")
+
+    Returns:
+        The lexer, or a plain-text lexer if the alias is unknown
+    """
+    from pygments.lexers import get_lexer_by_name
+    from pygments.util import ClassNotFound
+
+    try:
+        return get_lexer_by_name(name)
+    except ClassNotFound:
+        return get_lexer_by_name("text")
+
+
+def _display_lexer(name: str) -> "Lexer":
+    """Get the lexer for displaying code on the CLI console.
+
+    Piped or redirected output carries no colors, so there the code is
+    tokenized as plain text and the Pygments lexing pass is skipped; the
+    panel layout and line numbers stay the same.
+
+    Args:
+        name: Pygments lexer alias used on a terminal
+
+    Returns:
+        The language's lexer on a terminal, otherwise the plain-text lexer
+    """
+    return _get_lexer(name if console.is_terminal else "text")
+
+
+# Code longer than this is displayed as head + tail (it is still reviewed in full)
+CODE_PREVIEW_MAX_CHARS = 200_000
+CODE_PREVIEW_HEAD_CHARS = 100_000
+CODE_PREVIEW_TAIL_CHARS = 50_000
+
+
+def _code_panel(code: str, language: str, title: str, border_style: str) -> Panel:
+    """Build a syntax-highlighted, line-numbered code panel.
+
+    Code over ``CODE_PREVIEW_MAX_CHARS`` is shown as roughly its first
+    ``CODE_PREVIEW_HEAD_CHARS`` and last ``CODE_PREVIEW_TAIL_CHARS``
+    characters, cut at line boundaries where there are any, so Pygments
+    never lexes megabytes.
+
+    Args:
+        code: Source code to render
+        language: Pygments lexer alias for highlighting
+        title: Panel title (may contain markup)
+        border_style: Rich style for the panel border
+
+    Returns:
+        Panel wrapping the highlighted code
+    """
+    from rich.syntax import Syntax
+
+    lexer = _display_lexer(language)
+    if len(code) <= CODE_PREVIEW_MAX_CHARS:
+        body: RenderableType = Syntax(code, lexer, theme="monokai", line_numbers=True)
+    else:
+        head_end = code.rfind("\n", 0, CODE_PREVIEW_HEAD_CHARS) + 1 or CODE_PREVIEW_HEAD_CHARS
+        # Without a newline in the tail window (minified code), cut mid-line
+        tail_begin = (
+            code.find("\n", len(code) - CODE_PREVIEW_TAIL_CHARS) + 1
+            or len(code) - CODE_PREVIEW_TAIL_CHARS
+        )
+        tail_start_line = code.count("\n", 0, tail_begin) + 1
+        omitted = tail_start_line - code.count("\n", 0, head_end) - 1
+        if omitted > 0:
+            marker = f"... {omitted} lines not shown ..."
+        else:
+            marker = f"... {tail_begin - head_end} characters not shown ..."
+        body = Group(
+            Syntax(code[:head_end].rstrip("\n"), lexer, theme="monokai", line_numbers=True),
+            Text(marker, style="dim italic", justify="center"),
+            Syntax(code[tail_begin:], lexer, theme="monokai",
+                   line_numbers=True, start_line=tail_start_line),
+        )
+    return Panel(body, title=title, border_style=border_style)
+
+
+# Diffs longer than this are previewed as head + tail instead of in full
+DIFF_PREVIEW_MAX_LINES = 500
+DIFF_PREVIEW_EDGE_LINES = 200
+# Longer diff lines (minified or generated code) are clipped in the preview
+DIFF_PREVIEW_MAX_LINE_CHARS = 1_000
+
+
+def _diff_syntax(diff: str, line_numbers: bool = True) -> RenderableType:
+    """Build a highlighted diff preview with bounded lexing work.
+
+    Huge diffs are previewed as their first and last
+    ``DIFF_PREVIEW_EDGE_LINES`` lines, and lines over
+    ``DIFF_PREVIEW_MAX_LINE_CHARS`` are clipped, so Pygments never lexes
+    the whole diff; line numbers still refer to the full diff. The full
+    diff is what gets reviewed either way.
+
+    Args:
+        diff: Unified diff text
+        line_numbers: Whether to show line numbers
+
+    Returns:
+        Syntax renderable, or a group of head, marker and tail
+    """
+    from rich.syntax import Syntax
+
+    lexer = _display_lexer("diff")
+    lines = [
+        line if len(line) <= DIFF_PREVIEW_MAX_LINE_CHARS
+        else line[:DIFF_PREVIEW_MAX_LINE_CHARS] + " ..."
+        for line in (diff or "(no diff)").splitlines()
+    ]
+    if len(lines) <= DIFF_PREVIEW_MAX_LINES:
+        return Syntax("\n".join(lines), lexer, theme="monokai", line_numbers=line_numbers)
+    tail_start = len(lines) - DIFF_PREVIEW_EDGE_LINES
+    omitted = tail_start - DIFF_PREVIEW_EDGE_LINES
+    return Group(
+        Syntax("\n".join(lines[:DIFF_PREVIEW_EDGE_LINES]), lexer,
+               theme="monokai", line_numbers=line_numbers),
+        Text(f"... {omitted} lines omitted ...", style="dim italic", justify="center"),
+        Syntax("\n".join(lines[tail_start:]), lexer, theme="monokai",
+               line_numbers=line_numbers, start_line=tail_start + 1),
+    )
+
+
+def _diff_panel(path: str, diff: str) -> Panel:
+    """Build the diff preview panel for a changed file.
+
+    Args:
+        path: File path shown in the panel title
+        diff: Unified diff text
+
+    Returns:
+        Panel wrapping the highlighted (possibly truncated) diff
+    """
+    return Panel(_diff_syntax(diff), title=f"[bold]Diff: {path}[/bold]", border_style="cyan")
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert stored models to JSON-serializable values.
+
+    Args:
+        obj: Object the JSON encoder could not serialize
+
+    Returns:
+        A serializable equivalent (dict, enum value or ISO timestamp)
+
+    Raises:
+        TypeError: If the object type is not supported
+    """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+@functools.lru_cache(maxsize=None)
+def _orjson() -> Any:
+    """Import orjson on first --json use for faster output.
+
+    Returns:
+        The orjson module, or None if it is not installed (stdlib json is used)
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _echo_json(data: Any) -> None:
+    """Write data to stdout as indented JSON, bypassing Rich rendering.
+
+    Args:
+        data: Sessions, models or plain containers to serialize
+    """
+    orjson = _orjson()
+    if orjson is not None:
+        click.echo(orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2))
+    else:
+        click.echo(json.dumps(data, default=_json_default, indent=2))
+
+
 # Severity ordering for comparison (higher number = more severe)
 SEVERITY_ORDER = {"LOW": 1, "MEDIUM": 2, "HIGH": 3, "CRITICAL": 4}
 
+# Display colors for metrics output; the severity, decision and agreement
+# colors shared with the orchestrator live in src.display
+OPERATION_COLORS = {"review": "green", "respond": "yellow", "vote": "blue", "fix": "magenta"}
+
+# Pre-rendered markup for the known values, so table rows are a dict lookup
+SEVERITY_MARKUP = {value: f"[{color}]{value}[/{color}]" for value, color in SEVERITY_COLORS.items()}
+DECISION_MARKUP = {value: f"[{color}]{value}[/{color}]" for value, color in DECISION_COLORS.items()}
+AGREEMENT_MARKUP = {value: f"[{color}]{value}[/{color}]" for value, color in AGREEMENT_COLORS.items()}
+
+# Shared Style instances for Text cells, so replay never re-parses style strings
+SEVERITY_STYLES = {value: Style(color=color) for value, color in SEVERITY_COLORS.items()}
+DECISION_STYLES = {value: Style(color=color) for value, color in DECISION_COLORS.items()}
+AGREEMENT_STYLES = {value: Style(color=color) for value, color in AGREEMENT_COLORS.items()}
+UNKNOWN_STATUS_STYLE = Style(color="blue")
+
 
 def severity_meets_threshold(issue_severity: str, threshold: str) -> bool:
     """Check if an issue's severity meets or exceeds a threshold.
@@ -83,6 +349,73 @@ def filter_issues_by_severity(issues: list, min_severity: str) -> list:
     ]
 
 
+# Files larger than this are reviewed from their first SOURCE_MAX_BYTES only;
+# the rest would overflow the model's context window anyway
+SOURCE_MAX_BYTES = 1_000_000
+
+
+def _read_source(path: Path, max_bytes: Optional[int] = None) -> str:
+    """Read a source file as UTF-8 text in a single decode pass.
+
+    Unlike read_text(), this does not depend on the locale encoding and
+    skips universal-newline translation unless the file contains CR
+    characters. Undecodable bytes are replaced rather than raising.
+
+    Args:
+        path: File to read
+        max_bytes: If set, read at most this many bytes, cut back to the
+            last complete line
+
+    Returns:
+        The file contents with line endings normalized to LF
+    """
+    if max_bytes is None:
+        data = path.read_bytes()
+    else:
+        with open(path, "rb") as f:
+            data = f.read(max_bytes + 1)
+        if len(data) > max_bytes:
+            data = data[:max_bytes]
+            cut = data.rfind(b"\n")
+            if cut >= 0:
+                data = data[:cut + 1]
+    text = data.decode("utf-8", errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    """Write text as UTF-8 so that readers see either the old or new file.
+
+    The content goes to a uniquely named sibling temp file that then
+    replaces the target, so a crash mid-write cannot leave a truncated file
+    behind - important when --fix overwrites the source it reviewed - and
+    concurrent writers never share a temp file. An existing file's
+    permission bits are kept.
+
+    Args:
+        path: File to create or overwrite
+        text: Content to write
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(text.encode("utf-8"))
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        else:
+            # mkstemp creates the file 0600; give a new file the usual mode
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def validate_file_path(file_path: Path, base_dir: Optional[Path] = None) -> Path:
     """Validate a file path to prevent path traversal attacks.
 
@@ -171,7 +504,7 @@ def cli():
 
 
 @cli.command()
-@click.argument("file", required=False, type=click.Path(exists=True))
+@click.argument("file", required=False, type=click.Path(exists=True, path_type=Path))
 @click.option("--code", "-c", help="Review inline code snippet instead of a file")
 @click.option("--context", "-x", help="Additional context about the code")
 @click.option("--fix", "-f", is_flag=True, help="Auto-fix code based on Consensys feedback")
@@ -188,7 +521,8 @@ def cli():
 @click.option("--redteam", is_flag=True, help="Enable RedTeam mode: generate exploits and auto-patches for vulnerabilities")
 @click.option("--predict", is_flag=True, help="Enable prediction market: agents place bets on code quality outcomes")
 @click.option("--dna", is_flag=True, help="Compare code against codebase DNA fingerprint to detect style anomalies")
-def review(file: Optional[str], code: Optional[str], context: Optional[str], fix: bool, output: Optional[str], stream: bool, debate: bool, quick: bool, no_cache: bool, min_severity: Optional[str], fail_on: Optional[str], diff_only: bool, redteam: bool, predict: bool, dna: bool):
+@click.option("--early-exit", is_flag=True, help="Skip debate/voting when Round 1 reviews already reach a majority")
+def review(file: Optional[Path], code: Optional[str], context: Optional[str], fix: bool, output: Optional[str], stream: bool, debate: bool, quick: bool, no_cache: bool, min_severity: Optional[str], fail_on: Optional[str], diff_only: bool, redteam: bool, predict: bool, dna: bool, early_exit: bool):
     """Run a full debate review on code.
 
     Review a file:
@@ -228,12 +562,15 @@ def review(file: Optional[str], code: Optional[str], context: Optional[str], fix
 
     DNA analysis (compare against codebase style):
         consensys review file.py --dna
+
+    Stop after Round 1 when reviewers already agree:
+        consensys review file.py --early-exit
     """
     # Get code from file or --code option
     diff_context_info: Optional[DiffContext] = None
 
     if file:
-        file_path = Path(file)
+        file_path = file
         # Validate path to prevent traversal attacks
         try:
             validated_path = validate_file_path(file_path)
@@ -242,7 +579,19 @@ def review(file: Optional[str], code: Optional[str], context: Optional[str], fix
             sys.exit(1)
 
         try:
-            code_content = validated_path.read_text()
+            if validated_path.stat().st_size > SOURCE_MAX_BYTES:
+                # Fixed code would hold only the sampled prefix, so writing it
+                # anywhere (let alone over the original) would drop the rest
+                if fix or output:
+                    raise click.UsageError(
+                        f"{file} is larger than {SOURCE_MAX_BYTES // 1_000_000} MB and would be "
+                        "reviewed from its first part only; --fix/--output are not supported for it"
+                    )
+                console.print(
+                    f"[yellow]Large file - reviewing the first "
+                    f"{SOURCE_MAX_BYTES // 1_000_000} MB only[/yellow]"
+                )
+            code_content = _read_source(validated_path, max_bytes=SOURCE_MAX_BYTES)
         except (IOError, OSError, PermissionError) as e:
             console.print(f"[red]Error reading file: {e}[/red]")
             sys.exit(1)
@@ -250,42 +599,39 @@ def review(file: Optional[str], code: Optional[str], context: Optional[str], fix
 
         # Handle --diff-only mode
         if diff_only:
-            if not is_git_repo():
+            repo = get_repo_info()
+            if repo is None:
                 console.print("[red]Error: --diff-only requires a git repository[/red]")
                 console.print("[dim]Initialize with: git init[/dim]")
                 sys.exit(1)
 
             # Get the diff context for this file
-            repo_root = get_repo_root()
-            if repo_root:
-                # Convert to relative path from repo root
-                try:
-                    rel_path = file_path.resolve().relative_to(Path(repo_root).resolve())
-                except ValueError:
-                    rel_path = file_path
-
-                diff_context_info = extract_diff_context(str(rel_path), context_lines=5, path=repo_root)
-
-                if not diff_context_info:
-                    console.print(f"[yellow]No changes detected in {file_path.name} vs HEAD[/yellow]")
-                    console.print("[dim]The file has no uncommitted changes to review.[/dim]")
-                    console.print("[dim]Use without --diff-only to review the entire file.[/dim]")
-                    return
-
-                # Use the focused diff content instead of full file
-                code_content = diff_context_info.context_code
-                context = context or f"File: {file_path.name} (diff-only mode: reviewing changed lines)"
-
-                if diff_context_info.is_new_file:
-                    context += " [NEW FILE]"
-                elif diff_context_info.changed_line_ranges:
-                    ranges_str = ", ".join(
-                        f"L{start}-{end}" for start, end in diff_context_info.changed_line_ranges
-                    )
-                    context += f" [Changed: {ranges_str}]"
-            else:
-                console.print("[red]Error: Could not determine git repository root[/red]")
-                sys.exit(1)
+            repo_root = repo.root
+            # Convert to relative path from repo root
+            try:
+                rel_path = file_path.resolve().relative_to(Path(repo_root).resolve())
+            except ValueError:
+                rel_path = file_path
+
+            diff_context_info = extract_diff_context(str(rel_path), context_lines=5, path=repo_root)
+
+            if not diff_context_info:
+                console.print(f"[yellow]No changes detected in {file_path.name} vs HEAD[/yellow]")
+                console.print("[dim]The file has no uncommitted changes to review.[/dim]")
+                console.print("[dim]Use without --diff-only to review the entire file.[/dim]")
+                return
+
+            # Use the focused diff content instead of full file
+            code_content = diff_context_info.context_code
+            context = context or f"File: {file_path.name} (diff-only mode: reviewing changed lines)"
+
+            if diff_context_info.is_new_file:
+                context += " [NEW FILE]"
+            elif diff_context_info.changed_line_ranges:
+                ranges_str = ", ".join(
+                    f"L{start}-{end}" for start, end in diff_context_info.changed_line_ranges
+                )
+                context += f" [Changed: {ranges_str}]"
 
     elif code:
         code_content = code
@@ -301,6 +647,27 @@ def review(file: Optional[str], code: Optional[str], context: Optional[str], fix
     detected_language = detect_language(file_path=file_path_str, code=code_content)
     syntax_lang = get_syntax_highlight_language(language=detected_language)
 
+    # Build the orchestrator in the background: constructing its agents loads
+    # the Anthropic SDK and client, which overlaps with rendering the code panel
+    from concurrent.futures import ThreadPoolExecutor
+
+    def build_orchestrator() -> "DebateOrchestrator":
+        if debate:
+            # Use confrontational debate personas
+            from src.agents.personas import DEBATE_PERSONAS
+            team_personas = DEBATE_PERSONAS
+        else:
+            team_personas = get_team_personas()
+        return _lazy("DebateOrchestrator")(
+            personas=team_personas,
+            use_cache=not no_cache,
+            language=detected_language,
+        )
+
+    setup_executor = ThreadPoolExecutor(max_workers=1)
+    orchestrator_future = setup_executor.submit(build_orchestrator)
+    setup_executor.shutdown(wait=False)
+
     # Display what we're reviewing
     console.print()
 
@@ -312,7 +679,7 @@ def review(file: Optional[str], code: Optional[str], context: Optional[str], fix
     # Show diff first if in diff-only mode
     if diff_context_info:
         console.print(Panel(
-            Syntax(diff_context_info.diff_text, "diff", theme="monokai"),
+            _diff_syntax(diff_context_info.diff_text, line_numbers=False),
             title="[bold magenta]Git Diff vs HEAD[/bold magenta]",
             border_style="magenta",
         ))
@@ -320,8 +687,9 @@ def review(file: Optional[str], code: Optional[str], context: Optional[str], fix
         console.print("[dim]Reviewing only the changed sections (token-efficient mode):[/dim]")
         console.print()
 
-    console.print(Panel(
-        Syntax(code_content, syntax_lang, theme="monokai", line_numbers=True),
+    console.print(_code_panel(
+        code_content,
+        syntax_lang,
         title=f"[bold cyan]Code Under Review[/bold cyan]" + (f" [{detected_language.display_name}]" if detected_language.name != "text" else "") + (" [diff-only]" if diff_context_info else ""),
         border_style="cyan",
     ))
@@ -334,16 +702,10 @@ def review(file: Optional[str], code: Optional[str], context: Optional[str], fix
     # Run the full debate (use team-configured personas)
     try:
         if debate:
-            # Use confrontational debate personas
-            from src.agents.personas import DEBATE_PERSONAS
-            team_personas = DEBATE_PERSONAS
             console.print("[bold yellow]⚔️  Debate Mode: Agents will argue more aggressively[/bold yellow]")
             console.print()
-        else:
-            team_personas = get_team_personas()
 
-        # Determine cache setting
-        use_cache = not no_cache
+        orchestrator = orchestrator_future.result()
 
         if stream:
             # Parallel streaming mode: all 4 agents stream simultaneously in Live panels
@@ -352,20 +714,17 @@ def review(file: Optional[str], code: Optional[str], context: Optional[str], fix
             console.print("[dim]Watch all 4 AI reviewers think simultaneously![/dim]")
             console.print()
 
-            orchestrator = DebateOrchestrator(personas=team_personas, use_cache=use_cache, language=detected_language)
             consensus_result = orchestrator.run_streaming_review(code_content, context)
 
         elif quick:
             # Quick mode: Round 1 only, no debate/voting (fast for hooks)
             console.print("[bold cyan]⚡ Quick Mode: Running Round 1 only[/bold cyan]")
             console.print()
-            orchestrator = DebateOrchestrator(personas=team_personas, use_cache=use_cache, language=detected_language)
             consensus_result = orchestrator.run_quick_review(code_content, context)
 
         else:
             # Standard parallel mode (full debate)
-            orchestrator = DebateOrchestrator(personas=team_personas, use_cache=use_cache, language=detected_language)
-            consensus_result = orchestrator.run_full_debate(code_content, context)
+            consensus_result = orchestrator.run_full_debate(code_content, context, early_exit=early_exit)
 
         # Print session ID for replay
         console.print()
@@ -434,20 +793,25 @@ def review(file: Optional[str], code: Optional[str], context: Optional[str], fix
                     console.print(f"  [red]•[/red] {sec_issue['vuln_type']} (detected by {sec_issue['agent']})")
                 console.print()
 
+                from concurrent.futures import ThreadPoolExecutor
+
                 redteam_agent = RedTeamAgent()
 
-                for sec_issue in unique_issues:
+                # Vulnerability types are independent: generate all exploit/patch
+                # pairs concurrently, then display them in detection order
+                with console.status(f"[red]Generating exploits and patches for {len(unique_issues)} vulnerability type(s)...[/red]"):
+                    with ThreadPoolExecutor(max_workers=len(unique_issues)) as executor:
+                        futures = [
+                            executor.submit(redteam_agent.analyze, code_content, sec_issue["vuln_type"], context)
+                            for sec_issue in unique_issues
+                        ]
+
+                for sec_issue, future in zip(unique_issues, futures):
                     vuln_type = sec_issue["vuln_type"]
                     console.print(f"[bold red]▶ Analyzing: {vuln_type}[/bold red]")
 
                     try:
-                        # Generate exploit
-                        with console.status(f"[red]Generating exploit for {vuln_type}...[/red]"):
-                            exploit = redteam_agent.generate_exploit(
-                                code=code_content,
-                                vulnerability=vuln_type,
-                                context=context
-                            )
+                        exploit, patch = future.result()
 
                         # Display exploit
                         console.print(Panel(
@@ -460,17 +824,15 @@ def review(file: Optional[str], code: Optional[str], context: Optional[str], fix
                             border_style="red",
                         ))
 
-                        # Generate patch
-                        with console.status(f"[green]Generating patch for {vuln_type}...[/green]"):
-                            patch = redteam_agent.generate_patch(
-                                code=code_content,
-                                exploit=exploit,
-                                context=context
-                            )
-
                         # Display patch
+                        from rich.syntax import Syntax
+
                         console.print(Panel(
-                            Syntax(patch.diff if patch.diff else patch.patched_code[:800], "diff", theme="monokai"),
+                            Syntax(
+                                patch.diff if patch.diff else patch.patched_code[:800],
+                                _display_lexer("diff"),
+                                theme="monokai",
+                            ),
                             title=f"[bold green]Patch: {vuln_type}[/bold green]",
                             border_style="green",
                         ))
@@ -747,33 +1109,62 @@ def review(file: Optional[str], code: Optional[str], context: Optional[str], fix
             console.print("[bold cyan]━━━ Auto-Fix Mode ━━━[/bold cyan]")
             console.print()
 
-            from src.agents.agent import CodeFixer
+            from src.agents.agent import CodeFixer, FixResult
+            from src.cache import ReviewCache, get_cache
+            from src.orchestrator.debate import canonical
+
+            # Collect issues and suggestions from reviews so overlapping
+            # findings aren't sent to the fixer once per agent. Suggestions
+            # keep their first wording; for issues with the same description
+            # the most severe report wins, in the position first seen.
+            unique_issues: Dict[str, Any] = {}
+            unique_suggestions: Dict[str, str] = {}
+
+            def issue_level(issue: Dict[str, Any]) -> int:
+                return SEVERITY_ORDER.get(str(issue.get("severity", "")).upper(), 0)
 
-            # Collect all issues and suggestions from reviews
-            all_issues = []
-            all_suggestions = set()
             for review in orchestrator.reviews:
-                all_issues.extend(review.issues)
-                all_suggestions.update(review.suggestions)
+                for issue in review.issues:
+                    key = canonical(issue.get("description", str(issue)))
+                    kept = unique_issues.get(key)
+                    if kept is None or issue_level(issue) > issue_level(kept):
+                        unique_issues[key] = issue
+                for suggestion in review.suggestions:
+                    unique_suggestions.setdefault(canonical(suggestion), suggestion)
 
             # Add consensus suggestions
-            all_suggestions.update(consensus_result.accepted_suggestions)
+            for suggestion in consensus_result.accepted_suggestions:
+                unique_suggestions.setdefault(canonical(suggestion), suggestion)
+
+            all_issues = list(unique_issues.values())
+            all_suggestions = list(unique_suggestions.values())
 
             if not all_issues and not all_suggestions:
                 console.print("[green]No issues found - code looks good![/green]")
             else:
-                with console.status("[bold cyan]Generating fixed code...[/bold cyan]"):
-                    fixer = CodeFixer()
-                    fix_result = fixer.fix_code(
-                        code=code_content,
-                        issues=all_issues,
-                        suggestions=list(all_suggestions),
-                        context=context
-                    )
+                # Re-running --fix on unchanged code and findings reuses the last fix
+                fix_cache = None if no_cache else get_cache()
+                fix_hash = ReviewCache.hash_fix_request(code_content, all_issues, all_suggestions, context)
+                cached_fix = fix_cache.get_fix(fix_hash) if fix_cache else None
+                if cached_fix:
+                    fix_result = FixResult(**cached_fix)
+                    console.print("[dim]Using cached fix (run with --no-cache to regenerate)[/dim]")
+                else:
+                    with console.status("[bold cyan]Generating fixed code...[/bold cyan]"):
+                        fixer = CodeFixer()
+                        fix_result = fixer.fix_code(
+                            code=code_content,
+                            issues=all_issues,
+                            suggestions=all_suggestions,
+                            context=context
+                        )
+                    if fix_cache:
+                        fix_cache.set_fix(fix_hash, dataclasses.asdict(fix_result))
 
                 # Display the fixed code
-                console.print(Panel(
-                    Syntax(fix_result.fixed_code, syntax_lang, theme="monokai", line_numbers=True),
+                console.print(_code_panel(
+                    fix_result.fixed_code,
+                    syntax_lang,
                     title="[bold green]Fixed Code[/bold green]",
                     border_style="green",
                 ))
@@ -793,7 +1184,7 @@ def review(file: Optional[str], code: Optional[str], context: Optional[str], fix
                 # Write to file if output specified
                 if output:
                     output_path = Path(output)
-                    output_path.write_text(fix_result.fixed_code)
+                    _write_text_atomic(output_path, fix_result.fixed_code)
                     console.print()
                     console.print(f"[green]Fixed code written to: {output_path}[/green]")
                 elif file:
@@ -836,14 +1227,26 @@ def review(file: Optional[str], code: Optional[str], context: Optional[str], fix
 
 @cli.command()
 @click.option("--limit", "-n", default=20, help="Number of sessions to show")
-def history(limit: int):
+@click.option("--before", help="Only show sessions created before this timestamp (for paging)")
+@click.option("--json", "as_json", is_flag=True, help="Print sessions as JSON instead of a table")
+def history(limit: int, before: Optional[str], as_json: bool):
     """Show past review sessions.
 
     Lists recent review sessions with their IDs, dates, and final decisions.
     Use 'consensys replay <session_id>' to view a past debate.
+
+    \b
+    Examples:
+        consensys history
+        consensys history --before 2024-01-01T12:00:00
+        consensys history --json -n 100 > sessions.json
     """
-    storage = Storage()
-    sessions = storage.list_sessions(limit=limit)
+    storage = _lazy("Storage")()
+    if as_json:
+        _echo_json(storage.list_sessions(limit=limit, before=before))
+        return
+
+    sessions = storage.list_sessions_preview(limit=limit, width=40, before=before)
 
     if not sessions:
         console.print("[yellow]No review sessions found.[/yellow]")
@@ -860,51 +1263,72 @@ def history(limit: int):
     table.add_column("Decision", justify="center")
     table.add_column("Code Preview", max_width=40)
 
-    decision_colors = {
-        "APPROVE": "green",
-        "REJECT": "red",
-        "ABSTAIN": "yellow",
-    }
-
     for session in sessions:
         session_id = session["session_id"]
-        created_at = session["created_at"][:16].replace("T", " ")
+        created_at = session["created_at_short"]
         decision = session.get("final_decision") or "In Progress"
-        color = decision_colors.get(decision, "dim")
-        decision_styled = f"[{color}]{decision}[/{color}]"
-
-        # Truncate code preview
-        code_preview = session["code_snippet"][:37] + "..." if len(
-            session["code_snippet"]
-        ) > 40 else session["code_snippet"]
-        code_preview = code_preview.replace("\n", " ")
+        decision_styled = DECISION_MARKUP.get(decision) or f"[dim]{decision}[/dim]"
 
         table.add_row(
             session_id[:12] + "...",
             created_at,
             decision_styled,
-            code_preview,
+            session["preview"],
         )
 
     console.print()
     console.print(table)
     console.print()
     console.print("[dim]Use 'consensys replay <session_id>' to view a session[/dim]")
+    if len(sessions) == limit:
+        console.print(f"[dim]Older sessions: consensys history --before {sessions[-1]['created_at']}[/dim]")
+
+
+def _replay_section(title: str, renderables: List[RenderableType]) -> Group:
+    """Group a replay round's heading and content into one renderable.
+
+    Printing the section as a single Group takes the console lock and
+    writes once per round instead of once per item and blank line.
+
+    Args:
+        title: Round heading shown in the rule
+        renderables: Tables or panels to show under the heading, in order
+
+    Returns:
+        Group of a blank line, the rule, and each renderable preceded by a blank line
+    """
+    items = [Text(), Rule(f"[bold blue]{title}[/bold blue]")]
+    for renderable in renderables:
+        items.extend((Text(), renderable))
+    items.append(Text())
+    return Group(*items)
 
 
 @cli.command()
 @click.argument("session_id")
-def replay(session_id: str):
+@click.option("--json", "as_json", is_flag=True, help="Print the session as JSON instead of panels")
+def replay(session_id: str, as_json: bool):
     """Replay a past debate session.
 
     Shows the complete debate history: code, reviews, responses,
     votes, and final consensus.
+
+    \b
+    Examples:
+        consensys replay abc123
+        consensys replay abc123 --json | jq .consensus
     """
-    storage = Storage()
+    storage = _lazy("Storage")()
+
+    # Handle partial session ID matching (up to 5 candidates to list)
+    matching = storage.find_sessions_by_prefix(session_id, limit=5)
 
-    # Handle partial session ID matching
-    sessions = storage.list_sessions(limit=100)
-    matching = [s for s in sessions if s["session_id"].startswith(session_id)]
+    if as_json:
+        if len(matching) != 1:
+            reason = "not found" if not matching else "is ambiguous"
+            raise click.ClickException(f"Session {reason}: {session_id}")
+        _echo_json(storage.get_full_session(matching[0]))
+        return
 
     if not matching:
         console.print(f"[red]Session not found: {session_id}[/red]")
@@ -913,22 +1337,23 @@ def replay(session_id: str):
 
     if len(matching) > 1:
         console.print(f"[yellow]Multiple sessions match '{session_id}':[/yellow]")
-        for s in matching[:5]:
-            console.print(f"  {s['session_id']}")
+        for candidate in matching:
+            console.print(f"  {candidate}")
         console.print("Please provide a more specific session ID.")
         return
 
-    full_session_id = matching[0]["session_id"]
-    session = storage.get_session(full_session_id)
+    full_session_id = matching[0]
+    bundle = storage.get_full_session(full_session_id)
 
-    if not session:
+    if not bundle:
         console.print(f"[red]Session not found: {session_id}[/red]")
         return
+    session = bundle.session
 
     console.print()
     console.print(Panel(
         f"[bold]Session:[/bold] {full_session_id}\n"
-        f"[bold]Date:[/bold] {session['created_at'][:19].replace('T', ' ')}\n"
+        f"[bold]Date:[/bold] {session['created_at_full']}\n"
         f"[bold]Status:[/bold] {session.get('final_decision') or 'In Progress'}",
         title="[bold cyan]Debate Replay[/bold cyan]",
         border_style="cyan",
@@ -936,8 +1361,9 @@ def replay(session_id: str):
 
     # Show the code
     console.print()
-    console.print(Panel(
-        Syntax(session["code_snippet"], "python", theme="monokai", line_numbers=True),
+    console.print(_code_panel(
+        session["code_snippet"],
+        "python",
         title="[bold]Code Under Review[/bold]",
         border_style="dim",
     ))
@@ -945,239 +1371,314 @@ def replay(session_id: str):
     if session.get("context"):
         console.print(f"[dim]Context: {session['context']}[/dim]")
 
-    # Load and display reviews
-    reviews = storage.get_reviews(full_session_id)
+    # Display reviews
+    reviews = bundle.reviews
     if reviews:
-        console.print()
-        console.rule("[bold blue]Round 1: Initial Reviews[/bold blue]")
-        console.print()
-
-        severity_colors = {
-            "CRITICAL": "red",
-            "HIGH": "red",
-            "MEDIUM": "yellow",
-            "LOW": "green",
-        }
+        table = Table(show_lines=True, header_style="bold cyan", expand=True)
+        table.add_column("Agent", style="bold", no_wrap=True)
+        table.add_column("Severity", justify="center")
+        table.add_column("Conf", justify="right")
+        table.add_column("Issues", ratio=3)
+        table.add_column("Summary", ratio=2)
 
         for review in reviews:
-            color = severity_colors.get(review.severity, "blue")
-
-            content_lines = []
-            content_lines.append(f"[bold]Severity:[/bold] [{color}]{review.severity}[/{color}]")
-            content_lines.append(f"[bold]Confidence:[/bold] {review.confidence:.0%}")
-
-            if review.issues:
-                content_lines.append(f"\n[bold]Issues ({len(review.issues)}):[/bold]")
-                for issue in review.issues:
-                    desc = issue.get("description", str(issue))
-                    sev = issue.get("severity", "LOW")
-                    sev_color = severity_colors.get(sev, "blue")
-                    line_num = issue.get("line")
-                    line_str = f" (line {line_num})" if line_num else ""
-                    content_lines.append(f"  [{sev_color}]\u2022[/{sev_color}] {desc}{line_str}")
-                    # Show fix suggestion if available
-                    fix = issue.get("fix")
-                    if fix:
-                        # Handle multiline fixes - indent each line
-                        fix_lines = fix.split('\n')
-                        if len(fix_lines) == 1:
-                            content_lines.append(f"    [green]Fix:[/green] [dim]{fix}[/dim]")
-                        else:
-                            content_lines.append(f"    [green]Fix:[/green]")
-                            for fix_line in fix_lines:
-                                content_lines.append(f"      [dim]{fix_line}[/dim]")
+            issues = Text()
+            for issue in review.issues:
+                desc = issue.get("description", str(issue))
+                sev = issue.get("severity", "LOW")
+                line_num = issue.get("line")
+                line_str = f" (line {line_num})" if line_num else ""
+                if issues:
+                    issues.append("\n")
+                issues.append_text(Text.assemble(
+                    ("\u2022", SEVERITY_STYLES.get(sev, UNKNOWN_STATUS_STYLE)),
+                    f" {desc}{line_str}",
+                ))
+                # Show fix suggestion if available
+                fix = issue.get("fix")
+                if fix:
+                    # Handle multiline fixes - indent each line
+                    issues.append("\n  ")
+                    issues.append("Fix:", style="green")
+                    if "\n" not in fix:
+                        issues.append(" ")
+                        issues.append(fix, style="dim")
+                    else:
+                        for fix_line in fix.split("\n"):
+                            issues.append("\n    ")
+                            issues.append(fix_line, style="dim")
 
+            summary = Text(review.summary)
             if review.suggestions:
-                content_lines.append(f"\n[bold]Suggestions:[/bold]")
+                if review.summary:
+                    summary.append("\n\n")
+                summary.append("Suggestions:", style="bold")
                 for suggestion in review.suggestions:
-                    content_lines.append(f"  [cyan]\u2022[/cyan] {suggestion}")
-
-            if review.summary:
-                content_lines.append(f"\n[bold]Summary:[/bold]\n{review.summary}")
+                    summary.append("\n")
+                    summary.append("\u2022", style="cyan")
+                    summary.append(f" {suggestion}")
 
-            panel = Panel(
-                "\n".join(content_lines),
-                title=f"[bold]{review.agent_name}[/bold]",
-                border_style=color,
-                padding=(1, 2),
+            table.add_row(
+                review.agent_name,
+                Text(review.severity, style=SEVERITY_STYLES.get(review.severity, UNKNOWN_STATUS_STYLE)),
+                f"{review.confidence:.0%}",
+                issues,
+                summary,
             )
-            console.print(panel)
-            console.print()
 
-    # Load and display responses
-    responses = storage.get_responses(full_session_id)
-    if responses:
-        console.print()
-        console.rule("[bold blue]Round 2: Debate Responses[/bold blue]")
-        console.print()
+        console.print(_replay_section("Round 1: Initial Reviews", [table]))
 
-        agreement_colors = {
-            "AGREE": "green",
-            "PARTIAL": "yellow",
-            "DISAGREE": "red",
-        }
+    # Display responses
+    responses = bundle.responses
+    if responses:
+        table = Table(show_lines=True, header_style="bold cyan", expand=True)
+        table.add_column("Agent", style="bold", no_wrap=True)
+        table.add_column("Responds To", style="bold", no_wrap=True)
+        table.add_column("Agreement", justify="center")
+        table.add_column("Points", ratio=1)
 
         for response in responses:
-            color = agreement_colors.get(response.agreement_level, "blue")
+            points = Text()
+            for point in response.points:
+                if points:
+                    points.append("\n")
+                points.append("\u2022", style="cyan")
+                points.append(f" {point}")
 
-            content_lines = []
-            content_lines.append(
-                f"[bold]{response.agent_name}[/bold] responds to "
-                f"[bold]{response.responding_to}[/bold]"
-            )
-            content_lines.append(
-                f"[bold]Agreement:[/bold] [{color}]{response.agreement_level}[/{color}]"
+            table.add_row(
+                response.agent_name,
+                response.responding_to,
+                Text(
+                    response.agreement_level,
+                    style=AGREEMENT_STYLES.get(response.agreement_level, UNKNOWN_STATUS_STYLE),
+                ),
+                points,
             )
 
-            if response.points:
-                content_lines.append(f"\n[bold]Points:[/bold]")
-                for point in response.points:
-                    content_lines.append(f"  [cyan]\u2022[/cyan] {point}")
+        console.print(_replay_section("Round 2: Debate Responses", [table]))
 
-            panel = Panel(
-                "\n".join(content_lines),
-                title=f"[bold]{response.agent_name} \u2192 {response.responding_to}[/bold]",
-                border_style=color,
-                padding=(1, 2),
-            )
-            console.print(panel)
-            console.print()
-
-    # Load and display votes
-    votes = storage.get_votes(full_session_id)
+    # Display votes
+    votes = bundle.votes
     if votes:
-        console.print()
-        console.rule("[bold blue]Round 3: Final Voting[/bold blue]")
-        console.print()
-
-        decision_colors = {
-            "APPROVE": "green",
-            "REJECT": "red",
-            "ABSTAIN": "yellow",
-        }
+        table = Table(show_lines=True, header_style="bold cyan", expand=True)
+        table.add_column("Agent", style="bold", no_wrap=True)
+        table.add_column("Vote", justify="center")
+        table.add_column("Reasoning", ratio=1)
 
         for vote in votes:
-            decision_str = vote.decision.value if isinstance(
-                vote.decision, VoteDecision
-            ) else str(vote.decision)
-            color = decision_colors.get(decision_str, "blue")
-
-            content_lines = []
-            content_lines.append(f"[bold]Vote:[/bold] [{color}]{decision_str}[/{color}]")
-            content_lines.append(f"\n[bold]Reasoning:[/bold]\n{vote.reasoning}")
-
-            panel = Panel(
-                "\n".join(content_lines),
-                title=f"[bold]{vote.agent_name}[/bold]",
-                border_style=color,
-                padding=(1, 2),
+            decision_str = vote.decision.value
+
+            table.add_row(
+                vote.agent_name,
+                Text(decision_str, style=DECISION_STYLES.get(decision_str, UNKNOWN_STATUS_STYLE)),
+                Text(vote.reasoning),
             )
-            console.print(panel)
-            console.print()
 
-    # Load and display consensus
-    consensus = storage.get_consensus(full_session_id)
-    if consensus:
-        console.print()
-        console.rule("[bold blue]Final Consensus[/bold blue]")
-        console.print()
+        console.print(_replay_section("Round 3: Final Voting", [table]))
 
-        decision_colors = {
-            VoteDecision.APPROVE: "green",
-            VoteDecision.REJECT: "red",
-            VoteDecision.ABSTAIN: "yellow",
-        }
-        color = decision_colors.get(consensus.final_decision, "blue")
+    # Display consensus
+    consensus = bundle.consensus
+    if consensus:
         decision_str = consensus.final_decision.value
+        color = DECISION_COLORS.get(decision_str, "blue")
 
-        content_lines = []
-        content_lines.append("[bold]Vote Breakdown:[/bold]")
-        content_lines.append(
-            f"  [green]APPROVE[/green]: {consensus.vote_counts.get('APPROVE', 0)}"
-        )
-        content_lines.append(
-            f"  [red]REJECT[/red]: {consensus.vote_counts.get('REJECT', 0)}"
-        )
-        content_lines.append(
-            f"  [yellow]ABSTAIN[/yellow]: {consensus.vote_counts.get('ABSTAIN', 0)}"
-        )
+        body = Text()
+        body.append("Vote Breakdown:", style="bold")
+        for decision_name, decision_style in DECISION_STYLES.items():
+            body.append("\n  ")
+            body.append(decision_name, style=decision_style)
+            body.append(f": {consensus.vote_counts.get(decision_name, 0)}")
 
         if consensus.key_issues:
-            content_lines.append(f"\n[bold]Key Issues ({len(consensus.key_issues)}):[/bold]")
+            body.append(f"\n\nKey Issues ({len(consensus.key_issues)}):", style="bold")
             for issue in consensus.key_issues:
                 desc = issue.get("description", str(issue))
-                content_lines.append(f"  [red]\u2022[/red] {desc}")
+                body.append("\n  ")
+                body.append("\u2022", style="red")
+                body.append(f" {desc}")
 
         if consensus.accepted_suggestions:
-            content_lines.append(
-                f"\n[bold]Agreed Suggestions ({len(consensus.accepted_suggestions)}):[/bold]"
+            body.append(
+                f"\n\nAgreed Suggestions ({len(consensus.accepted_suggestions)}):",
+                style="bold",
             )
             for suggestion in consensus.accepted_suggestions:
-                content_lines.append(f"  [cyan]\u2022[/cyan] {suggestion}")
+                body.append("\n  ")
+                body.append("\u2022", style="cyan")
+                body.append(f" {suggestion}")
 
         panel = Panel(
-            "\n".join(content_lines),
+            body,
             title=f"[bold {color}]Final Decision: {decision_str}[/bold {color}]",
             border_style=color,
             padding=(1, 2),
         )
-        console.print(panel)
-        console.print()
+        console.print(_replay_section("Final Consensus", [panel]))
 
 
-def _detect_language_for_highlight(filepath: str) -> str:
-    """Detect programming language from file extension for syntax highlighting.
+def _review_one_file(
+    file,
+    context_prefix: str,
+    team_personas,
+    storage: "Storage",
+    file_console: Console,
+) -> Optional[str]:
+    """Show one file's diff and debate it on the given console.
 
-    Uses the languages module but returns just the highlight string for simpler cases.
+    Args:
+        file: FileChange to review
+        context_prefix: Prefix for the review context (e.g. "PR #12: ")
+        team_personas: Personas to debate with
+        storage: Storage shared by all files of the change set
+        file_console: Console receiving the diff panel and debate output
+
+    Returns:
+        The debate's session ID, or None if the file was skipped or failed
     """
-    detected = detect_language(file_path=filepath)
-    return detected.syntax_highlight
+    file_console.print(_diff_panel(file.path, file.diff))
+
+    # Prepare code for review (prefer diff, fall back to content)
+    code_to_review = file.diff if file.diff else (file.content or "")
+    if not code_to_review.strip():
+        file_console.print(f"[dim]Skipping {file.path} - no content to review[/dim]")
+        return None
 
+    context = f"{context_prefix}File: {file.path} (Status: {file.status})"
 
-def _review_file_changes(files, context_prefix: str = "") -> Optional[str]:
-    """Review a list of changed files and return the session ID."""
+    try:
+        # One orchestrator per file: session state is per debate
+        orchestrator = _lazy("DebateOrchestrator")(
+            personas=team_personas,
+            storage=storage,
+            console=file_console,
+        )
+        orchestrator.run_full_debate(code_to_review, context)
+        return orchestrator.session_id
+    except Exception as e:
+        file_console.print(f"[red]Error reviewing {file.path}: {e}[/red]")
+        return None
+
+
+def _review_file_changes(files, context_prefix: str = "", concurrency: int = 4) -> Optional[str]:
+    """Review a list of changed files and return the session ID.
+
+    With more than one worker, per-file debates run concurrently (they are
+    bound on API latency). Each file's output is buffered and printed as a
+    block in input order as soon as it and every earlier file are done, so
+    files never interleave on screen and read in the same order as -j 1.
+
+    Args:
+        files: FileChange objects to review
+        context_prefix: Prefix for each review context
+        concurrency: Maximum number of files debated at once
+
+    Returns:
+        Session ID of the last reviewed file (in input order), or None.
+        When several files were debated, all of their session IDs are
+        listed in a table.
+    """
     if not files:
         console.print("[yellow]No changes found to review.[/yellow]")
         return None
 
     team_personas = get_team_personas()
-    orchestrator = DebateOrchestrator(personas=team_personas)
-    session_id = None
+    storage = _lazy("Storage")()
+    total = len(files)
+    session_ids: List[Optional[str]] = [None] * total
 
-    for i, file in enumerate(files, 1):
+    if concurrency <= 1 or total == 1:
+        for i, file in enumerate(files, 1):
+            console.print()
+            console.print(f"[bold cyan]Reviewing file {i}/{total}: {file.path}[/bold cyan]")
+            session_ids[i - 1] = _review_one_file(file, context_prefix, team_personas, storage, console)
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        from io import StringIO
+
+        def run_one(file):
+            buffer = StringIO()
+            # Not a terminal, so progress spinners and live panels skip their
+            # transient frames instead of leaving them in the replayed text;
+            # the explicit color system still keeps the output coloured.
+            file_console = Console(
+                file=buffer,
+                width=console.width,
+                force_terminal=False,
+                color_system=console.color_system,
+            )
+            session_id = _review_one_file(file, context_prefix, team_personas, storage, file_console)
+            return session_id, buffer.getvalue()
+
+        console.print(f"[dim]Reviewing {total} files, {min(concurrency, total)} at a time...[/dim]")
+        with ThreadPoolExecutor(max_workers=min(concurrency, total)) as executor:
+            futures = [executor.submit(run_one, file) for file in files]
+            for index, future in enumerate(futures):
+                path = files[index].path
+                console.print()
+                console.print(f"[bold cyan]Reviewing file {index + 1}/{total}: {path}[/bold cyan]")
+                try:
+                    session_ids[index], output = future.result()
+                except Exception as e:
+                    console.print(f"[red]Error reviewing {path}: {e}[/red]")
+                    continue
+                console.print(Text.from_ansi(output), end="")
+
+    # Every file has its own debate; list them all, not just the last one
+    reviewed = [(file.path, sid) for file, sid in zip(files, session_ids) if sid]
+    if len(reviewed) > 1:
+        table = Table(title="Sessions", header_style="bold cyan")
+        table.add_column("File")
+        table.add_column("Session ID", style="dim", no_wrap=True)
+        for path, sid in reviewed:
+            table.add_row(path, sid)
         console.print()
-        console.print(f"[bold cyan]Reviewing file {i}/{len(files)}: {file.path}[/bold cyan]")
+        console.print(table)
 
-        # Display the diff
-        lang = _detect_language_for_highlight(file.path)
-        console.print(Panel(
-            Syntax(file.diff or "(no diff)", "diff", theme="monokai", line_numbers=True),
-            title=f"[bold]Diff: {file.path}[/bold]",
-            border_style="cyan",
-        ))
+    return next((sid for sid in reversed(session_ids) if sid), None)
 
-        # Prepare code for review (prefer diff, fall back to content)
-        code_to_review = file.diff if file.diff else (file.content or "")
-        if not code_to_review.strip():
-            console.print(f"[dim]Skipping {file.path} - no content to review[/dim]")
-            continue
 
-        context = f"{context_prefix}File: {file.path} (Status: {file.status})"
+def _build_pr_comment(consensus: Consensus, max_items: int = 5) -> str:
+    """Render the markdown summary comment posted to a PR.
 
-        try:
-            consensus = orchestrator.run_full_debate(code_to_review, context)
-            session_id = orchestrator.session_id
-        except Exception as e:
-            console.print(f"[red]Error reviewing {file.path}: {e}[/red]")
-            continue
+    Args:
+        consensus: The debate's final consensus
+        max_items: Maximum number of key issues and suggestions to list
 
-    return session_id
+    Returns:
+        The comment body as markdown
+    """
+    parts = [
+        "## Consensys Code Review",
+        "",
+        f"**Decision:** {consensus.final_decision.value}",
+        "",
+        "**Vote Breakdown:**",
+        *(f"- {name}: {consensus.vote_counts.get(name, 0)}" for name in ("APPROVE", "REJECT", "ABSTAIN")),
+        "",
+    ]
+    if consensus.key_issues:
+        parts.append("**Key Issues:**")
+        parts.extend(
+            f"- {issue.get('description', str(issue))}" for issue in consensus.key_issues[:max_items]
+        )
+        parts.append("")
+    if consensus.accepted_suggestions:
+        parts.append("**Agreed Suggestions:**")
+        parts.extend(f"- {suggestion}" for suggestion in consensus.accepted_suggestions[:max_items])
+        parts.append("")
+    parts += [
+        "---",
+        "*Generated by [Consensys](https://github.com/noah-ing/consensys) - Multi-agent AI code review*",
+    ]
+    return "\n".join(parts)
 
 
 @cli.command()
 @click.argument("pr_number", type=int)
 @click.option("--post", is_flag=True, help="Post summary comment to the PR")
-def pr(pr_number: int, post: bool):
+@click.option("--concurrency", "-j", default=4,
+              help="Number of files to debate concurrently (default: 4)")
+def pr(pr_number: int, post: bool, concurrency: int):
     """Review a GitHub Pull Request.
 
     Fetches the PR diff and runs a full debate on the changed files.
@@ -1212,7 +1713,7 @@ def pr(pr_number: int, post: bool):
         console.print("[yellow]No files changed in this PR.[/yellow]")
         return
 
-    session_id = _review_file_changes(pr_info.files, context_prefix=f"PR #{pr_number}: ")
+    session_id = _review_file_changes(pr_info.files, context_prefix=f"PR #{pr_number}: ", concurrency=concurrency)
 
     if session_id:
         console.print()
@@ -1221,34 +1722,10 @@ def pr(pr_number: int, post: bool):
 
         if post:
             # Build summary comment
-            storage = Storage()
+            storage = _lazy("Storage")()
             consensus_result = storage.get_consensus(session_id)
             if consensus_result:
-                decision_str = consensus_result.final_decision.value
-                comment = f"""## Consensys Code Review
-
-**Decision:** {decision_str}
-
-**Vote Breakdown:**
-- APPROVE: {consensus_result.vote_counts.get('APPROVE', 0)}
-- REJECT: {consensus_result.vote_counts.get('REJECT', 0)}
-- ABSTAIN: {consensus_result.vote_counts.get('ABSTAIN', 0)}
-
-"""
-                if consensus_result.key_issues:
-                    comment += "**Key Issues:**\n"
-                    for issue in consensus_result.key_issues[:5]:
-                        desc = issue.get("description", str(issue))
-                        comment += f"- {desc}\n"
-                    comment += "\n"
-
-                if consensus_result.accepted_suggestions:
-                    comment += "**Agreed Suggestions:**\n"
-                    for suggestion in consensus_result.accepted_suggestions[:5]:
-                        comment += f"- {suggestion}\n"
-
-                comment += f"\n---\n*Generated by [Consensys](https://github.com/noah-ing/consensys) - Multi-agent AI code review*"
-
+                comment = _build_pr_comment(consensus_result)
                 console.print()
                 console.print("[dim]Posting comment to PR...[/dim]")
                 success, msg = post_pr_comment(pr_number, comment)
@@ -1259,7 +1736,9 @@ def pr(pr_number: int, post: bool):
 
 
 @cli.command()
-def diff():
+@click.option("--concurrency", "-j", default=4,
+              help="Number of files to debate concurrently (default: 4)")
+def diff(concurrency: int):
     """Review all uncommitted changes in the current repo.
 
     Reviews both staged and unstaged changes. Use before committing
@@ -1270,18 +1749,16 @@ def diff():
         cd my-project
         consensys diff
     """
-    if not is_git_repo():
+    repo = get_repo_info()
+    if repo is None:
         console.print("[red]Error: Not in a git repository.[/red]")
         console.print("[dim]Run this command from within a git repository.[/dim]")
         sys.exit(1)
 
-    repo_root = get_repo_root()
-    branch = get_current_branch()
-
     console.print()
     console.print(Panel(
-        f"[bold]Repository:[/bold] {repo_root}\n"
-        f"[bold]Branch:[/bold] {branch}",
+        f"[bold]Repository:[/bold] {repo.root}\n"
+        f"[bold]Branch:[/bold] {repo.branch}",
         title="[bold cyan]Reviewing Uncommitted Changes[/bold cyan]",
         border_style="cyan",
     ))
@@ -1293,7 +1770,7 @@ def diff():
 
     console.print(f"[dim]Found {len(files)} file(s) with changes[/dim]")
 
-    session_id = _review_file_changes(files, context_prefix="Uncommitted: ")
+    session_id = _review_file_changes(files, context_prefix="Uncommitted: ", concurrency=concurrency)
 
     if session_id:
         console.print()
@@ -1302,7 +1779,9 @@ def diff():
 
 
 @cli.command("commit")
-def commit_review():
+@click.option("--concurrency", "-j", default=4,
+              help="Number of files to debate concurrently (default: 4)")
+def commit_review(concurrency: int):
     """Review staged changes before committing.
 
     Reviews only the staged changes (what would be included in the
@@ -1314,18 +1793,16 @@ def commit_review():
         consensys commit
         git commit -m "My changes"
     """
-    if not is_git_repo():
+    repo = get_repo_info()
+    if repo is None:
         console.print("[red]Error: Not in a git repository.[/red]")
         console.print("[dim]Run this command from within a git repository.[/dim]")
         sys.exit(1)
 
-    repo_root = get_repo_root()
-    branch = get_current_branch()
-
     console.print()
     console.print(Panel(
-        f"[bold]Repository:[/bold] {repo_root}\n"
-        f"[bold]Branch:[/bold] {branch}",
+        f"[bold]Repository:[/bold] {repo.root}\n"
+        f"[bold]Branch:[/bold] {repo.branch}",
         title="[bold cyan]Reviewing Staged Changes[/bold cyan]",
         border_style="cyan",
     ))
@@ -1338,7 +1815,7 @@ def commit_review():
 
     console.print(f"[dim]Found {len(files)} staged file(s)[/dim]")
 
-    session_id = _review_file_changes(files, context_prefix="Staged: ")
+    session_id = _review_file_changes(files, context_prefix="Staged: ", concurrency=concurrency)
 
     if session_id:
         console.print()
@@ -1346,6 +1823,37 @@ def commit_review():
         console.print(f"[dim]Replay with: consensys replay {session_id}[/dim]")
 
 
+def _breakdown_table(title: str, label: str, counts: Dict[str, int], markup: Dict[str, str]) -> Table:
+    """Build a count/percentage table for one stats breakdown.
+
+    Args:
+        title: Table title
+        label: Header of the first column
+        counts: Map of category value to its count
+        markup: Prebuilt colored markup for known category values
+
+    Returns:
+        Table with one row per category, sorted by category
+    """
+    table = Table(title=title, show_header=True, header_style="bold blue")
+    table.add_column(label, style="dim")
+    table.add_column("Count", justify="right")
+    table.add_column("Percentage", justify="right")
+
+    total = sum(counts.values())
+    rows = [
+        (
+            markup.get(value) or f"[white]{value}[/white]",
+            str(count),
+            "%.1f%%" % (count / total * 100 if total > 0 else 0),
+        )
+        for value, count in sorted(counts.items())
+    ]
+    for row in rows:
+        table.add_row(*row)
+    return table
+
+
 @cli.command()
 @click.argument("session_id")
 @click.option("--format", "-f", "output_format", type=click.Choice(["md", "html"]), default="md",
@@ -1360,11 +1868,11 @@ def export(session_id: str, output_format: str, output_path: Optional[str]):
         consensys export abc123 --format md
         consensys export abc123 --format html -o review.html
     """
-    exporter = DebateExporter()
+    storage = _lazy("Storage")()
+    exporter = _lazy("DebateExporter")(storage=storage)
 
-    # Handle partial session ID matching
-    sessions = Storage().list_sessions(limit=100)
-    matching = [s for s in sessions if s["session_id"].startswith(session_id)]
+    # Handle partial session ID matching (up to 5 candidates to list)
+    matching = storage.find_sessions_by_prefix(session_id, limit=5)
 
     if not matching:
         console.print(f"[red]Session not found: {session_id}[/red]")
@@ -1373,12 +1881,12 @@ def export(session_id: str, output_format: str, output_path: Optional[str]):
 
     if len(matching) > 1:
         console.print(f"[yellow]Multiple sessions match '{session_id}':[/yellow]")
-        for s in matching[:5]:
-            console.print(f"  {s['session_id']}")
+        for candidate in matching:
+            console.print(f"  {candidate}")
         console.print("Please provide a more specific session ID.")
         return
 
-    full_session_id = matching[0]["session_id"]
+    full_session_id = matching[0]
 
     # Determine output path
     if output_path is None:
@@ -1410,7 +1918,7 @@ def stats():
     - Agent agreement rates
     - Most common issue types
     """
-    storage = Storage()
+    storage = _lazy("Storage")()
     stats_data = storage.get_stats()
 
     if stats_data["total_sessions"] == 0:
@@ -1425,7 +1933,8 @@ def stats():
     ))
     console.print()
 
-    # Sessions table
+    # Sessions table. The stats tables carry explicit styles, so they are
+    # printed without running the repr highlighter over every cell.
     sessions_table = Table(title="Session Statistics", show_header=True, header_style="bold blue")
     sessions_table.add_column("Metric", style="dim")
     sessions_table.add_column("Value", justify="right")
@@ -1437,51 +1946,21 @@ def stats():
         completion_rate = stats_data["completed_sessions"] / stats_data["total_sessions"] * 100
         sessions_table.add_row("Completion Rate", f"{completion_rate:.1f}%")
 
-    console.print(sessions_table)
+    console.print(sessions_table, highlight=False)
     console.print()
 
     # Vote breakdown table
     if stats_data["vote_breakdown"]:
-        vote_table = Table(title="Vote Breakdown", show_header=True, header_style="bold blue")
-        vote_table.add_column("Decision", style="dim")
-        vote_table.add_column("Count", justify="right")
-        vote_table.add_column("Percentage", justify="right")
-
-        total_votes = sum(stats_data["vote_breakdown"].values())
-        vote_colors = {"APPROVE": "green", "REJECT": "red", "ABSTAIN": "yellow"}
-
-        for decision, count in sorted(stats_data["vote_breakdown"].items()):
-            color = vote_colors.get(decision, "white")
-            pct = count / total_votes * 100 if total_votes > 0 else 0
-            vote_table.add_row(
-                f"[{color}]{decision}[/{color}]",
-                str(count),
-                f"{pct:.1f}%"
-            )
-
-        console.print(vote_table)
+        console.print(_breakdown_table(
+            "Vote Breakdown", "Decision", stats_data["vote_breakdown"], DECISION_MARKUP,
+        ), highlight=False)
         console.print()
 
     # Agreement breakdown table
     if stats_data["agreement_breakdown"]:
-        agreement_table = Table(title="Agent Agreement Rates", show_header=True, header_style="bold blue")
-        agreement_table.add_column("Agreement Level", style="dim")
-        agreement_table.add_column("Count", justify="right")
-        agreement_table.add_column("Percentage", justify="right")
-
-        total_responses = sum(stats_data["agreement_breakdown"].values())
-        agreement_colors = {"AGREE": "green", "PARTIAL": "yellow", "DISAGREE": "red"}
-
-        for level, count in sorted(stats_data["agreement_breakdown"].items()):
-            color = agreement_colors.get(level, "white")
-            pct = count / total_responses * 100 if total_responses > 0 else 0
-            agreement_table.add_row(
-                f"[{color}]{level}[/{color}]",
-                str(count),
-                f"{pct:.1f}%"
-            )
-
-        console.print(agreement_table)
+        console.print(_breakdown_table(
+            "Agent Agreement Rates", "Agreement Level", stats_data["agreement_breakdown"], AGREEMENT_MARKUP,
+        ), highlight=False)
         console.print()
 
     # Summary insights
@@ -1572,10 +2051,9 @@ def metrics(period: str, days: int, budget: Optional[float]):
         op_table.add_column("Tokens", justify="right")
         op_table.add_column("Cost", justify="right")
 
-        op_colors = {"review": "green", "respond": "yellow", "vote": "blue", "fix": "magenta"}
         for op_name, data in sorted(summary.by_operation.items()):
             total_tokens = data["tokens_in"] + data["tokens_out"]
-            color = op_colors.get(op_name, "white")
+            color = OPERATION_COLORS.get(op_name, "white")
             op_table.add_row(
                 f"[{color}]{op_name}[/{color}]",
                 str(data["calls"]),
@@ -1818,6 +2296,7 @@ def review_batch(path: str, parallel: int, quick: bool, no_cache: bool,
     from dataclasses import dataclass
     from typing import Tuple
     import time
+    from rich.progress import Progress, SpinnerColumn, TextColumn
 
     @dataclass
     class BatchResult:
@@ -1893,7 +2372,7 @@ def review_batch(path: str, parallel: int, quick: bool, no_cache: bool,
         start_time = time.time()
 
         try:
-            code_content = file_path.read_text()
+            code_content = _read_source(file_path, max_bytes=SOURCE_MAX_BYTES)
         except Exception as e:
             return BatchResult(
                 file_path=file_path,
@@ -1912,7 +2391,7 @@ def review_batch(path: str, parallel: int, quick: bool, no_cache: bool,
             # Use a dummy console to suppress individual review output
             from io import StringIO
             quiet_console = Console(file=StringIO(), quiet=True)
-            orchestrator = DebateOrchestrator(
+            orchestrator = _lazy("DebateOrchestrator")(
                 personas=team_personas,
                 console=quiet_console,
                 use_cache=not no_cache,
@@ -2017,9 +2496,6 @@ def review_batch(path: str, parallel: int, quick: bool, no_cache: bool,
     table.add_column("Issues", justify="center")
     table.add_column("Time", justify="right")
 
-    decision_colors = {"APPROVE": "green", "REJECT": "red", "ABSTAIN": "yellow"}
-    severity_colors = {"CRITICAL": "red", "HIGH": "red", "MEDIUM": "yellow", "LOW": "green", "ERROR": "red"}
-
     total_issues = 0
     total_approve = 0
     total_reject = 0
@@ -2044,9 +2520,6 @@ def review_batch(path: str, parallel: int, quick: bool, no_cache: bool,
             )
             total_errors += 1
         else:
-            dec_color = decision_colors.get(result.decision, "dim")
-            sev_color = severity_colors.get(result.severity, "blue")
-
             # Apply min-severity filter to issue count display
             displayed_issues = result.issues_count
             if min_severity:
@@ -2055,8 +2528,8 @@ def review_batch(path: str, parallel: int, quick: bool, no_cache: bool,
 
             table.add_row(
                 str(rel_path),
-                f"[{dec_color}]{result.decision}[/{dec_color}]",
-                f"[{sev_color}]{result.severity}[/{sev_color}]",
+                DECISION_MARKUP.get(result.decision) or f"[dim]{result.decision}[/dim]",
+                SEVERITY_MARKUP.get(result.severity) or f"[blue]{result.severity}[/blue]",
                 str(displayed_issues),
                 f"{result.duration_seconds:.1f}s",
             )
@@ -2143,7 +2616,7 @@ def review_batch(path: str, parallel: int, quick: bool, no_cache: bool,
             "*Generated by [Consensys](https://github.com/noah-ing/consensys) - Multi-agent AI code review*",
         ])
 
-        report_path.write_text("\n".join(report_lines))
+        _write_text_atomic(report_path, "\n".join(report_lines))
         console.print(f"[green]Report saved to: {report_path}[/green]")
         console.print()
 
@@ -2162,6 +2635,76 @@ def review_batch(path: str, parallel: int, quick: bool, no_cache: bool,
         console.print(f"[bold green]CI Check Passed: No files with {fail_on}+ severity[/bold green]")
 
 
+def _edit_multiline(instructions: str) -> Optional[str]:
+    """Collect multi-line text in the user's editor in a single session.
+
+    Lines starting with ``#`` are treated as instructions and dropped, as
+    are blank lines at either end.
+
+    Args:
+        instructions: Text shown as comment lines at the top of the buffer
+
+    Returns:
+        The entered text, or None when not attached to a terminal, no
+        editor could be launched, or the buffer was closed without saving
+    """
+    if not sys.stdin.isatty():
+        return None
+
+    header = "".join(f"# {line}\n" for line in instructions.splitlines())
+    header += "# Lines starting with '#' are ignored. Save and close to continue.\n"
+    try:
+        text = click.edit(header)
+    except click.ClickException:
+        return None
+    if text is None:
+        return None
+
+    lines = [line for line in text.splitlines() if not line.startswith("#")]
+    return "\n".join(lines).strip("\n") or None
+
+
+def _prompt_system_prompt() -> str:
+    """Read a system prompt line by line until a blank line.
+
+    Returns:
+        The entered lines joined with newlines (at least one line)
+    """
+    system_lines = []
+    while True:
+        line = click.prompt("", default="", show_default=False)
+        if line == "":
+            if system_lines:
+                break
+            console.print("[yellow]Please enter at least one line.[/yellow]")
+            continue
+        system_lines.append(line)
+
+    return "\n".join(system_lines)
+
+
+def _prompt_priorities() -> List[str]:
+    """Read up to five priorities one per prompt until a blank line.
+
+    Returns:
+        The entered priorities (at least one)
+    """
+    priorities = []
+    while True:
+        priority = click.prompt(f"Priority {len(priorities) + 1}", default="", show_default=False)
+        if priority == "":
+            if len(priorities) >= 1:
+                break
+            console.print("[yellow]Please enter at least one priority.[/yellow]")
+            continue
+        priorities.append(priority)
+        if len(priorities) >= 5:
+            console.print("[dim]Maximum 5 priorities reached.[/dim]")
+            break
+
+    return priorities
+
+
 @cli.command("add-persona")
 @click.option("--name", "-n", prompt="Persona name", help="Unique name for the persona (e.g., DatabaseExpert)")
 @click.option("--role", "-r", prompt="Role", help="Role title (e.g., Database Administrator)")
@@ -2197,42 +2740,36 @@ def add_persona(name: str, role: str, style: str):
     ))
     console.print()
 
-    # Get system prompt (multi-line)
+    # Get system prompt (multi-line), in one editor session when possible
     console.print("[bold]System Prompt[/bold]")
-    console.print("[dim]Describe this persona's expertise, focus areas, and review approach.")
-    console.print("This will be used as the AI's system prompt. Enter a blank line to finish.[/dim]")
-    console.print()
+    console.print("[dim]Describe this persona's expertise, focus areas, and review approach.[/dim]")
+    console.print("[dim]This will be used as the AI's system prompt.[/dim]")
 
-    system_lines = []
-    while True:
-        line = click.prompt("", default="", show_default=False)
-        if line == "":
-            if system_lines:
-                break
-            console.print("[yellow]Please enter at least one line.[/yellow]")
-            continue
-        system_lines.append(line)
+    system_prompt = _edit_multiline(
+        f"System prompt for the {name} persona: its expertise, focus areas,\n"
+        "and review approach."
+    )
 
-    system_prompt = "\n".join(system_lines)
+    if not system_prompt:
+        console.print("[dim]Enter a blank line to finish.[/dim]")
+        console.print()
+        system_prompt = _prompt_system_prompt()
 
     # Get priorities
     console.print()
     console.print("[bold]Priorities[/bold]")
-    console.print("[dim]Enter 3-5 focus areas, one per line. Enter a blank line to finish.[/dim]")
-    console.print()
+    console.print("[dim]Enter 3-5 focus areas, one per line.[/dim]")
 
-    priorities = []
-    while True:
-        priority = click.prompt(f"Priority {len(priorities) + 1}", default="", show_default=False)
-        if priority == "":
-            if len(priorities) >= 1:
-                break
-            console.print("[yellow]Please enter at least one priority.[/yellow]")
-            continue
-        priorities.append(priority)
-        if len(priorities) >= 5:
-            console.print("[dim]Maximum 5 priorities reached.[/dim]")
-            break
+    edited = _edit_multiline(f"Focus areas for the {name} persona, one per line (3-5).")
+    priorities = [line.strip() for line in (edited or "").splitlines() if line.strip()]
+    if len(priorities) > 5:
+        console.print("[dim]Maximum 5 priorities; keeping the first 5.[/dim]")
+        priorities = priorities[:5]
+
+    if not priorities:
+        console.print("[dim]Enter a blank line to finish.[/dim]")
+        console.print()
+        priorities = _prompt_priorities()
 
     # Create and save the persona
     persona = Persona(
@@ -2300,25 +2837,24 @@ def set_team(personas: tuple, preset: Optional[str]):
             console.print(f"  - {name}: {info['description']}")
         return
 
-    # Match persona names (partial matching)
+    # Match persona names (partial matching) against a lowercase index,
+    # keeping the first name for any case-insensitive duplicates
     all_names = list_all_persona_names()
+    names_by_lower: Dict[str, str] = {}
+    for name in all_names:
+        names_by_lower.setdefault(name.lower(), name)
     matched_personas = []
     not_found = []
 
     for search in personas:
         search_lower = search.lower()
-        # Try exact match first
-        found = None
-        for name in all_names:
-            if name.lower() == search_lower:
-                found = name
-                break
-        # Try partial match
+        # Try exact match first, then partial match
+        found = names_by_lower.get(search_lower)
         if not found:
-            for name in all_names:
-                if search_lower in name.lower():
-                    found = name
-                    break
+            found = next(
+                (name for lower, name in names_by_lower.items() if search_lower in lower),
+                None,
+            )
         if found:
             if found not in matched_personas:
                 matched_personas.append(found)
@@ -2381,7 +2917,7 @@ def teams():
             ", ".join(info["personas"]),
         )
 
-    console.print(preset_table)
+    console.print(preset_table, highlight=False)
     console.print()
 
     # Built-in personas
@@ -2398,7 +2934,7 @@ def teams():
             persona.review_style,
         )
 
-    console.print(builtin_table)
+    console.print(builtin_table, highlight=False)
     console.print()
 
     # Custom personas
@@ -2416,7 +2952,7 @@ def teams():
                 persona.review_style,
             )
 
-        console.print(custom_table)
+        console.print(custom_table, highlight=False)
         console.print()
 
     console.print("[dim]Use 'consensys set-team --preset <name>' to select a preset.[/dim]")
@@ -2443,19 +2979,23 @@ def install_hooks(git: bool, claude: bool):
 
     results = do_install(git_hooks=git, claude_code_hooks=claude)
 
+    # Collect the report and print it in one pass
+    lines = []
     for hook_name, success in results.items():
         if success:
-            console.print(f"  [green]✓[/green] {hook_name} installed")
+            lines.append(f"  [green]✓[/green] {hook_name} installed")
         else:
-            console.print(f"  [red]✗[/red] {hook_name} failed")
+            lines.append(f"  [red]✗[/red] {hook_name} failed")
 
-    console.print()
+    lines.append("")
 
     # Show status
     status = get_hook_status()
     for hook_name, info in status.items():
         if info["installed"]:
-            console.print(f"[dim]{hook_name}: {info['path']}[/dim]")
+            lines.append(f"[dim]{hook_name}: {info['path']}[/dim]")
+
+    console.print(Group(*(console.render_str(line) for line in lines)))
 
 
 @cli.command("uninstall-hooks")
@@ -2470,11 +3010,15 @@ def uninstall_hooks(git: bool, claude: bool):
 
     results = do_uninstall(git_hooks=git, claude_code_hooks=claude)
 
+    # Collect the report and print it in one pass
+    lines = []
     for hook_name, success in results.items():
         if success:
-            console.print(f"  [green]✓[/green] {hook_name} uninstalled")
+            lines.append(f"  [green]✓[/green] {hook_name} uninstalled")
         else:
-            console.print(f"  [yellow]![/yellow] {hook_name} not found or failed")
+            lines.append(f"  [yellow]![/yellow] {hook_name} not found or failed")
+
+    console.print(Group(*(console.render_str(line) for line in lines)))
 
 
 @cli.command("hook-status")
@@ -2497,7 +3041,7 @@ def hook_status():
             info["path"] or "-"
         )
 
-    console.print(table)
+    console.print(table, highlight=False)
 
 
 @cli.group()
@@ -2877,19 +3421,18 @@ def predict_resolve(prediction_id: str, outcome: str, link: str):
     prediction = market.get_prediction(prediction_id)
 
     if not prediction:
-        # Try partial match
+        # Try partial match (up to 5 candidates to list)
         from src.predictions.storage import PredictionStorage
         storage = PredictionStorage()
-        all_preds = storage.list_predictions(resolved=False, limit=100)
-        matches = [p for p in all_preds if p.prediction_id.startswith(prediction_id)]
+        matches = storage.resolve_prediction_id(prediction_id, limit=5)
 
         if len(matches) == 1:
-            prediction = matches[0]
-            prediction_id = prediction.prediction_id
+            prediction_id = matches[0][0]
+            prediction = storage.get_prediction(prediction_id)
         elif len(matches) > 1:
             console.print(f"[yellow]Multiple predictions match '{prediction_id}':[/yellow]")
-            for p in matches[:5]:
-                console.print(f"  {p.prediction_id[:12]}... - {p.file_path}")
+            for match_id, file_path in matches:
+                console.print(f"  {match_id[:12]}... - {file_path}")
             console.print("[dim]Please provide a longer ID prefix[/dim]")
             return
         else:
@@ -3161,7 +3704,7 @@ def fingerprint(directory: str, output: Optional[str], verbose: bool):
     output_path = Path(output) if output else Path(".consensys-dna.json")
 
     try:
-        output_path.write_text(fingerprint_result.to_json())
+        _write_text_atomic(output_path, fingerprint_result.to_json())
         console.print()
         console.print(f"[green]Fingerprint saved to: {output_path}[/green]")
         console.print()
@@ -1,4 +1,4 @@
 # Database storage
-from src.db.storage import Storage
+from src.db.storage import FullSession, Storage
 
-__all__ = ["Storage"]
+__all__ = ["FullSession", "Storage"]
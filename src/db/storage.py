@@ -1,8 +1,11 @@
 """SQLite storage for reviews, responses, and votes."""
 import sqlite3
 import json
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 
 from src.config import DATABASE_PATH
@@ -16,6 +19,53 @@ from src.models.review import (
 )
 
 
+@dataclass
+class FullSession:
+    """A session row together with all of its debate artifacts."""
+    session: Dict[str, Any]
+    reviews: List[Review] = field(default_factory=list)
+    responses: List[Response] = field(default_factory=list)
+    votes: List[Vote] = field(default_factory=list)
+    consensus: Optional[Consensus] = None
+
+
+# Long-lived connections shared by every Storage in a thread, keyed by database
+# path. Debates save from worker threads and a sqlite3 connection must stay on
+# the thread that opened it, so each thread keeps its own set.
+_thread_connections = threading.local()
+
+# Database files whose schema has been created or checked in this process
+_initialized_paths: set = set()
+_init_lock = threading.Lock()
+
+
+def _batching_paths() -> set:
+    """Database paths with an open transaction() on the calling thread."""
+    paths = getattr(_thread_connections, "batching", None)
+    if paths is None:
+        paths = _thread_connections.batching = set()
+    return paths
+
+
+def prefix_range(column: str, prefix: str) -> Tuple[str, tuple]:
+    """Build a WHERE clause matching values of a column that start with prefix.
+
+    The half-open range [prefix, prefix with its last character bumped) is
+    an index range scan on the column, with no per-row pattern match, and
+    treats LIKE wildcards in the prefix literally.
+
+    Args:
+        column: Indexed column to match (a trusted identifier, not user input)
+        prefix: Leading characters to match; empty matches every row
+
+    Returns:
+        Tuple of (SQL condition, its parameters)
+    """
+    if not prefix:
+        return "1", ()
+    return f"{column} >= ? AND {column} < ?", (prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1))
+
+
 class Storage:
     """SQLite storage for debate history."""
 
@@ -26,20 +76,94 @@ class Storage:
             db_path: Path to SQLite database. Defaults to DATABASE_PATH from config.
         """
         self.db_path = db_path or DATABASE_PATH
-        self._init_db()
+        self._key = str(self.db_path)
+        # (change probe, stats) from the last get_stats call
+        self._stats_cache: Optional[tuple] = None
+        # Creating tables is idempotent, so the lock only prevents duplicate work
+        with _init_lock:
+            missing = not Path(self._key).exists()
+            if missing:
+                # A cached connection would still point at the deleted file
+                self.close()
+            if self._key not in _initialized_paths or missing:
+                self._init_db()
+                _initialized_paths.add(self._key)
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
+        """Get this thread's connection to the database, opening it on first use.
+
+        The connection is shared with other Storage instances for the same
+        path in this thread, so prepared statements stay in sqlite3's
+        per-connection cache across calls and instances. Methods use the
+        connection as a context manager, which commits on success and rolls
+        back on error, so it is safe to keep open.
+        """
+        connections = getattr(_thread_connections, "by_path", None)
+        if connections is None:
+            connections = _thread_connections.by_path = {}
+        conn = connections.get(self._key)
+        if conn is None:
+            conn = sqlite3.connect(self._key)
+            conn.row_factory = sqlite3.Row
+            # Per-connection settings; WAL makes NORMAL sync durable enough
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+            connections[self._key] = conn
         return conn
 
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Yield this thread's connection for one operation.
+
+        Commits on success and rolls back on error, unless the operation runs
+        inside transaction(), which then owns the commit.
+        """
+        conn = self._get_connection()
+        if self._key in _batching_paths():
+            yield conn
+        else:
+            with conn:
+                yield conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group several writes into a single commit.
+
+        Saves made by any Storage for this database on this thread inside
+        the block are committed together at the end (one fsync instead of
+        one per row), or rolled back together if the block raises. Nested
+        transaction() blocks join the outermost one.
+        """
+        batching = _batching_paths()
+        if self._key in batching:
+            yield
+            return
+        conn = self._get_connection()
+        batching.add(self._key)
+        try:
+            with conn:
+                yield
+        finally:
+            batching.discard(self._key)
+
+    def close(self):
+        """Close the calling thread's connection to this database, if open."""
+        connections = getattr(_thread_connections, "by_path", {})
+        conn = connections.pop(self._key, None)
+        if conn is not None:
+            conn.close()
+
     def _init_db(self):
         """Initialize database tables."""
         conn = self._get_connection()
-        try:
+        with conn:
             cursor = conn.cursor()
 
+            # WAL lets readers (history/replay) run alongside a writing review;
+            # the mode is persistent, so it only needs setting on the file once
+            cursor.execute("PRAGMA journal_mode=WAL")
+
             # Sessions table - tracks each review session
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS sessions (
@@ -123,10 +247,12 @@ class Storage:
                 CREATE INDEX IF NOT EXISTS idx_votes_session
                 ON votes(session_id)
             """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_sessions_created
+                ON sessions(created_at)
+            """)
 
             conn.commit()
-        finally:
-            conn.close()
 
     # Session operations
     def create_session(self, code: str, context: Optional[str] = None) -> str:
@@ -140,8 +266,7 @@ class Storage:
             The session ID
         """
         session_id = create_session_id()
-        conn = self._get_connection()
-        try:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -150,10 +275,7 @@ class Storage:
                 """,
                 (session_id, code, context, datetime.now().isoformat())
             )
-            conn.commit()
             return session_id
-        finally:
-            conn.close()
 
     def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get session details by ID.
@@ -164,8 +286,7 @@ class Storage:
         Returns:
             Session dict or None if not found
         """
-        conn = self._get_connection()
-        try:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT * FROM sessions WHERE session_id = ?",
@@ -175,32 +296,107 @@ class Storage:
             if row:
                 return dict(row)
             return None
-        finally:
-            conn.close()
 
-    def list_sessions(self, limit: int = 50) -> List[Dict[str, Any]]:
+    def list_sessions(self, limit: int = 50, before: Optional[str] = None) -> List[Dict[str, Any]]:
         """List recent sessions.
 
         Args:
             limit: Maximum number of sessions to return
+            before: If set, only sessions created strictly before this
+                created_at value are returned (keyset pagination cursor)
 
         Returns:
             List of session dicts
         """
-        conn = self._get_connection()
-        try:
+        where, params = "", []
+        if before is not None:
+            where = "WHERE created_at < ?"
+            params.append(before)
+        params.append(limit)
+
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                """
+                f"""
                 SELECT * FROM sessions
+                {where}
                 ORDER BY created_at DESC
                 LIMIT ?
                 """,
-                (limit,)
+                params
             )
             return [dict(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
+
+    def list_sessions_preview(
+        self,
+        limit: int = 50,
+        width: int = 40,
+        before: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """List recent sessions with only the columns a history table needs.
+
+        The code preview is truncated (with a trailing "...") and flattened to
+        one line in SQL, so full code snippets never leave the database.
+
+        Args:
+            limit: Maximum number of sessions to return
+            width: Maximum preview length, including the "..." suffix
+            before: If set, only sessions created strictly before this
+                created_at value are returned (keyset pagination cursor)
+
+        Returns:
+            List of dicts with session_id, created_at, created_at_short
+            ("YYYY-MM-DD HH:MM"), final_decision and preview keys
+        """
+        where, params = "", [width, width - 3]
+        if before is not None:
+            where = "WHERE created_at < ?"
+            params.append(before)
+        params.append(limit)
+
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""
+                SELECT session_id, created_at, final_decision,
+                       strftime('%Y-%m-%d %H:%M', created_at) AS created_at_short,
+                       replace(
+                           CASE WHEN length(code_snippet) > ?
+                                THEN substr(code_snippet, 1, ?) || '...'
+                                ELSE code_snippet END,
+                           char(10), ' '
+                       ) AS preview
+                FROM sessions
+                {where}
+                ORDER BY created_at DESC
+                LIMIT ?
+                """,
+                params
+            )
+            return [dict(row) for row in cursor.fetchall()]
+
+    def find_sessions_by_prefix(self, prefix: str, limit: int = 5) -> List[str]:
+        """Find the IDs of sessions whose ID starts with a prefix.
+
+        Matches come back in ID order, which is the primary key's index
+        order, so SQLite stops after ``limit`` index entries without reading
+        or sorting the rest, and no session rows are loaded. A limit of two
+        is enough to tell a unique prefix from an ambiguous one.
+
+        Args:
+            prefix: Leading characters of the session ID
+            limit: Maximum number of IDs to return
+
+        Returns:
+            Matching session IDs (at most ``limit``), in ID order
+        """
+        where, params = prefix_range("session_id", prefix)
+        with self._connect() as conn:
+            cursor = conn.execute(
+                f"SELECT session_id FROM sessions WHERE {where} ORDER BY session_id LIMIT ?",
+                (*params, limit),
+            )
+            return [row[0] for row in cursor.fetchall()]
 
     # Review operations
     def save_review(self, review: Review, session_id: str) -> int:
@@ -213,8 +409,7 @@ class Storage:
         Returns:
             The review ID
         """
-        conn = self._get_connection()
-        try:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -233,10 +428,7 @@ class Storage:
                     (review.timestamp or datetime.now()).isoformat()
                 )
             )
-            conn.commit()
             return cursor.lastrowid
-        finally:
-            conn.close()
 
     def get_reviews(self, session_id: str) -> List[Review]:
         """Get all reviews for a session.
@@ -247,28 +439,29 @@ class Storage:
         Returns:
             List of Review objects
         """
-        conn = self._get_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM reviews WHERE session_id = ? ORDER BY created_at",
-                (session_id,)
-            )
-            reviews = []
-            for row in cursor.fetchall():
-                reviews.append(Review(
-                    agent_name=row["agent_name"],
-                    issues=json.loads(row["issues"]),
-                    suggestions=json.loads(row["suggestions"]),
-                    severity=row["severity"],
-                    confidence=row["confidence"],
-                    summary=row["summary"] or "",
-                    session_id=row["session_id"],
-                    timestamp=datetime.fromisoformat(row["created_at"])
-                ))
-            return reviews
-        finally:
-            conn.close()
+        with self._connect() as conn:
+            return self._fetch_reviews(conn.cursor(), session_id)
+
+    @staticmethod
+    def _fetch_reviews(cursor: sqlite3.Cursor, session_id: str) -> List[Review]:
+        """Load a session's reviews using an existing cursor."""
+        cursor.execute(
+            "SELECT * FROM reviews WHERE session_id = ? ORDER BY created_at",
+            (session_id,)
+        )
+        reviews = []
+        for row in cursor.fetchall():
+            reviews.append(Review(
+                agent_name=row["agent_name"],
+                issues=json.loads(row["issues"]),
+                suggestions=json.loads(row["suggestions"]),
+                severity=row["severity"],
+                confidence=row["confidence"],
+                summary=row["summary"] or "",
+                session_id=row["session_id"],
+                timestamp=datetime.fromisoformat(row["created_at"])
+            ))
+        return reviews
 
     # Response operations
     def save_response(self, response: Response, session_id: str) -> int:
@@ -281,8 +474,7 @@ class Storage:
         Returns:
             The response ID
         """
-        conn = self._get_connection()
-        try:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -300,10 +492,7 @@ class Storage:
                     (response.timestamp or datetime.now()).isoformat()
                 )
             )
-            conn.commit()
             return cursor.lastrowid
-        finally:
-            conn.close()
 
     def get_responses(self, session_id: str) -> List[Response]:
         """Get all responses for a session.
@@ -314,27 +503,28 @@ class Storage:
         Returns:
             List of Response objects
         """
-        conn = self._get_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM responses WHERE session_id = ? ORDER BY created_at",
-                (session_id,)
-            )
-            responses = []
-            for row in cursor.fetchall():
-                responses.append(Response(
-                    agent_name=row["agent_name"],
-                    responding_to=row["responding_to"],
-                    agreement_level=row["agreement_level"],
-                    points=json.loads(row["points"]),
-                    summary=row["summary"] or "",
-                    session_id=row["session_id"],
-                    timestamp=datetime.fromisoformat(row["created_at"])
-                ))
-            return responses
-        finally:
-            conn.close()
+        with self._connect() as conn:
+            return self._fetch_responses(conn.cursor(), session_id)
+
+    @staticmethod
+    def _fetch_responses(cursor: sqlite3.Cursor, session_id: str) -> List[Response]:
+        """Load a session's responses using an existing cursor."""
+        cursor.execute(
+            "SELECT * FROM responses WHERE session_id = ? ORDER BY created_at",
+            (session_id,)
+        )
+        responses = []
+        for row in cursor.fetchall():
+            responses.append(Response(
+                agent_name=row["agent_name"],
+                responding_to=row["responding_to"],
+                agreement_level=row["agreement_level"],
+                points=json.loads(row["points"]),
+                summary=row["summary"] or "",
+                session_id=row["session_id"],
+                timestamp=datetime.fromisoformat(row["created_at"])
+            ))
+        return responses
 
     # Vote operations
     def save_vote(self, vote: Vote, session_id: str) -> int:
@@ -347,11 +537,10 @@ class Storage:
         Returns:
             The vote ID
         """
-        conn = self._get_connection()
-        try:
+        with self._connect() as conn:
             cursor = conn.cursor()
             # Store decision as string value
-            decision_str = vote.decision.value if isinstance(vote.decision, VoteDecision) else vote.decision
+            decision_str = vote.decision.value
             cursor.execute(
                 """
                 INSERT INTO votes
@@ -366,10 +555,7 @@ class Storage:
                     (vote.timestamp or datetime.now()).isoformat()
                 )
             )
-            conn.commit()
             return cursor.lastrowid
-        finally:
-            conn.close()
 
     def get_votes(self, session_id: str) -> List[Vote]:
         """Get all votes for a session.
@@ -380,29 +566,30 @@ class Storage:
         Returns:
             List of Vote objects
         """
-        conn = self._get_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM votes WHERE session_id = ? ORDER BY created_at",
-                (session_id,)
-            )
-            votes = []
-            for row in cursor.fetchall():
-                try:
-                    decision = VoteDecision(row["decision"])
-                except ValueError:
-                    decision = VoteDecision.ABSTAIN
-                votes.append(Vote(
-                    agent_name=row["agent_name"],
-                    decision=decision,
-                    reasoning=row["reasoning"] or "",
-                    session_id=row["session_id"],
-                    timestamp=datetime.fromisoformat(row["created_at"])
-                ))
-            return votes
-        finally:
-            conn.close()
+        with self._connect() as conn:
+            return self._fetch_votes(conn.cursor(), session_id)
+
+    @staticmethod
+    def _fetch_votes(cursor: sqlite3.Cursor, session_id: str) -> List[Vote]:
+        """Load a session's votes using an existing cursor."""
+        cursor.execute(
+            "SELECT * FROM votes WHERE session_id = ? ORDER BY created_at",
+            (session_id,)
+        )
+        votes = []
+        for row in cursor.fetchall():
+            try:
+                decision = VoteDecision(row["decision"])
+            except ValueError:
+                decision = VoteDecision.ABSTAIN
+            votes.append(Vote(
+                agent_name=row["agent_name"],
+                decision=decision,
+                reasoning=row["reasoning"] or "",
+                session_id=row["session_id"],
+                timestamp=datetime.fromisoformat(row["created_at"])
+            ))
+        return votes
 
     # Consensus operations
     def save_consensus(self, consensus: Consensus) -> int:
@@ -414,12 +601,9 @@ class Storage:
         Returns:
             The consensus ID
         """
-        conn = self._get_connection()
-        try:
+        with self._connect() as conn:
             cursor = conn.cursor()
-            decision_str = consensus.final_decision.value if isinstance(
-                consensus.final_decision, VoteDecision
-            ) else consensus.final_decision
+            decision_str = consensus.final_decision.value
             cursor.execute(
                 """
                 INSERT INTO consensus
@@ -444,10 +628,7 @@ class Storage:
                 """,
                 (decision_str, datetime.now().isoformat(), consensus.session_id)
             )
-            conn.commit()
             return cursor.lastrowid
-        finally:
-            conn.close()
 
     def get_consensus(self, session_id: str) -> Optional[Consensus]:
         """Get consensus for a session.
@@ -458,58 +639,125 @@ class Storage:
         Returns:
             Consensus object or None if not found
         """
-        conn = self._get_connection()
-        try:
+        with self._connect() as conn:
             cursor = conn.cursor()
+            # Get the session to get code and context
             cursor.execute(
-                "SELECT * FROM consensus WHERE session_id = ?",
+                "SELECT * FROM sessions WHERE session_id = ?",
                 (session_id,)
             )
             row = cursor.fetchone()
-            if not row:
-                return None
+            session = dict(row) if row else None
+            return self._fetch_consensus(cursor, session_id, session)
 
-            # Get the session to get code and context
-            session = self.get_session(session_id)
+    @staticmethod
+    def _fetch_consensus(
+        cursor: sqlite3.Cursor,
+        session_id: str,
+        session: Optional[Dict[str, Any]]
+    ) -> Optional[Consensus]:
+        """Load a session's consensus using an existing cursor.
 
-            try:
-                decision = VoteDecision(row["final_decision"])
-            except ValueError:
-                decision = VoteDecision.ABSTAIN
+        Args:
+            cursor: Open cursor to run the query on
+            session_id: The session ID
+            session: The session row, supplying code and context
+        """
+        cursor.execute(
+            "SELECT * FROM consensus WHERE session_id = ?",
+            (session_id,)
+        )
+        row = cursor.fetchone()
+        if not row:
+            return None
 
-            return Consensus(
-                final_decision=decision,
-                vote_counts=json.loads(row["vote_counts"]),
-                key_issues=json.loads(row["key_issues"]),
-                accepted_suggestions=json.loads(row["accepted_suggestions"]),
-                session_id=row["session_id"],
-                code_snippet=session["code_snippet"] if session else "",
-                context=session["context"] if session else None,
-                timestamp=datetime.fromisoformat(row["created_at"])
+        try:
+            decision = VoteDecision(row["final_decision"])
+        except ValueError:
+            decision = VoteDecision.ABSTAIN
+
+        return Consensus(
+            final_decision=decision,
+            vote_counts=json.loads(row["vote_counts"]),
+            key_issues=json.loads(row["key_issues"]),
+            accepted_suggestions=json.loads(row["accepted_suggestions"]),
+            session_id=row["session_id"],
+            code_snippet=session["code_snippet"] if session else "",
+            context=session["context"] if session else None,
+            timestamp=datetime.fromisoformat(row["created_at"])
+        )
+
+    def get_full_session(self, session_id: str) -> Optional[FullSession]:
+        """Load a session and all of its debate artifacts in one go.
+
+        Uses a single connection and read transaction instead of one
+        connection per artifact type, so the snapshot is consistent.
+
+        Args:
+            session_id: The session ID
+
+        Returns:
+            FullSession, or None if the session does not exist. The session
+            dict also has a created_at_full ("YYYY-MM-DD HH:MM:SS") display column.
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            # Inside transaction() the open write transaction already gives
+            # a consistent view, and a second BEGIN would fail
+            if not conn.in_transaction:
+                cursor.execute("BEGIN")
+            cursor.execute(
+                """
+                SELECT *, strftime('%Y-%m-%d %H:%M:%S', created_at) AS created_at_full
+                FROM sessions WHERE session_id = ?
+                """,
+                (session_id,)
+            )
+            row = cursor.fetchone()
+            if not row:
+                return None
+            session = dict(row)
+            return FullSession(
+                session=session,
+                reviews=self._fetch_reviews(cursor, session_id),
+                responses=self._fetch_responses(cursor, session_id),
+                votes=self._fetch_votes(cursor, session_id),
+                consensus=self._fetch_consensus(cursor, session_id, session),
             )
-        finally:
-            conn.close()
 
     # Stats operations
     def get_stats(self) -> Dict[str, Any]:
         """Get aggregate statistics across all sessions.
 
+        The result is cached on this instance and reused until a cheap probe
+        (the highest rowid of each table) shows new rows. Rows are only ever
+        inserted, and a session completes by inserting its consensus, so the
+        probe changes whenever the statistics could.
+
         Returns:
             Dict with statistics
         """
-        conn = self._get_connection()
-        try:
+        with self._connect() as conn:
             cursor = conn.cursor()
 
-            # Total sessions
-            cursor.execute("SELECT COUNT(*) as count FROM sessions")
-            total_sessions = cursor.fetchone()["count"]
+            cursor.execute(
+                """
+                SELECT (SELECT MAX(rowid) FROM sessions),
+                       (SELECT MAX(rowid) FROM responses),
+                       (SELECT MAX(rowid) FROM votes),
+                       (SELECT MAX(rowid) FROM consensus)
+                """
+            )
+            probe = tuple(cursor.fetchone())
+            if self._stats_cache is not None and self._stats_cache[0] == probe:
+                return self._copy_stats(self._stats_cache[1])
 
-            # Completed sessions
+            # Total and completed sessions in one pass
             cursor.execute(
-                "SELECT COUNT(*) as count FROM sessions WHERE completed_at IS NOT NULL"
+                "SELECT COUNT(*) AS total, COUNT(completed_at) AS completed FROM sessions"
             )
-            completed_sessions = cursor.fetchone()["count"]
+            row = cursor.fetchone()
+            total_sessions, completed_sessions = row["total"], row["completed"]
 
             # Vote breakdown
             cursor.execute(
@@ -533,11 +781,20 @@ class Storage:
                 row["agreement_level"]: row["count"] for row in cursor.fetchall()
             }
 
-            return {
+            stats = {
                 "total_sessions": total_sessions,
                 "completed_sessions": completed_sessions,
                 "vote_breakdown": vote_breakdown,
                 "agreement_breakdown": agreement_breakdown,
             }
-        finally:
-            conn.close()
+            self._stats_cache = (probe, stats)
+            return self._copy_stats(stats)
+
+    @staticmethod
+    def _copy_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a stats dict so callers cannot mutate the cached one."""
+        return {
+            **stats,
+            "vote_breakdown": dict(stats["vote_breakdown"]),
+            "agreement_breakdown": dict(stats["agreement_breakdown"]),
+        }
@@ -0,0 +1,7 @@
+"""Terminal color names shared by the CLI and the debate orchestrator."""
+from typing import Dict
+
+# Rich color names keyed by the values they highlight
+SEVERITY_COLORS: Dict[str, str] = {"CRITICAL": "red", "HIGH": "red", "MEDIUM": "yellow", "LOW": "green", "ERROR": "red"}
+DECISION_COLORS: Dict[str, str] = {"APPROVE": "green", "REJECT": "red", "ABSTAIN": "yellow"}
+AGREEMENT_COLORS: Dict[str, str] = {"AGREE": "green", "PARTIAL": "yellow", "DISAGREE": "red"}
@@ -2,11 +2,11 @@
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional
 import html
 
 from src.db.storage import Storage
-from src.models.review import Review, Response, Vote, Consensus, VoteDecision
+from src.models.review import Review, Response, Vote, Consensus
 
 
 @dataclass
@@ -39,9 +39,8 @@ class DebateExporter:
         Returns:
             DebateData or None if not found
         """
-        # Handle partial session ID matching
-        sessions = self.storage.list_sessions(limit=100)
-        matching = [s for s in sessions if s["session_id"].startswith(session_id)]
+        # Handle partial session ID matching; two matches mean ambiguous
+        matching = self.storage.find_sessions_by_prefix(session_id, limit=2)
 
         if not matching:
             return None
@@ -50,22 +49,23 @@ class DebateExporter:
             # Return None for ambiguous matches
             return None
 
-        full_session_id = matching[0]["session_id"]
-        session = self.storage.get_session(full_session_id)
+        full_session_id = matching[0]
+        full = self.storage.get_full_session(full_session_id)
 
-        if not session:
+        if not full:
             return None
 
+        session = full.session
         return DebateData(
             session_id=full_session_id,
             code=session["code_snippet"],
             context=session.get("context"),
             created_at=session["created_at"],
             final_decision=session.get("final_decision"),
-            reviews=self.storage.get_reviews(full_session_id),
-            responses=self.storage.get_responses(full_session_id),
-            votes=self.storage.get_votes(full_session_id),
-            consensus=self.storage.get_consensus(full_session_id),
+            reviews=full.reviews,
+            responses=full.responses,
+            votes=full.votes,
+            consensus=full.consensus,
         )
 
     def to_markdown(self, session_id: str) -> Optional[str]:
@@ -101,6 +101,9 @@ class DebateExporter:
     def save_markdown(self, session_id: str, output_path: Path) -> bool:
         """Export debate to markdown file.
 
+        The document is written line by line as it is generated, so the
+        full markdown string is never held in memory.
+
         Args:
             session_id: The session ID
             output_path: Path to save the file
@@ -108,15 +111,19 @@ class DebateExporter:
         Returns:
             True if successful
         """
-        content = self.to_markdown(session_id)
-        if not content:
+        debate = self.load_debate(session_id)
+        if not debate:
             return False
-        output_path.write_text(content)
+        with output_path.open("w", encoding="utf-8") as f:
+            _write_chunks(f, _iter_markdown(debate), separator="\n")
         return True
 
     def save_html(self, session_id: str, output_path: Path) -> bool:
         """Export debate to HTML file.
 
+        The document is written chunk by chunk as it is generated, so the
+        full HTML string is never held in memory.
+
         Args:
             session_id: The session ID
             output_path: Path to save the file
@@ -124,180 +131,197 @@ class DebateExporter:
         Returns:
             True if successful
         """
-        content = self.to_html(session_id)
-        if not content:
+        debate = self.load_debate(session_id)
+        if not debate:
             return False
-        output_path.write_text(content)
+        with output_path.open("w", encoding="utf-8") as f:
+            _write_chunks(f, _iter_html(debate))
         return True
 
 
+def _write_chunks(writer: IO[str], chunks: Iterable[str], separator: str = "") -> None:
+    """Write chunks to a text stream, equivalent to writing separator.join(chunks).
+
+    Args:
+        writer: Open text file (or any object with write())
+        chunks: Text pieces in order
+        separator: String written between consecutive chunks
+    """
+    first = True
+    for chunk in chunks:
+        if not first and separator:
+            writer.write(separator)
+        writer.write(chunk)
+        first = False
+
+
 def _generate_markdown(debate: DebateData) -> str:
     """Generate markdown representation of a debate."""
-    lines = []
+    return "\n".join(_iter_markdown(debate))
+
 
+def _iter_markdown(debate: DebateData) -> Iterator[str]:
+    """Yield the lines of a debate's markdown representation (without newlines)."""
     # Header
-    lines.append("# Consensus Code Review")
-    lines.append("")
-    lines.append(f"**Session ID:** `{debate.session_id}`")
-    lines.append(f"**Date:** {debate.created_at[:19].replace('T', ' ')}")
+    yield "# Consensus Code Review"
+    yield ""
+    yield f"**Session ID:** `{debate.session_id}`"
+    yield f"**Date:** {debate.created_at[:19].replace('T', ' ')}"
     if debate.final_decision:
-        lines.append(f"**Final Decision:** {debate.final_decision}")
-    lines.append("")
+        yield f"**Final Decision:** {debate.final_decision}"
+    yield ""
 
     # Code
-    lines.append("## Code Under Review")
-    lines.append("")
-    lines.append("```python")
-    lines.append(debate.code)
-    lines.append("```")
-    lines.append("")
+    yield "## Code Under Review"
+    yield ""
+    yield "```python"
+    yield debate.code
+    yield "```"
+    yield ""
 
     if debate.context:
-        lines.append(f"**Context:** {debate.context}")
-        lines.append("")
+        yield f"**Context:** {debate.context}"
+        yield ""
 
     # Reviews
     if debate.reviews:
-        lines.append("## Round 1: Initial Reviews")
-        lines.append("")
+        yield "## Round 1: Initial Reviews"
+        yield ""
 
         for review in debate.reviews:
-            lines.append(f"### {review.agent_name}")
-            lines.append("")
-            lines.append(f"**Severity:** {review.severity} | **Confidence:** {review.confidence:.0%}")
-            lines.append("")
+            yield f"### {review.agent_name}"
+            yield ""
+            yield f"**Severity:** {review.severity} | **Confidence:** {review.confidence:.0%}"
+            yield ""
 
             if review.issues:
-                lines.append("**Issues:**")
+                yield "**Issues:**"
                 for issue in review.issues:
                     desc = issue.get("description", str(issue))
                     sev = issue.get("severity", "LOW")
-                    lines.append(f"- [{sev}] {desc}")
-                lines.append("")
+                    yield f"- [{sev}] {desc}"
+                yield ""
 
             if review.suggestions:
-                lines.append("**Suggestions:**")
+                yield "**Suggestions:**"
                 for suggestion in review.suggestions:
-                    lines.append(f"- {suggestion}")
-                lines.append("")
+                    yield f"- {suggestion}"
+                yield ""
 
             if review.summary:
-                lines.append(f"**Summary:** {review.summary}")
-                lines.append("")
+                yield f"**Summary:** {review.summary}"
+                yield ""
 
-            lines.append("---")
-            lines.append("")
+            yield "---"
+            yield ""
 
     # Responses
     if debate.responses:
-        lines.append("## Round 2: Debate Responses")
-        lines.append("")
+        yield "## Round 2: Debate Responses"
+        yield ""
 
         for response in debate.responses:
-            lines.append(f"### {response.agent_name} responds to {response.responding_to}")
-            lines.append("")
-            lines.append(f"**Agreement:** {response.agreement_level}")
-            lines.append("")
+            yield f"### {response.agent_name} responds to {response.responding_to}"
+            yield ""
+            yield f"**Agreement:** {response.agreement_level}"
+            yield ""
 
             if response.points:
-                lines.append("**Points:**")
+                yield "**Points:**"
                 for point in response.points:
-                    lines.append(f"- {point}")
-                lines.append("")
+                    yield f"- {point}"
+                yield ""
 
-            lines.append("---")
-            lines.append("")
+            yield "---"
+            yield ""
 
     # Votes
     if debate.votes:
-        lines.append("## Round 3: Final Voting")
-        lines.append("")
+        yield "## Round 3: Final Voting"
+        yield ""
 
         for vote in debate.votes:
-            decision_str = vote.decision.value if isinstance(
-                vote.decision, VoteDecision
-            ) else str(vote.decision)
-            lines.append(f"### {vote.agent_name}: {decision_str}")
-            lines.append("")
+            decision_str = vote.decision.value
+            yield f"### {vote.agent_name}: {decision_str}"
+            yield ""
             if vote.reasoning:
-                lines.append(f"**Reasoning:** {vote.reasoning}")
-                lines.append("")
-            lines.append("---")
-            lines.append("")
+                yield f"**Reasoning:** {vote.reasoning}"
+                yield ""
+            yield "---"
+            yield ""
 
     # Consensus
     if debate.consensus:
-        lines.append("## Final Consensus")
-        lines.append("")
+        yield "## Final Consensus"
+        yield ""
 
-        decision_str = debate.consensus.final_decision.value if isinstance(
-            debate.consensus.final_decision, VoteDecision
-        ) else str(debate.consensus.final_decision)
-        lines.append(f"**Decision:** {decision_str}")
-        lines.append("")
+        decision_str = debate.consensus.final_decision.value
+        yield f"**Decision:** {decision_str}"
+        yield ""
 
-        lines.append("**Vote Breakdown:**")
-        lines.append(f"- APPROVE: {debate.consensus.vote_counts.get('APPROVE', 0)}")
-        lines.append(f"- REJECT: {debate.consensus.vote_counts.get('REJECT', 0)}")
-        lines.append(f"- ABSTAIN: {debate.consensus.vote_counts.get('ABSTAIN', 0)}")
-        lines.append("")
+        yield "**Vote Breakdown:**"
+        yield f"- APPROVE: {debate.consensus.vote_counts.get('APPROVE', 0)}"
+        yield f"- REJECT: {debate.consensus.vote_counts.get('REJECT', 0)}"
+        yield f"- ABSTAIN: {debate.consensus.vote_counts.get('ABSTAIN', 0)}"
+        yield ""
 
         if debate.consensus.key_issues:
-            lines.append("**Key Issues:**")
+            yield "**Key Issues:**"
             for issue in debate.consensus.key_issues:
                 desc = issue.get("description", str(issue))
-                lines.append(f"- {desc}")
-            lines.append("")
+                yield f"- {desc}"
+            yield ""
 
         if debate.consensus.accepted_suggestions:
-            lines.append("**Agreed Suggestions:**")
+            yield "**Agreed Suggestions:**"
             for suggestion in debate.consensus.accepted_suggestions:
-                lines.append(f"- {suggestion}")
-            lines.append("")
+                yield f"- {suggestion}"
+            yield ""
 
     # Footer
-    lines.append("---")
-    lines.append("")
-    lines.append("*Generated by [Consensus](https://github.com/consensus) - Multi-agent AI code review*")
-
-    return "\n".join(lines)
+    yield "---"
+    yield ""
+    yield "*Generated by [Consensus](https://github.com/consensus) - Multi-agent AI code review*"
+
+
+# HTML export colors, keyed by agent name and by rating value
+AVATAR_COLORS = {
+    "SecurityExpert": "#e74c3c",
+    "PerformanceEngineer": "#3498db",
+    "ArchitectureCritic": "#9b59b6",
+    "PragmaticDev": "#27ae60",
+}
+
+HTML_SEVERITY_COLORS = {
+    "CRITICAL": "#e74c3c",
+    "HIGH": "#e67e22",
+    "MEDIUM": "#f1c40f",
+    "LOW": "#27ae60",
+}
+
+HTML_DECISION_COLORS = {
+    "APPROVE": "#27ae60",
+    "REJECT": "#e74c3c",
+    "ABSTAIN": "#f1c40f",
+}
+
+HTML_AGREEMENT_COLORS = {
+    "AGREE": "#27ae60",
+    "PARTIAL": "#f1c40f",
+    "DISAGREE": "#e74c3c",
+}
 
 
 def _generate_html(debate: DebateData) -> str:
     """Generate styled HTML representation of a debate."""
-    # Agent avatar colors
-    avatar_colors = {
-        "SecurityExpert": "#e74c3c",
-        "PerformanceEngineer": "#3498db",
-        "ArchitectureCritic": "#9b59b6",
-        "PragmaticDev": "#27ae60",
-    }
-
-    # Severity colors
-    severity_colors = {
-        "CRITICAL": "#e74c3c",
-        "HIGH": "#e67e22",
-        "MEDIUM": "#f1c40f",
-        "LOW": "#27ae60",
-    }
-
-    # Decision colors
-    decision_colors = {
-        "APPROVE": "#27ae60",
-        "REJECT": "#e74c3c",
-        "ABSTAIN": "#f1c40f",
-    }
-
-    # Agreement colors
-    agreement_colors = {
-        "AGREE": "#27ae60",
-        "PARTIAL": "#f1c40f",
-        "DISAGREE": "#e74c3c",
-    }
+    return "".join(_iter_html(debate))
+
 
+def _iter_html(debate: DebateData) -> Iterator[str]:
+    """Yield chunks of a debate's styled HTML representation."""
     def get_avatar(name: str) -> str:
         """Generate avatar HTML for an agent."""
-        color = avatar_colors.get(name, "#7f8c8d")
+        color = AVATAR_COLORS.get(name, "#7f8c8d")
         initials = "".join(c for c in name if c.isupper())[:2] or name[:2].upper()
         return f'<span class="avatar" style="background-color: {color};">{initials}</span>'
 
@@ -305,10 +329,8 @@ def _generate_html(debate: DebateData) -> str:
         """HTML escape text."""
         return html.escape(str(text))
 
-    html_parts = []
-
     # HTML head with styles
-    html_parts.append(f"""<!DOCTYPE html>
+    yield f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -505,12 +527,12 @@ def _generate_html(debate: DebateData) -> str:
     </style>
 </head>
 <body>
-""")
+"""
 
     # Header
     decision_str = debate.final_decision or "In Progress"
-    decision_color = decision_colors.get(decision_str, "#7f8c8d")
-    html_parts.append(f"""
+    decision_color = HTML_DECISION_COLORS.get(decision_str, "#7f8c8d")
+    yield f"""
     <div class="header">
         <h1>Consensus Code Review</h1>
         <div class="header-meta">
@@ -521,32 +543,32 @@ def _generate_html(debate: DebateData) -> str:
             {escape(decision_str)}
         </div>
     </div>
-""")
+"""
 
     # Code section
-    html_parts.append(f"""
+    yield f"""
     <div class="code-section">
         <h2>Code Under Review</h2>
         <pre>{escape(debate.code)}</pre>
     </div>
-""")
+"""
 
     if debate.context:
-        html_parts.append(f"""
+        yield f"""
     <div class="context">
         <strong>Context:</strong> {escape(debate.context)}
     </div>
-""")
+"""
 
     # Reviews section
     if debate.reviews:
-        html_parts.append("""
+        yield """
     <div class="section">
         <h2>Round 1: Initial Reviews</h2>
-""")
+"""
         for review in debate.reviews:
-            sev_color = severity_colors.get(review.severity, "#7f8c8d")
-            html_parts.append(f"""
+            sev_color = HTML_SEVERITY_COLORS.get(review.severity, "#7f8c8d")
+            yield f"""
         <div class="review-card">
             <div class="card-header" onclick="this.parentElement.classList.toggle('collapsed')">
                 {get_avatar(review.agent_name)}
@@ -556,38 +578,38 @@ def _generate_html(debate: DebateData) -> str:
                 <span class="expand-icon">▼</span>
             </div>
             <div class="review-content">
-""")
+"""
             if review.issues:
-                html_parts.append("                <h4>Issues:</h4>\n                <ul class=\"issues-list\">\n")
+                yield "                <h4>Issues:</h4>\n                <ul class=\"issues-list\">\n"
                 for issue in review.issues:
                     desc = issue.get("description", str(issue))
                     sev = issue.get("severity", "LOW")
-                    issue_color = severity_colors.get(sev, "#7f8c8d")
-                    html_parts.append(f'                    <li class="issue-item"><span class="issue-severity" style="background-color: {issue_color};">{escape(sev)}</span> {escape(desc)}</li>\n')
-                html_parts.append("                </ul>\n")
+                    issue_color = HTML_SEVERITY_COLORS.get(sev, "#7f8c8d")
+                    yield f'                    <li class="issue-item"><span class="issue-severity" style="background-color: {issue_color};">{escape(sev)}</span> {escape(desc)}</li>\n'
+                yield "                </ul>\n"
 
             if review.suggestions:
-                html_parts.append("                <h4>Suggestions:</h4>\n                <ul class=\"suggestions-list\">\n")
+                yield "                <h4>Suggestions:</h4>\n                <ul class=\"suggestions-list\">\n"
                 for suggestion in review.suggestions:
-                    html_parts.append(f"                    <li>{escape(suggestion)}</li>\n")
-                html_parts.append("                </ul>\n")
+                    yield f"                    <li>{escape(suggestion)}</li>\n"
+                yield "                </ul>\n"
 
             if review.summary:
-                html_parts.append(f"                <div class=\"summary\">{escape(review.summary)}</div>\n")
+                yield f"                <div class=\"summary\">{escape(review.summary)}</div>\n"
 
-            html_parts.append("            </div>\n        </div>\n")
+            yield "            </div>\n        </div>\n"
 
-        html_parts.append("    </div>\n")
+        yield "    </div>\n"
 
     # Responses section
     if debate.responses:
-        html_parts.append("""
+        yield """
     <div class="section">
         <h2>Round 2: Debate Responses</h2>
-""")
+"""
         for response in debate.responses:
-            agree_color = agreement_colors.get(response.agreement_level, "#7f8c8d")
-            html_parts.append(f"""
+            agree_color = HTML_AGREEMENT_COLORS.get(response.agreement_level, "#7f8c8d")
+            yield f"""
         <div class="response-card">
             <div class="card-header" onclick="this.parentElement.classList.toggle('collapsed')">
                 {get_avatar(response.agent_name)}
@@ -598,27 +620,27 @@ def _generate_html(debate: DebateData) -> str:
                 <span class="expand-icon">▼</span>
             </div>
             <div class="response-content">
-""")
+"""
             if response.points:
-                html_parts.append("                <ul class=\"points-list\">\n")
+                yield "                <ul class=\"points-list\">\n"
                 for point in response.points:
-                    html_parts.append(f"                    <li>{escape(point)}</li>\n")
-                html_parts.append("                </ul>\n")
+                    yield f"                    <li>{escape(point)}</li>\n"
+                yield "                </ul>\n"
 
-            html_parts.append("            </div>\n        </div>\n")
+            yield "            </div>\n        </div>\n"
 
-        html_parts.append("    </div>\n")
+        yield "    </div>\n"
 
     # Votes section
     if debate.votes:
-        html_parts.append("""
+        yield """
     <div class="section">
         <h2>Round 3: Final Voting</h2>
-""")
+"""
         for vote in debate.votes:
-            decision_val = vote.decision.value if isinstance(vote.decision, VoteDecision) else str(vote.decision)
-            vote_color = decision_colors.get(decision_val, "#7f8c8d")
-            html_parts.append(f"""
+            decision_val = vote.decision.value
+            vote_color = HTML_DECISION_COLORS.get(decision_val, "#7f8c8d")
+            yield f"""
         <div class="vote-card">
             <div class="card-header" onclick="this.parentElement.classList.toggle('collapsed')">
                 {get_avatar(vote.agent_name)}
@@ -630,59 +652,55 @@ def _generate_html(debate: DebateData) -> str:
                 <div class="summary">{escape(vote.reasoning)}</div>
             </div>
         </div>
-""")
-        html_parts.append("    </div>\n")
+"""
+        yield "    </div>\n"
 
     # Consensus section
     if debate.consensus:
-        cons_decision = debate.consensus.final_decision.value if isinstance(
-            debate.consensus.final_decision, VoteDecision
-        ) else str(debate.consensus.final_decision)
-        cons_color = decision_colors.get(cons_decision, "#7f8c8d")
+        cons_decision = debate.consensus.final_decision.value
+        cons_color = HTML_DECISION_COLORS.get(cons_decision, "#7f8c8d")
 
-        html_parts.append(f"""
+        yield f"""
     <div class="consensus-section">
         <h2>Final Consensus</h2>
         <div class="decision-badge" style="background-color: {cons_color}; font-size: 1.2em;">
             {escape(cons_decision)}
         </div>
         <div class="vote-breakdown">
-            <div class="vote-count" style="background-color: {decision_colors['APPROVE']};">
+            <div class="vote-count" style="background-color: {HTML_DECISION_COLORS['APPROVE']};">
                 APPROVE: {debate.consensus.vote_counts.get('APPROVE', 0)}
             </div>
-            <div class="vote-count" style="background-color: {decision_colors['REJECT']};">
+            <div class="vote-count" style="background-color: {HTML_DECISION_COLORS['REJECT']};">
                 REJECT: {debate.consensus.vote_counts.get('REJECT', 0)}
             </div>
-            <div class="vote-count" style="background-color: {decision_colors['ABSTAIN']};">
+            <div class="vote-count" style="background-color: {HTML_DECISION_COLORS['ABSTAIN']};">
                 ABSTAIN: {debate.consensus.vote_counts.get('ABSTAIN', 0)}
             </div>
         </div>
-""")
+"""
         if debate.consensus.key_issues:
-            html_parts.append("        <div class=\"key-issues\">\n            <h4>Key Issues:</h4>\n            <ul>\n")
+            yield "        <div class=\"key-issues\">\n            <h4>Key Issues:</h4>\n            <ul>\n"
             for issue in debate.consensus.key_issues:
                 desc = issue.get("description", str(issue))
-                html_parts.append(f"                <li>{escape(desc)}</li>\n")
-            html_parts.append("            </ul>\n        </div>\n")
+                yield f"                <li>{escape(desc)}</li>\n"
+            yield "            </ul>\n        </div>\n"
 
         if debate.consensus.accepted_suggestions:
-            html_parts.append("        <div class=\"agreed-suggestions\">\n            <h4>Agreed Suggestions:</h4>\n            <ul>\n")
+            yield "        <div class=\"agreed-suggestions\">\n            <h4>Agreed Suggestions:</h4>\n            <ul>\n"
             for suggestion in debate.consensus.accepted_suggestions:
-                html_parts.append(f"                <li>{escape(suggestion)}</li>\n")
-            html_parts.append("            </ul>\n        </div>\n")
+                yield f"                <li>{escape(suggestion)}</li>\n"
+            yield "            </ul>\n        </div>\n"
 
-        html_parts.append("    </div>\n")
+        yield "    </div>\n"
 
     # Footer
-    html_parts.append("""
+    yield """
     <div class="footer">
         <p>Generated by <a href="https://github.com/consensus">Consensus</a> - Multi-agent AI code review</p>
     </div>
 </body>
 </html>
-""")
-
-    return "".join(html_parts)
+"""
 
 
 def export_to_markdown(session_id: str, output_path: Optional[Path] = None) -> Optional[str]:
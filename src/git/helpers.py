@@ -1,17 +1,46 @@
 """Git helper functions for Consensys code review."""
-import subprocess
+import functools
 import json
-from dataclasses import dataclass
-from typing import List, Optional, Tuple, TYPE_CHECKING
+import os
+import re
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+
+# Start of a file in a unified diff; group 1 is the path after the last " b/"
+_DIFF_HEADER_RE = re.compile(r"^diff --git (?:.* b/(.*)|.*)$", re.MULTILINE)
+
+# Bytes of git output parsed at a time by the streaming diff readers
+GIT_STREAM_BLOCK_SIZE = 1 << 20
 
 
 @dataclass
 class ChangedFile:
-    """Represents a file with changes."""
+    """Represents a file with changes.
+
+    The file's current contents are read from ``_repo_root`` on first
+    access of ``content`` and memoized, so callers that only look at the
+    diff never touch the file.
+    """
     path: str
     status: str  # A=added, M=modified, D=deleted, R=renamed
     diff: str
-    content: Optional[str] = None
+    _repo_root: Optional[str] = field(default=None, repr=False, compare=False)
+
+    @cached_property
+    def content(self) -> Optional[str]:
+        """Current file contents, or None if deleted, unreadable or rootless."""
+        if self.status == "D" or not self._repo_root:
+            return None
+        try:
+            with open(f"{self._repo_root}/{self.path}") as f:
+                return f.read()
+        except Exception:
+            return None
 
 
 @dataclass
@@ -26,8 +55,19 @@ class PRInfo:
     files: List[ChangedFile]
 
 
-def run_git_command(args: List[str], cwd: Optional[str] = None) -> Tuple[bool, str]:
-    """Run a git command and return (success, output)."""
+@dataclass
+class RepoInfo:
+    """Location and checked-out branch of a git repository."""
+    root: str
+    branch: Optional[str]  # None on an unborn branch (no commits yet)
+
+
+def run_git_command(args: List[str], cwd: Optional[str] = None, strip: bool = True) -> Tuple[bool, str]:
+    """Run a git command and return (success, output).
+
+    Pass strip=False for formats where leading whitespace is significant,
+    such as ``status --porcelain -z``.
+    """
     try:
         result = subprocess.run(
             ["git"] + args,
@@ -36,7 +76,7 @@ def run_git_command(args: List[str], cwd: Optional[str] = None) -> Tuple[bool, s
             cwd=cwd,
         )
         if result.returncode == 0:
-            return True, result.stdout.strip()
+            return True, result.stdout.strip() if strip else result.stdout
         return False, result.stderr.strip()
     except FileNotFoundError:
         return False, "git command not found"
@@ -44,6 +84,39 @@ def run_git_command(args: List[str], cwd: Optional[str] = None) -> Tuple[bool, s
         return False, str(e)
 
 
+@contextmanager
+def run_git_stream(args: List[str], cwd: Optional[str] = None) -> Iterator[Optional[subprocess.Popen]]:
+    """Run a git command whose stdout is read incrementally as UTF-8.
+
+    Bytes that are not valid UTF-8 are replaced rather than raising.
+    Unlike run_git_command, the output is never buffered whole; read it
+    from ``proc.stdout`` inside the ``with`` block and check
+    ``proc.returncode`` after it.
+
+    Args:
+        args: Git arguments
+        cwd: Directory to run git in
+
+    Yields:
+        The running process, or None if git could not be started
+    """
+    try:
+        proc = subprocess.Popen(
+            ["git"] + args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            # Diffs carry file contents in whatever encoding the files use
+            encoding="utf-8",
+            errors="replace",
+            cwd=cwd,
+        )
+    except (FileNotFoundError, OSError):
+        yield None
+        return
+    with proc:
+        yield proc
+
+
 def run_gh_command(args: List[str], cwd: Optional[str] = None) -> Tuple[bool, str]:
     """Run a gh CLI command and return (success, output)."""
     try:
@@ -74,26 +147,125 @@ def get_repo_root(path: Optional[str] = None) -> Optional[str]:
     return output if success else None
 
 
+@functools.lru_cache(maxsize=32)
+def _cached_repo_root(abs_path: str) -> str:
+    """Resolve the repository root of an absolute directory path.
+
+    Raises:
+        LookupError: If the directory is not in a repository. lru_cache does
+            not cache exceptions, so the lookup is retried next time.
+    """
+    root = get_repo_root(abs_path)
+    if not root:
+        raise LookupError(abs_path)
+    return root
+
+
+def _repo_root(path: Optional[str] = None) -> Optional[str]:
+    """Get the repository root, spawning git at most once per directory.
+
+    Only successful lookups are remembered, so a directory that becomes a
+    repository later is still found.
+
+    Args:
+        path: Directory inside the repository (default: current directory)
+
+    Returns:
+        The repository root, or None outside a repository
+    """
+    try:
+        return _cached_repo_root(os.path.abspath(path or os.curdir))
+    except LookupError:
+        return None
+
+
+def get_repo_info(path: Optional[str] = None) -> Optional[RepoInfo]:
+    """Get the repository root and current branch, or None outside a repo.
+
+    Uses a single git process for the common case instead of separate
+    is_git_repo/get_repo_root/get_current_branch calls.
+    """
+    success, output = run_git_command(["rev-parse", "--show-toplevel", "--abbrev-ref", "HEAD"], cwd=path)
+    if success:
+        root, _, branch = output.partition("\n")
+        return RepoInfo(root=root, branch=branch or None)
+    # HEAD cannot be resolved before the first commit; the repo may still exist
+    root = get_repo_root(path)
+    if not root:
+        return None
+    return RepoInfo(root=root, branch=None)
+
+
+def _diffs_by_path(args: List[str], path: Optional[str] = None) -> Dict[str, str]:
+    """Run one tree-wide git diff and split its output per file.
+
+    Renames are reported as a delete plus an add, matching what a per-file
+    ``git diff <args> -- <file>`` shows for the new path.
+
+    Args:
+        args: Extra git diff arguments (e.g. ["HEAD"] or ["--cached"])
+        path: Directory to run git in
+
+    Returns:
+        Map of file path to its diff; empty if the command failed
+    """
+    diffs: Dict[str, str] = {}
+    # Unquoted paths in the diff headers match the -z status listings
+    with run_git_stream(["-c", "core.quotePath=false", "diff", "--no-renames", *args], cwd=path) as proc:
+        if proc is None:
+            return {}
+        # Parse complete files as blocks arrive, so the whole diff is never
+        # held in memory alongside its per-file copies
+        pending = ""
+        for block in iter(lambda: proc.stdout.read(GIT_STREAM_BLOCK_SIZE), ""):
+            # Only the new block (and a header straddling into it) can hold
+            # a boundary; earlier text was already searched
+            search_from = max(0, len(pending) - len("\ndiff --git "))
+            pending += block
+            boundary = pending.rfind("\ndiff --git ", search_from)
+            if boundary > 0:
+                diffs.update((changed.path, changed.diff) for changed in parse_diff(pending[:boundary]))
+                pending = pending[boundary + 1:]
+        diffs.update((changed.path, changed.diff) for changed in parse_diff(pending.rstrip()))
+    if proc.returncode != 0:
+        return {}
+    return diffs
+
+
 def get_uncommitted_changes(path: Optional[str] = None) -> List[ChangedFile]:
     """Get all uncommitted changes (both staged and unstaged)."""
     files = []
 
-    # Get list of modified/added/deleted files
-    success, output = run_git_command(["status", "--porcelain"], cwd=path)
+    # Get list of modified/added/deleted files. With -z, entries are
+    # NUL-terminated and paths are never quoted; a rename or copy entry
+    # ("XY new") is followed by a separate record holding the old path.
+    success, output = run_git_command(["status", "--porcelain", "-z"], cwd=path, strip=False)
     if not success or not output:
         return files
 
-    for line in output.split("\n"):
-        if not line.strip():
+    repo_root = _repo_root(path)
+
+    # Each kind of diff is run once for the whole tree, on first need
+    tree_diffs: Dict[Tuple[str, ...], Dict[str, str]] = {}
+
+    def diff_of(filepath: str, *args: str) -> str:
+        """Look up a file's diff in the tree-wide ``git diff <args>``."""
+        if args not in tree_diffs:
+            tree_diffs[args] = _diffs_by_path(list(args), path)
+        return tree_diffs[args].get(filepath, "")
+
+    records = iter(output.split("\0"))
+    for record in records:
+        if not record:
             continue
 
         # Parse status codes (first two chars)
-        status_chars = line[:2]
-        filepath = line[3:].strip()
+        status_chars = record[:2]
+        filepath = record[3:]
 
-        # Handle renamed files (they have "old -> new" format)
-        if " -> " in filepath:
-            filepath = filepath.split(" -> ")[1]
+        # Skip the original path of a renamed/copied file
+        if "R" in status_chars or "C" in status_chars:
+            next(records, None)
 
         # Determine status
         if "D" in status_chars:
@@ -108,13 +280,10 @@ def get_uncommitted_changes(path: Optional[str] = None) -> List[ChangedFile]:
         # Get diff for this file
         if status == "D":
             # For deleted files, show what was removed
-            success_diff, diff = run_git_command(["diff", "HEAD", "--", filepath], cwd=path)
-            if not success_diff:
-                success_diff, diff = run_git_command(["diff", "--cached", "--", filepath], cwd=path)
+            diff = diff_of(filepath, "HEAD") or diff_of(filepath, "--cached")
         elif status == "A" and status_chars[1] == "?":
             # Untracked file - read content directly
             try:
-                repo_root = get_repo_root(path)
                 if repo_root:
                     with open(f"{repo_root}/{filepath}") as f:
                         content = f.read()
@@ -124,27 +293,15 @@ def get_uncommitted_changes(path: Optional[str] = None) -> List[ChangedFile]:
             except Exception:
                 diff = ""
         else:
-            success_diff, diff = run_git_command(["diff", "HEAD", "--", filepath], cwd=path)
-            if not success_diff or not diff:
-                # Try unstaged diff
-                success_diff, diff = run_git_command(["diff", "--", filepath], cwd=path)
-
-        # Try to get current content (for non-deleted files)
-        content = None
-        if status != "D":
-            try:
-                repo_root = get_repo_root(path)
-                if repo_root:
-                    with open(f"{repo_root}/{filepath}") as f:
-                        content = f.read()
-            except Exception:
-                pass
+            # Fall back to the unstaged diff (e.g. before the first commit)
+            diff = diff_of(filepath, "HEAD") or diff_of(filepath)
 
+        # Content is read from disk only if asked for
         files.append(ChangedFile(
             path=filepath,
             status=status,
             diff=diff,
-            content=content,
+            _repo_root=repo_root,
         ))
 
     return files
@@ -154,66 +311,63 @@ def get_staged_changes(path: Optional[str] = None) -> List[ChangedFile]:
     """Get staged changes (what would be committed)."""
     files = []
 
-    # Get list of staged files
-    success, output = run_git_command(["diff", "--cached", "--name-status"], cwd=path)
+    # Get list of staged files as NUL-separated "status, path" records; a
+    # rename or copy status ("R100") is followed by both old and new path
+    success, output = run_git_command(["diff", "--cached", "--name-status", "-z"], cwd=path)
     if not success or not output:
         return files
 
-    for line in output.split("\n"):
-        if not line.strip():
-            continue
+    repo_root = _repo_root(path)
+    staged_diffs = _diffs_by_path(["--cached"], path)
 
-        parts = line.split("\t")
-        if len(parts) < 2:
+    records = iter(output.split("\0"))
+    for status_field in records:
+        if not status_field:
             continue
 
-        status = parts[0][0]  # First char of status
-        filepath = parts[-1]  # Last part is the filename
-
-        # Get diff for this file
-        success_diff, diff = run_git_command(["diff", "--cached", "--", filepath], cwd=path)
-
-        # Try to get current content (for non-deleted files)
-        content = None
-        if status != "D":
-            try:
-                repo_root = get_repo_root(path)
-                if repo_root:
-                    with open(f"{repo_root}/{filepath}") as f:
-                        content = f.read()
-            except Exception:
-                pass
+        status = status_field[0]  # First char of status
+        if status in ("R", "C"):
+            next(records, None)  # Old path; the new one is the filename
+        filepath = next(records, "")
+        if not filepath:
+            continue
 
+        # Content is read from disk only if asked for
         files.append(ChangedFile(
             path=filepath,
             status=status,
-            diff=diff if success_diff else "",
-            content=content,
+            diff=staged_diffs.get(filepath, ""),
+            _repo_root=repo_root,
         ))
 
     return files
 
 
 def get_pr_info(pr_number: int, path: Optional[str] = None) -> Optional[PRInfo]:
-    """Get information about a GitHub PR using gh CLI."""
-    # Get PR metadata
-    success, output = run_gh_command([
-        "pr", "view", str(pr_number),
-        "--json", "number,title,author,baseRefName,headRefName,url"
-    ], cwd=path)
+    """Get information about a GitHub PR using gh CLI.
 
-    if not success:
-        return None
+    The metadata and the diff are separate GitHub API round trips, so the
+    diff is fetched in the background while the metadata request runs.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Get PR diff/files
+        diff_future = executor.submit(run_gh_command, ["pr", "diff", str(pr_number)], path)
 
-    try:
-        data = json.loads(output)
-    except json.JSONDecodeError:
-        return None
+        # Get PR metadata
+        success, output = run_gh_command([
+            "pr", "view", str(pr_number),
+            "--json", "number,title,author,baseRefName,headRefName,url"
+        ], cwd=path)
 
-    # Get PR diff/files
-    success_diff, diff_output = run_gh_command([
-        "pr", "diff", str(pr_number)
-    ], cwd=path)
+        if not success:
+            return None
+
+        try:
+            data = json.loads(output)
+        except json.JSONDecodeError:
+            return None
+
+        success_diff, diff_output = diff_future.result()
 
     # Parse diff to get changed files
     files = parse_diff(diff_output if success_diff else "")
@@ -230,50 +384,29 @@ def get_pr_info(pr_number: int, path: Optional[str] = None) -> Optional[PRInfo]:
 
 
 def parse_diff(diff_text: str) -> List[ChangedFile]:
-    """Parse a unified diff into ChangedFile objects."""
-    files = []
-    current_file = None
-    current_diff_lines = []
-
-    for line in diff_text.split("\n"):
-        if line.startswith("diff --git"):
-            # Save previous file if exists
-            if current_file:
-                files.append(ChangedFile(
-                    path=current_file,
-                    status="M",  # Default to modified
-                    diff="\n".join(current_diff_lines),
-                ))
-
-            # Extract filename (format: diff --git a/path b/path)
-            parts = line.split(" b/")
-            if len(parts) >= 2:
-                current_file = parts[-1]
-            else:
-                current_file = line.split()[-1]
-            current_diff_lines = [line]
+    """Parse a unified diff into ChangedFile objects.
 
-        elif line.startswith("new file"):
-            if current_diff_lines:
-                current_diff_lines.append(line)
-            # Mark as added in next file creation
+    File boundaries are located with one regex scan and each file's diff is
+    a slice of the input, rather than a per-line loop and join.
+    """
+    files = []
+    headers = list(_DIFF_HEADER_RE.finditer(diff_text))
 
-        elif line.startswith("deleted file"):
-            if current_diff_lines:
-                current_diff_lines.append(line)
-            # Mark as deleted in next file creation
+    for i, header in enumerate(headers):
+        # Each file runs up to the newline before the next header
+        end = headers[i + 1].start() - 1 if i + 1 < len(headers) else len(diff_text)
+        diff_content = diff_text[header.start():end]
 
-        elif current_file:
-            current_diff_lines.append(line)
+        # Extract filename (format: diff --git a/path b/path)
+        current_file = header.group(1)
+        if current_file is None:
+            current_file = header.group(0).split()[-1]
 
-    # Don't forget the last file
-    if current_file:
-        # Determine status from diff content
+        # Determine status from the extended header lines
         status = "M"
-        diff_content = "\n".join(current_diff_lines)
-        if "new file" in diff_content:
+        if "\nnew file mode" in diff_content:
             status = "A"
-        elif "deleted file" in diff_content:
+        elif "\ndeleted file mode" in diff_content:
             status = "D"
 
         files.append(ChangedFile(
@@ -326,7 +459,7 @@ def get_file_diff_vs_head(filepath: str, context_lines: int = 3, path: Optional[
         # For untracked files, return the entire file as "added"
         if status.strip().startswith("??"):
             try:
-                repo_root = get_repo_root(path)
+                repo_root = _repo_root(path)
                 full_path = f"{repo_root}/{filepath}" if repo_root else filepath
                 with open(full_path) as f:
                     content = f.read()
@@ -412,7 +545,7 @@ def extract_diff_context(filepath: str, context_lines: int = 5, path: Optional[s
     # Read the full file and extract relevant sections
     context_code = ""
     try:
-        repo_root = get_repo_root(path)
+        repo_root = _repo_root(path)
         full_path = f"{repo_root}/{filepath}" if repo_root else filepath
         with open(full_path) as f:
             lines = f.readlines()
@@ -1,7 +1,7 @@
 """Language detection and language-specific review hints for multi-language support."""
 from dataclasses import dataclass, field
 from typing import Optional, Dict, List
-from pathlib import Path
+import os
 
 
 @dataclass
@@ -351,6 +351,22 @@ for lang_name, lang_info in SUPPORTED_LANGUAGES.items():
         EXTENSION_MAP[ext] = lang_name
 
 
+def _file_suffix(file_path: str) -> str:
+    """Return the lowercased extension of a path, like Path(file_path).suffix.
+
+    Avoids building a Path object for what is a single string scan.
+
+    Args:
+        file_path: File path or name
+
+    Returns:
+        The extension including its dot (e.g. ".py"), or "" if there is none
+    """
+    name = os.path.basename(file_path)
+    dot = name.rfind(".")
+    return name[dot:].lower() if 0 < dot < len(name) - 1 else ""
+
+
 def detect_language(file_path: Optional[str] = None, code: Optional[str] = None) -> LanguageInfo:
     """Detect the programming language from file extension or code content.
 
@@ -363,8 +379,7 @@ def detect_language(file_path: Optional[str] = None, code: Optional[str] = None)
     """
     # Try file extension first
     if file_path:
-        path = Path(file_path)
-        ext = path.suffix.lower()
+        ext = _file_suffix(file_path)
 
         # Handle .h files (could be C or C++)
         if ext == ".h":
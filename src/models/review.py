@@ -118,6 +118,9 @@ class Vote:
     timestamp: Optional[datetime] = None
 
     def __post_init__(self):
+        # Normalize plain strings so decision is always a VoteDecision
+        if not isinstance(self.decision, VoteDecision):
+            self.decision = VoteDecision(self.decision)
         if self.timestamp is None:
             self.timestamp = datetime.now()
 
@@ -150,6 +153,9 @@ class Consensus:
     timestamp: Optional[datetime] = None
 
     def __post_init__(self):
+        # Normalize plain strings so final_decision is always a VoteDecision
+        if not isinstance(self.final_decision, VoteDecision):
+            self.final_decision = VoteDecision(self.final_decision)
         if self.session_id is None:
             self.session_id = str(uuid.uuid4())
         if self.timestamp is None:
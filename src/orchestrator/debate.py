@@ -1,9 +1,13 @@
 """Debate orchestrator for multi-agent code review discussions."""
+import functools
 import json
+import re
+import time
 import uuid
 import threading
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Optional, Dict, Any, Callable
+from typing import List, Optional, Dict, Any, Callable, Hashable, Iterable, TypeVar
 
 from rich.console import Console, Group
 from rich.panel import Panel
@@ -14,19 +18,103 @@ from rich.live import Live
 from rich.layout import Layout
 from rich.columns import Columns
 
-from anthropic import APIError, APIConnectionError, RateLimitError
-
+from src.agents._client import api_exceptions
 from src.agents.agent import Agent, ReviewResult, ResponseResult, VoteResult
 from src.agents.personas import PERSONAS, Persona
 from src.models.review import Review, Response, Vote, Consensus, VoteDecision
 from src.db.storage import Storage
 from src.cache import ReviewCache, get_cache, DEFAULT_CACHE_TTL_SECONDS
+from src.display import AGREEMENT_COLORS, DECISION_COLORS, SEVERITY_COLORS
 from src.languages import LanguageInfo, detect_language, GENERIC
 
-# Specific exception types for API and threading errors
-APIExceptions = (APIError, APIConnectionError, RateLimitError)
+# Specific exception types for threading errors (API errors come from api_exceptions())
 ThreadExceptions = (TimeoutError, RuntimeError)
 
+# Provisional decision implied by a Round 1 review severity (mirrors quick consensus)
+REVIEW_SEVERITY_DECISIONS = {
+    "LOW": VoteDecision.APPROVE,
+    "MEDIUM": VoteDecision.APPROVE,
+    "HIGH": VoteDecision.ABSTAIN,
+    "CRITICAL": VoteDecision.REJECT,
+}
+
+T = TypeVar("T", bound=Hashable)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+# Curly quotes models use interchangeably with ASCII ones
+_QUOTE_TABLE = str.maketrans({"\u2018": "'", "\u2019": "'", "\u201c": '"', "\u201d": '"'})
+
+
+def canonical(text: str) -> str:
+    """Normalize free text so near-identical agent findings compare equal.
+
+    Lowercases, trims, collapses whitespace runs and folds curly quotes.
+
+    Args:
+        text: Issue description or suggestion text
+
+    Returns:
+        Canonical form used as a deduplication key
+    """
+    return _WHITESPACE_RE.sub(" ", text.strip().lower()).translate(_QUOTE_TABLE)
+
+
+def majority(candidates: Iterable[T], n: Optional[int] = None) -> Optional[T]:
+    """Return the candidate held by a strict majority of voters, if any.
+
+    Args:
+        candidates: One candidate answer per voter
+        n: Total number of voters; defaults to the number of candidates.
+            Voters that produced no candidate count against the majority.
+
+    Returns:
+        The candidate with more than n/2 votes, or None if there is none
+    """
+    counts = Counter(candidates)
+    if not counts:
+        return None
+    total = n if n is not None else sum(counts.values())
+    candidate, count = counts.most_common(1)[0]
+    return candidate if count * 2 > total else None
+
+
+# Characters of each agent's live output shown in the streaming panels
+STREAM_TAIL_CHARS = 500
+
+
+def _bullet(text: str, color: str = "cyan", indent: str = "  ") -> Text:
+    """Build an indented, colored-bullet line.
+
+    Args:
+        text: Plain text after the bullet (never parsed as markup)
+        color: Bullet color
+        indent: Leading whitespace
+
+    Returns:
+        The styled line
+    """
+    return Text.assemble(indent, ("\u2022", color), f" {text}")
+
+
+def _render_card(title: str, color: str, lines: List[Text], title_style: str = "bold") -> Panel:
+    """Build the padded, colored panel used for every debate artifact.
+
+    Args:
+        title: Panel title text
+        color: Border color
+        lines: Pre-styled lines forming the panel body (empty Text for a gap)
+        title_style: Rich style applied to the title
+
+    Returns:
+        Panel with the lines grouped as its body
+    """
+    return Panel(
+        Group(*lines),
+        title=f"[{title_style}]{title}[/{title_style}]",
+        border_style=color,
+        padding=(1, 2),
+    )
+
 
 class DebateOrchestrator:
     """Manages multi-agent code review debates.
@@ -43,6 +131,7 @@ class DebateOrchestrator:
         use_cache: bool = True,
         cache_ttl: int = DEFAULT_CACHE_TTL_SECONDS,
         language: Optional[LanguageInfo] = None,
+        max_parallel_agents: Optional[int] = None,
     ):
         """Initialize the debate orchestrator.
 
@@ -53,6 +142,8 @@ class DebateOrchestrator:
             use_cache: Whether to use caching for reviews. Defaults to True.
             cache_ttl: Cache TTL in seconds. Defaults to 1 hour.
             language: Optional language info for language-specific review hints.
+            max_parallel_agents: Maximum number of concurrent agent API calls
+                per round. Defaults to one per agent.
         """
         self.personas = personas or PERSONAS
         self.storage = storage or Storage()
@@ -61,6 +152,7 @@ class DebateOrchestrator:
         self.cache_ttl = cache_ttl
         self._cache = get_cache(cache_ttl) if use_cache else None
         self.language = language
+        self.max_parallel_agents = max_parallel_agents
 
         # Current session state
         self.session_id: Optional[str] = None
@@ -74,6 +166,13 @@ class DebateOrchestrator:
         self.votes: List[Vote] = []
         self.consensus: Optional[Consensus] = None
 
+    @property
+    def _pool_size(self) -> int:
+        """Number of worker threads to use for a round of agent calls."""
+        if self.max_parallel_agents:
+            return max(1, min(self.max_parallel_agents, len(self.agents)))
+        return len(self.agents)
+
     def _agent_review_task(
         self,
         agent: Agent,
@@ -135,64 +234,45 @@ class DebateOrchestrator:
         Args:
             review: The review to display
         """
-        # Determine panel color based on severity
-        severity_colors = {
-            "CRITICAL": "red",
-            "HIGH": "red",
-            "MEDIUM": "yellow",
-            "LOW": "green",
-        }
-        color = severity_colors.get(review.severity, "blue")
-
-        # Build review content
-        content_lines = []
+        color = SEVERITY_COLORS.get(review.severity, "blue")
 
         # Severity and confidence
-        content_lines.append(f"[bold]Severity:[/bold] [{color}]{review.severity}[/{color}]")
-        content_lines.append(f"[bold]Confidence:[/bold] {review.confidence:.0%}")
+        content_lines = [
+            Text.assemble(("Severity: ", "bold"), (review.severity, color)),
+            Text.assemble(("Confidence: ", "bold"), f"{review.confidence:.0%}"),
+        ]
 
         # Issues
         if review.issues:
-            content_lines.append(f"\n[bold]Issues ({len(review.issues)}):[/bold]")
+            content_lines += [Text(), Text(f"Issues ({len(review.issues)}):", style="bold")]
             for issue in review.issues:
                 desc = issue.get("description", str(issue))
-                sev = issue.get("severity", "LOW")
-                sev_color = severity_colors.get(sev, "blue")
+                sev_color = SEVERITY_COLORS.get(issue.get("severity", "LOW"), "blue")
                 line_info = f" (line {issue['line']})" if issue.get("line") else ""
-                content_lines.append(f"  [{sev_color}]\u2022[/{sev_color}] {desc}{line_info}")
+                content_lines.append(_bullet(f"{desc}{line_info}", sev_color))
                 # Show fix suggestion if available
                 fix = issue.get("fix")
                 if fix:
                     fix_lines = fix.split('\n')
                     if len(fix_lines) == 1:
-                        content_lines.append(f"    [green]Fix:[/green] [dim]{fix}[/dim]")
+                        content_lines.append(Text.assemble("    ", ("Fix:", "green"), " ", (fix, "dim")))
                     else:
-                        content_lines.append(f"    [green]Fix:[/green]")
+                        content_lines.append(Text.assemble("    ", ("Fix:", "green")))
                         for fix_line in fix_lines:
-                            content_lines.append(f"      [dim]{fix_line}[/dim]")
+                            content_lines.append(Text.assemble("      ", (fix_line, "dim")))
         else:
-            content_lines.append("\n[green]\u2713 No issues found[/green]")
+            content_lines += [Text(), Text("\u2713 No issues found", style="green")]
 
         # Suggestions
         if review.suggestions:
-            content_lines.append(f"\n[bold]Suggestions:[/bold]")
-            for suggestion in review.suggestions:
-                content_lines.append(f"  [cyan]\u2022[/cyan] {suggestion}")
+            content_lines += [Text(), Text("Suggestions:", style="bold")]
+            content_lines += [_bullet(suggestion) for suggestion in review.suggestions]
 
         # Summary
         if review.summary:
-            content_lines.append(f"\n[bold]Summary:[/bold]\n{review.summary}")
+            content_lines += [Text(), Text("Summary:", style="bold"), Text(review.summary)]
 
-        content = "\n".join(content_lines)
-
-        # Create and display panel
-        panel = Panel(
-            content,
-            title=f"[bold]{review.agent_name}[/bold]",
-            border_style=color,
-            padding=(1, 2),
-        )
-        self.console.print(panel)
+        self.console.print(_render_card(review.agent_name, color, content_lines))
         self.console.print()
 
     def start_review(
@@ -246,7 +326,7 @@ class DebateOrchestrator:
                 agent_tasks[agent.persona.name] = task_id
 
             # Submit all reviews to thread pool
-            with ThreadPoolExecutor(max_workers=len(self.agents)) as executor:
+            with ThreadPoolExecutor(max_workers=self._pool_size) as executor:
                 future_to_agent = {
                     executor.submit(
                         self._agent_review_task,
@@ -276,7 +356,7 @@ class DebateOrchestrator:
                         )
                         progress.remove_task(task_id)
 
-                    except (*APIExceptions, *ThreadExceptions, ValueError, json.JSONDecodeError) as e:
+                    except (*api_exceptions(), *ThreadExceptions, ValueError, json.JSONDecodeError) as e:
                         # Handle API errors, thread issues, and JSON parsing failures
                         self.console.print(
                             f"[red]Error from {agent_name}: {type(e).__name__}: {e}[/red]"
@@ -290,7 +370,8 @@ class DebateOrchestrator:
             self.console.print(f"[dim]Cache: {cache_hits}/{len(completed_reviews)} reviews from cache[/dim]")
             self.console.print()
 
-        # Convert to Review models, display, and store
+        # Convert to Review models and display
+        new_reviews = []
         for agent in self.agents:
             agent_name = agent.persona.name
             if agent_name in completed_reviews:
@@ -309,12 +390,15 @@ class DebateOrchestrator:
 
                 # Display the review
                 self._display_review(review)
+                new_reviews.append(review)
 
-                # Store in database
+        # Store in database
+        with self.storage.transaction():
+            for review in new_reviews:
                 self.storage.save_review(review, self.session_id)
 
-                # Keep track for later rounds
-                self.reviews.append(review)
+        # Keep track for later rounds
+        self.reviews.extend(new_reviews)
 
         # Display summary table
         self._display_review_summary()
@@ -329,18 +413,10 @@ class DebateOrchestrator:
         table.add_column("Issues", justify="center")
         table.add_column("Confidence", justify="center")
 
-        severity_colors = {
-            "CRITICAL": "red",
-            "HIGH": "red",
-            "MEDIUM": "yellow",
-            "LOW": "green",
-        }
-
         for review in self.reviews:
-            color = severity_colors.get(review.severity, "blue")
             table.add_row(
                 review.agent_name,
-                f"[{color}]{review.severity}[/{color}]",
+                Text(review.severity, style=SEVERITY_COLORS.get(review.severity, "blue")),
                 str(len(review.issues)),
                 f"{review.confidence:.0%}",
             )
@@ -373,43 +449,28 @@ class DebateOrchestrator:
         Args:
             response: The response to display
         """
-        agreement_colors = {
-            "AGREE": "green",
-            "PARTIAL": "yellow",
-            "DISAGREE": "red",
-        }
-        color = agreement_colors.get(response.agreement_level, "blue")
-
-        content_lines = []
+        color = AGREEMENT_COLORS.get(response.agreement_level, "blue")
 
         # Header showing who is responding to whom
-        content_lines.append(
-            f"[bold]{response.agent_name}[/bold] responds to [bold]{response.responding_to}[/bold]"
-        )
-        content_lines.append(
-            f"[bold]Agreement:[/bold] [{color}]{response.agreement_level}[/{color}]"
-        )
+        content_lines = [
+            Text.assemble(
+                (response.agent_name, "bold"), " responds to ", (response.responding_to, "bold")
+            ),
+            Text.assemble(("Agreement: ", "bold"), (response.agreement_level, color)),
+        ]
 
         # Points made
         if response.points:
-            content_lines.append(f"\n[bold]Points:[/bold]")
-            for point in response.points:
-                content_lines.append(f"  [cyan]\u2022[/cyan] {point}")
+            content_lines += [Text(), Text("Points:", style="bold")]
+            content_lines += [_bullet(point) for point in response.points]
 
         # Summary
         if response.summary:
-            content_lines.append(f"\n[bold]Summary:[/bold]\n{response.summary}")
-
-        content = "\n".join(content_lines)
+            content_lines += [Text(), Text("Summary:", style="bold"), Text(response.summary)]
 
-        # Create and display panel
-        panel = Panel(
-            content,
-            title=f"[bold]{response.agent_name} \u2192 {response.responding_to}[/bold]",
-            border_style=color,
-            padding=(1, 2),
-        )
-        self.console.print(panel)
+        self.console.print(_render_card(
+            f"{response.agent_name} \u2192 {response.responding_to}", color, content_lines
+        ))
         self.console.print()
 
     def _display_response_summary(self) -> None:
@@ -419,12 +480,6 @@ class DebateOrchestrator:
         self.console.rule("[bold cyan]Debate Flow[/bold cyan]")
         self.console.print()
 
-        agreement_colors = {
-            "AGREE": "green",
-            "PARTIAL": "yellow",
-            "DISAGREE": "red",
-        }
-
         # Group responses by responder
         responses_by_agent: Dict[str, List[Response]] = {}
         for response in self.responses:
@@ -434,12 +489,12 @@ class DebateOrchestrator:
 
         # Display flow for each agent
         for agent_name, agent_responses in responses_by_agent.items():
-            flow_parts = []
-            for resp in agent_responses:
-                color = agreement_colors.get(resp.agreement_level, "blue")
-                flow_parts.append(f"[{color}]{resp.responding_to}[/{color}]")
-            flow_str = ", ".join(flow_parts)
-            self.console.print(f"[bold cyan]{agent_name}[/bold cyan] responded to: {flow_str}")
+            flow = Text.assemble((agent_name, "bold cyan"), " responded to: ")
+            for i, resp in enumerate(agent_responses):
+                if i:
+                    flow.append(", ")
+                flow.append(resp.responding_to, style=AGREEMENT_COLORS.get(resp.agreement_level, "blue"))
+            self.console.print(flow)
 
         # Summary table
         self.console.print()
@@ -450,11 +505,13 @@ class DebateOrchestrator:
         table.add_column("Points", justify="center")
 
         for response in self.responses:
-            color = agreement_colors.get(response.agreement_level, "blue")
             table.add_row(
                 response.agent_name,
                 response.responding_to,
-                f"[{color}]{response.agreement_level}[/{color}]",
+                Text(
+                    response.agreement_level,
+                    style=AGREEMENT_COLORS.get(response.agreement_level, "blue"),
+                ),
                 str(len(response.points)),
             )
 
@@ -524,7 +581,7 @@ class DebateOrchestrator:
             )
 
             # Submit all responses to thread pool
-            with ThreadPoolExecutor(max_workers=len(self.agents)) as executor:
+            with ThreadPoolExecutor(max_workers=self._pool_size) as executor:
                 future_to_task = {
                     executor.submit(
                         self._agent_response_task,
@@ -544,7 +601,7 @@ class DebateOrchestrator:
                         completed_responses.append(result)
                         progress.advance(overall_task)
 
-                    except (*APIExceptions, *ThreadExceptions, ValueError, json.JSONDecodeError) as e:
+                    except (*api_exceptions(), *ThreadExceptions, ValueError, json.JSONDecodeError) as e:
                         # Handle API errors, thread issues, and JSON parsing failures
                         self.console.print(
                             f"[red]Error from {agent.persona.name} responding to "
@@ -555,7 +612,8 @@ class DebateOrchestrator:
         # Sort responses by agent name for consistent display
         completed_responses.sort(key=lambda r: (r.agent_name, r.responding_to))
 
-        # Convert to Response models, display, and store
+        # Convert to Response models and display
+        new_responses = []
         for result in completed_responses:
             response = Response(
                 agent_name=result.agent_name,
@@ -568,12 +626,15 @@ class DebateOrchestrator:
 
             # Display the response
             self._display_response(response)
+            new_responses.append(response)
 
-            # Store in database
-            self.storage.save_response(response, self.session_id)
+        # Store in database
+        with self.storage.transaction():
+            for response in new_responses:
+                self.storage.save_response(response, self.session_id)
 
-            # Keep track for later rounds
-            self.responses.append(response)
+        # Keep track for later rounds
+        self.responses.extend(new_responses)
 
         # Display summary
         self._display_response_summary()
@@ -646,47 +707,30 @@ class DebateOrchestrator:
         Args:
             vote: The vote to display
         """
-        decision_colors = {
-            "APPROVE": "green",
-            "REJECT": "red",
-            "ABSTAIN": "yellow",
-        }
-        decision_str = vote.decision.value if isinstance(vote.decision, VoteDecision) else str(vote.decision)
-        color = decision_colors.get(decision_str, "blue")
-
-        content_lines = []
-        content_lines.append(f"[bold]Vote:[/bold] [{color}]{decision_str}[/{color}]")
-        content_lines.append(f"\n[bold]Reasoning:[/bold]\n{vote.reasoning}")
-
-        content = "\n".join(content_lines)
+        decision_str = vote.decision.value
+        color = DECISION_COLORS.get(decision_str, "blue")
+
+        content_lines = [
+            Text.assemble(("Vote: ", "bold"), (decision_str, color)),
+            Text(),
+            Text("Reasoning:", style="bold"),
+            Text(vote.reasoning),
+        ]
 
-        panel = Panel(
-            content,
-            title=f"[bold]{vote.agent_name}[/bold]",
-            border_style=color,
-            padding=(1, 2),
-        )
-        self.console.print(panel)
+        self.console.print(_render_card(vote.agent_name, color, content_lines))
         self.console.print()
 
     def _display_vote_summary(self) -> None:
         """Display a summary table of all votes."""
-        decision_colors = {
-            "APPROVE": "green",
-            "REJECT": "red",
-            "ABSTAIN": "yellow",
-        }
-
         table = Table(title="Vote Summary", show_header=True, header_style="bold")
         table.add_column("Voter", style="cyan")
         table.add_column("Decision", justify="center")
 
         for vote in self.votes:
-            decision_str = vote.decision.value if isinstance(vote.decision, VoteDecision) else str(vote.decision)
-            color = decision_colors.get(decision_str, "blue")
+            decision_str = vote.decision.value
             table.add_row(
                 vote.agent_name,
-                f"[{color}]{decision_str}[/{color}]",
+                Text(decision_str, style=DECISION_COLORS.get(decision_str, "blue")),
             )
 
         self.console.print()
@@ -764,7 +808,7 @@ class DebateOrchestrator:
                 agent_tasks[agent.persona.name] = task_id
 
             # Submit all votes to thread pool
-            with ThreadPoolExecutor(max_workers=len(self.agents)) as executor:
+            with ThreadPoolExecutor(max_workers=self._pool_size) as executor:
                 future_to_agent = {
                     executor.submit(
                         self._agent_vote_task,
@@ -793,7 +837,7 @@ class DebateOrchestrator:
                         )
                         progress.remove_task(task_id)
 
-                    except (*APIExceptions, *ThreadExceptions, ValueError, json.JSONDecodeError) as e:
+                    except (*api_exceptions(), *ThreadExceptions, ValueError, json.JSONDecodeError) as e:
                         # Handle API errors, thread issues, and JSON parsing failures
                         self.console.print(
                             f"[red]Error from {agent_name}: {type(e).__name__}: {e}[/red]"
@@ -804,7 +848,8 @@ class DebateOrchestrator:
         # Sort votes by agent name for consistent display
         completed_votes.sort(key=lambda v: v.agent_name)
 
-        # Convert to Vote models, display, and store
+        # Convert to Vote models and display
+        new_votes = []
         for result in completed_votes:
             vote = Vote(
                 agent_name=result.agent_name,
@@ -815,12 +860,15 @@ class DebateOrchestrator:
 
             # Display the vote
             self._display_vote(vote)
+            new_votes.append(vote)
 
-            # Store in database
-            self.storage.save_vote(vote, self.session_id)
+        # Store in database
+        with self.storage.transaction():
+            for vote in new_votes:
+                self.storage.save_vote(vote, self.session_id)
 
-            # Keep track
-            self.votes.append(vote)
+        # Keep track
+        self.votes.extend(new_votes)
 
         # Display summary
         self._display_vote_summary()
@@ -852,12 +900,9 @@ class DebateOrchestrator:
         self.console.rule("[bold blue]Building Consensus[/bold blue]")
         self.console.print()
 
-        # Count votes
-        vote_counts = {"APPROVE": 0, "REJECT": 0, "ABSTAIN": 0}
-        for vote in self.votes:
-            decision_str = vote.decision.value if isinstance(vote.decision, VoteDecision) else str(vote.decision)
-            if decision_str in vote_counts:
-                vote_counts[decision_str] += 1
+        # Count votes in a single C-level pass
+        tally = Counter(vote.decision.value for vote in self.votes)
+        vote_counts = {decision: tally[decision] for decision in ("APPROVE", "REJECT", "ABSTAIN")}
 
         # Determine final decision with tie-breaking (REJECT wins ties)
         approve_count = vote_counts["APPROVE"]
@@ -871,43 +916,37 @@ class DebateOrchestrator:
             # Tie: REJECT wins (conservative approach)
             final_decision = VoteDecision.REJECT
 
-        # Aggregate key issues - collect issues mentioned by multiple agents
-        issue_mentions: Dict[str, int] = {}  # description -> count
-        all_issues: List[Dict[str, Any]] = []
+        # Aggregate key issues - collect issues mentioned by multiple agents.
+        # Keyed by canonical description; the first wording seen is kept.
+        issue_mentions: Counter = Counter()
+        unique_issues: Dict[str, Dict[str, Any]] = {}
 
         for review in self.reviews:
             for issue in review.issues:
-                desc = issue.get("description", str(issue))
-                # Normalize for comparison
-                desc_lower = desc.lower().strip()
-                issue_mentions[desc_lower] = issue_mentions.get(desc_lower, 0) + 1
-                if desc_lower not in [i.get("description", "").lower().strip() for i in all_issues]:
-                    all_issues.append(issue)
+                key = canonical(issue.get("description", str(issue)))
+                issue_mentions[key] += 1
+                unique_issues.setdefault(key, issue)
 
         # Key issues are those mentioned by 2+ agents or have HIGH/CRITICAL severity
-        key_issues = []
-        for issue in all_issues:
-            desc = issue.get("description", str(issue))
-            desc_lower = desc.lower().strip()
-            severity = issue.get("severity", "LOW")
-            if issue_mentions.get(desc_lower, 0) >= 2 or severity in ("CRITICAL", "HIGH"):
-                key_issues.append(issue)
+        key_issues = [
+            issue for key, issue in unique_issues.items()
+            if issue_mentions[key] >= 2 or issue.get("severity", "LOW") in ("CRITICAL", "HIGH")
+        ]
 
         # Aggregate suggestions - collect suggestions mentioned by multiple agents
-        suggestion_mentions: Dict[str, int] = {}
-        all_suggestions: List[str] = []
+        suggestion_mentions: Counter = Counter()
+        unique_suggestions: Dict[str, str] = {}
 
         for review in self.reviews:
             for suggestion in review.suggestions:
-                sug_lower = suggestion.lower().strip()
-                suggestion_mentions[sug_lower] = suggestion_mentions.get(sug_lower, 0) + 1
-                if sug_lower not in [s.lower().strip() for s in all_suggestions]:
-                    all_suggestions.append(suggestion)
+                key = canonical(suggestion)
+                suggestion_mentions[key] += 1
+                unique_suggestions.setdefault(key, suggestion)
 
         # Accepted suggestions are those mentioned by 2+ agents
         accepted_suggestions = [
-            s for s in all_suggestions
-            if suggestion_mentions.get(s.lower().strip(), 0) >= 2
+            s for key, s in unique_suggestions.items()
+            if suggestion_mentions[key] >= 2
         ]
 
         # Create consensus
@@ -934,58 +973,46 @@ class DebateOrchestrator:
         if not self.consensus:
             return
 
-        decision_colors = {
-            VoteDecision.APPROVE: "green",
-            VoteDecision.REJECT: "red",
-            VoteDecision.ABSTAIN: "yellow",
-        }
-        color = decision_colors.get(self.consensus.final_decision, "blue")
         decision_str = self.consensus.final_decision.value
-
-        content_lines = []
+        color = DECISION_COLORS.get(decision_str, "blue")
 
         # Vote breakdown
-        content_lines.append("[bold]Vote Breakdown:[/bold]")
-        content_lines.append(
-            f"  [green]APPROVE[/green]: {self.consensus.vote_counts.get('APPROVE', 0)}"
-        )
-        content_lines.append(
-            f"  [red]REJECT[/red]: {self.consensus.vote_counts.get('REJECT', 0)}"
-        )
-        content_lines.append(
-            f"  [yellow]ABSTAIN[/yellow]: {self.consensus.vote_counts.get('ABSTAIN', 0)}"
-        )
+        content_lines = [Text("Vote Breakdown:", style="bold")]
+        for decision_name, decision_color in DECISION_COLORS.items():
+            content_lines.append(Text.assemble(
+                "  ",
+                (decision_name, decision_color),
+                f": {self.consensus.vote_counts.get(decision_name, 0)}",
+            ))
 
         # Key issues
         if self.consensus.key_issues:
-            content_lines.append(f"\n[bold]Key Issues ({len(self.consensus.key_issues)}):[/bold]")
+            content_lines += [
+                Text(),
+                Text(f"Key Issues ({len(self.consensus.key_issues)}):", style="bold"),
+            ]
             for issue in self.consensus.key_issues:
                 desc = issue.get("description", str(issue))
-                sev = issue.get("severity", "LOW")
-                sev_colors = {"CRITICAL": "red", "HIGH": "red", "MEDIUM": "yellow", "LOW": "green"}
-                sev_color = sev_colors.get(sev, "blue")
-                content_lines.append(f"  [{sev_color}]•[/{sev_color}] {desc}")
+                sev_color = SEVERITY_COLORS.get(issue.get("severity", "LOW"), "blue")
+                content_lines.append(_bullet(desc, sev_color))
         else:
-            content_lines.append("\n[green]✓ No major issues identified[/green]")
+            content_lines += [Text(), Text("\u2713 No major issues identified", style="green")]
 
         # Accepted suggestions
         if self.consensus.accepted_suggestions:
-            content_lines.append(
-                f"\n[bold]Agreed Suggestions ({len(self.consensus.accepted_suggestions)}):[/bold]"
-            )
-            for suggestion in self.consensus.accepted_suggestions:
-                content_lines.append(f"  [cyan]•[/cyan] {suggestion}")
-
-        content = "\n".join(content_lines)
-
-        # Create panel with decision as title
-        panel = Panel(
-            content,
-            title=f"[bold {color}]Final Decision: {decision_str}[/bold {color}]",
-            border_style=color,
-            padding=(1, 2),
-        )
-        self.console.print(panel)
+            content_lines += [
+                Text(),
+                Text(
+                    f"Agreed Suggestions ({len(self.consensus.accepted_suggestions)}):",
+                    style="bold",
+                ),
+            ]
+            content_lines += [_bullet(s) for s in self.consensus.accepted_suggestions]
+
+        # Decision in the title, colored to match the border
+        self.console.print(_render_card(
+            f"Final Decision: {decision_str}", color, content_lines, title_style=f"bold {color}"
+        ))
         self.console.print()
 
     def run_quick_review(
@@ -1056,26 +1083,24 @@ class DebateOrchestrator:
             "ABSTAIN": abstain_count,
         }
 
-        # Aggregate all issues
-        all_issues: List[Dict[str, Any]] = []
+        # Aggregate all issues, deduplicated on canonical description
+        unique_issues: Dict[str, Dict[str, Any]] = {}
         for review in self.reviews:
             for issue in review.issues:
-                desc = issue.get("description", str(issue))
-                if desc not in [i.get("description", "") for i in all_issues]:
-                    all_issues.append(issue)
+                unique_issues.setdefault(canonical(issue.get("description", str(issue))), issue)
 
         # Key issues are HIGH/CRITICAL severity
         key_issues = [
-            issue for issue in all_issues
+            issue for issue in unique_issues.values()
             if issue.get("severity", "LOW") in ("CRITICAL", "HIGH")
         ]
 
         # Aggregate all suggestions
-        all_suggestions: List[str] = []
+        unique_suggestions: Dict[str, str] = {}
         for review in self.reviews:
             for suggestion in review.suggestions:
-                if suggestion not in all_suggestions:
-                    all_suggestions.append(suggestion)
+                unique_suggestions.setdefault(canonical(suggestion), suggestion)
+        all_suggestions = list(unique_suggestions.values())
 
         # Create consensus
         self.consensus = Consensus(
@@ -1099,7 +1124,8 @@ class DebateOrchestrator:
     def run_full_debate(
         self,
         code: str,
-        context: Optional[str] = None
+        context: Optional[str] = None,
+        early_exit: bool = False
     ) -> Consensus:
         """Run a complete debate: review -> respond -> vote -> consensus.
 
@@ -1108,6 +1134,8 @@ class DebateOrchestrator:
         Args:
             code: The code to review
             context: Optional context about the code
+            early_exit: If True, skip the response and voting rounds when the
+                Round 1 reviews already imply a strict APPROVE/REJECT majority
 
         Returns:
             Consensus object with final decision and insights
@@ -1115,6 +1143,18 @@ class DebateOrchestrator:
         # Round 1: Initial reviews
         self.start_review(code, context)
 
+        if early_exit:
+            early = majority(
+                (REVIEW_SEVERITY_DECISIONS.get(r.severity, VoteDecision.ABSTAIN) for r in self.reviews),
+                len(self.agents),
+            )
+            if early in (VoteDecision.APPROVE, VoteDecision.REJECT):
+                self.console.print()
+                self.console.print(
+                    f"[dim]Round 1 majority ({early.value}) reached - skipping debate rounds[/dim]"
+                )
+                return self._build_quick_consensus()
+
         # Round 2: Responses/Rebuttals
         self.run_responses()
 
@@ -1124,6 +1164,33 @@ class DebateOrchestrator:
         # Build and return consensus
         return self.build_consensus()
 
+    async def arun_full_debate(
+        self,
+        code: str,
+        context: Optional[str] = None,
+        early_exit: bool = False
+    ) -> Consensus:
+        """Run a complete debate without blocking the event loop.
+
+        Each round already fans agent calls out over a thread pool, so the
+        debate itself runs in the loop's default executor.
+
+        Args:
+            code: The code to review
+            context: Optional context about the code
+            early_exit: Passed through to run_full_debate
+
+        Returns:
+            Consensus object with final decision and insights
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(self.run_full_debate, code, context, early_exit),
+        )
+
     def run_streaming_review(
         self,
         code: str,
@@ -1157,15 +1224,19 @@ class DebateOrchestrator:
         self.console.print("[dim]Watching all agents think simultaneously...[/dim]")
         self.console.print()
 
-        # State for each agent's streaming output
-        agent_buffers: Dict[str, List[str]] = {}
+        # State for each agent's streaming output. Only the displayed tail is
+        # kept (plus a running length), so tokens aren't accumulated twice -
+        # the agent already assembles the full response it parses.
+        agent_buffers: Dict[str, str] = {}
+        agent_lengths: Dict[str, int] = {}
         agent_results: Dict[str, ReviewResult] = {}
         agent_complete: Dict[str, bool] = {}
         buffer_lock = threading.Lock()
 
         # Initialize state for each agent
         for agent in self.agents:
-            agent_buffers[agent.persona.name] = []
+            agent_buffers[agent.persona.name] = ""
+            agent_lengths[agent.persona.name] = 0
             agent_complete[agent.persona.name] = False
 
         def make_panels() -> Group:
@@ -1174,24 +1245,25 @@ class DebateOrchestrator:
             for agent in self.agents:
                 name = agent.persona.name
                 with buffer_lock:
-                    text = "".join(agent_buffers[name])
+                    display_text = agent_buffers[name]
+                    truncated = agent_lengths[name] > STREAM_TAIL_CHARS
                     is_done = agent_complete[name]
 
-                # Truncate to last 500 chars for display
-                display_text = text[-500:] if len(text) > 500 else text
-                if len(text) > 500:
+                if truncated:
                     display_text = "..." + display_text
 
                 # Add status indicator
                 if is_done:
-                    status = "[green]✓ Complete[/green]"
+                    status = ("✓ Complete", "green")
                     border_style = "green"
                 else:
-                    status = "[cyan]● Thinking...[/cyan]"
+                    status = ("● Thinking...", "cyan")
                     border_style = "cyan"
 
+                # Streamed tokens are plain text: skip markup parsing, which
+                # would also swallow any [brackets] the model writes
                 panel = Panel(
-                    f"{display_text}\n\n{status}",
+                    Text.assemble(display_text, "\n\n", status),
                     title=f"[bold]{name}[/bold]",
                     border_style=border_style,
                     height=15,
@@ -1209,7 +1281,8 @@ class DebateOrchestrator:
 
             def on_token(token: str):
                 with buffer_lock:
-                    agent_buffers[name].append(token)
+                    agent_buffers[name] = (agent_buffers[name] + token)[-STREAM_TAIL_CHARS:]
+                    agent_lengths[name] += len(token)
 
             try:
                 result = agent.review_streaming(code, context, on_token, language=self.language)
@@ -1217,16 +1290,16 @@ class DebateOrchestrator:
                     agent_results[name] = result
                     agent_complete[name] = True
                 return result
-            except (*APIExceptions, *ThreadExceptions, ValueError, json.JSONDecodeError) as e:
+            except (*api_exceptions(), *ThreadExceptions, ValueError, json.JSONDecodeError) as e:
                 # Handle API errors, thread issues, and JSON parsing failures
+                on_token(f"\n[{type(e).__name__}: {e}]")
                 with buffer_lock:
-                    agent_buffers[name].append(f"\n[{type(e).__name__}: {e}]")
                     agent_complete[name] = True
                 return None
 
         # Run all agents in parallel with Live display
         with Live(make_panels(), console=self.console, refresh_per_second=8) as live:
-            with ThreadPoolExecutor(max_workers=len(self.agents)) as executor:
+            with ThreadPoolExecutor(max_workers=self._pool_size) as executor:
                 futures = {
                     executor.submit(streaming_task, agent): agent
                     for agent in self.agents
@@ -1235,7 +1308,6 @@ class DebateOrchestrator:
                 # Keep updating the display until all complete
                 while not all(agent_complete.values()):
                     live.update(make_panels())
-                    import time
                     time.sleep(0.1)
 
                 # Final update
@@ -1250,6 +1322,7 @@ class DebateOrchestrator:
         self.console.print("[bold]Review Results:[/bold]")
         self.console.print()
 
+        new_reviews = []
         for agent in self.agents:
             name = agent.persona.name
             if name in agent_results:
@@ -1263,17 +1336,20 @@ class DebateOrchestrator:
                     summary=result.summary,
                     session_id=self.session_id,
                 )
-                self.storage.save_review(review, self.session_id)
-                self.reviews.append(review)
+                new_reviews.append(review)
 
                 # Display summary
-                severity_colors = {"CRITICAL": "red", "HIGH": "red", "MEDIUM": "yellow", "LOW": "green"}
-                color = severity_colors.get(result.severity, "blue")
+                color = SEVERITY_COLORS.get(result.severity, "blue")
                 self.console.print(
                     f"  [bold]{name}[/bold]: [{color}]{result.severity}[/{color}] - "
                     f"{len(result.issues)} issues, {len(result.suggestions)} suggestions"
                 )
 
+        with self.storage.transaction():
+            for review in new_reviews:
+                self.storage.save_review(review, self.session_id)
+        self.reviews.extend(new_reviews)
+
         # Display review summary table
         self._display_review_summary()
 
@@ -3,9 +3,10 @@
 Custom personas are stored in ~/.consensys/personas.json and can be
 created interactively via the CLI.
 """
+import functools
 import json
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 from src.agents.personas import Persona, PERSONAS, PERSONAS_BY_NAME
 
@@ -32,19 +33,20 @@ def get_personas_file() -> Path:
     return get_config_dir() / "personas.json"
 
 
-def load_custom_personas() -> List[Persona]:
-    """Load custom personas from ~/.consensys/personas.json.
+@functools.lru_cache(maxsize=8)
+def _parse_personas_file(path: str, mtime_ns: int, size: int) -> Tuple[Persona, ...]:
+    """Parse a personas file, memoized on its modification time and size.
+
+    Args:
+        path: Path to the personas JSON file
+        mtime_ns: File modification time, part of the cache key only
+        size: File size in bytes, part of the cache key only
 
     Returns:
-        List of custom Persona objects
+        Tuple of parsed Persona objects (empty if the file is malformed)
     """
-    personas_file = get_personas_file()
-
-    if not personas_file.exists():
-        return []
-
     try:
-        with open(personas_file, "r") as f:
+        with open(path, "r") as f:
             data = json.load(f)
 
         personas = []
@@ -58,10 +60,28 @@ def load_custom_personas() -> List[Persona]:
             )
             personas.append(persona)
 
-        return personas
+        return tuple(personas)
     except (json.JSONDecodeError, KeyError, TypeError):
+        return ()
+
+
+def load_custom_personas() -> List[Persona]:
+    """Load custom personas from ~/.consensys/personas.json.
+
+    The file is only re-parsed when its modification time or size changes.
+
+    Returns:
+        List of custom Persona objects
+    """
+    personas_file = get_personas_file()
+
+    try:
+        stat = personas_file.stat()
+    except OSError:
         return []
 
+    return list(_parse_personas_file(str(personas_file), stat.st_mtime_ns, stat.st_size))
+
 
 def save_custom_personas(personas: List[Persona]) -> None:
     """Save custom personas to ~/.consensys/personas.json.
@@ -84,6 +104,9 @@ def save_custom_personas(personas: List[Persona]) -> None:
     with open(personas_file, "w") as f:
         json.dump(data, f, indent=2)
 
+    # A rewrite can land within the filesystem's mtime resolution
+    _parse_personas_file.cache_clear()
+
 
 def save_custom_persona(persona: Persona) -> None:
     """Save a single custom persona, adding to existing ones.
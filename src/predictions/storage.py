@@ -2,10 +2,11 @@
 import sqlite3
 import json
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from pathlib import Path
 
 from src.config import DATABASE_PATH
+from src.db.storage import prefix_range
 from src.predictions.models import (
     Prediction,
     Bet,
@@ -229,6 +230,39 @@ class PredictionStorage:
         finally:
             conn.close()
 
+    def resolve_prediction_id(self, prefix: str, limit: int = 2) -> List[Tuple[str, str]]:
+        """Resolve a prefix to the unresolved predictions it matches.
+
+        The prefix becomes a range on the primary key, so SQLite reads at
+        most ``limit`` index entries instead of scanning every prediction.
+        Two results are enough to tell a unique prefix from an ambiguous one.
+
+        Args:
+            prefix: Leading characters of the prediction ID
+            limit: Maximum number of matches to return
+
+        Returns:
+            (prediction_id, file_path) of matching unresolved predictions in
+            ID order (at most ``limit``)
+        """
+        where, params = prefix_range("p.prediction_id", prefix)
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""
+                SELECT p.prediction_id, p.file_path FROM predictions p
+                WHERE {where}
+                AND NOT EXISTS (SELECT 1 FROM outcomes o WHERE o.prediction_id = p.prediction_id)
+                ORDER BY p.prediction_id
+                LIMIT ?
+                """,
+                (*params, limit)
+            )
+            return [(row["prediction_id"], row["file_path"]) for row in cursor.fetchall()]
+        finally:
+            conn.close()
+
     # Bet operations
     def save_bet(self, bet: Bet) -> str:
         """Save a bet to the database.
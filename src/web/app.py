@@ -1,5 +1,6 @@
 """FastAPI web application for Consensys code review."""
 import asyncio
+import functools
 import json
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -117,9 +118,11 @@ class SessionDetail(BaseModel):
     fixes: List[FixSuggestion] = []
 
 
-# Storage instance (will be created per-request for thread safety)
+# Storage keeps one SQLite connection per thread, so a single instance can
+# serve every request; sharing it also lets get_stats reuse its cache
+@functools.lru_cache(maxsize=None)
 def get_storage() -> Storage:
-    """Get a storage instance."""
+    """Get the shared storage instance."""
     return Storage()
 
 
@@ -257,20 +260,9 @@ async def review_code(request: ReviewRequest):
             )
     else:
         # Full debate: reviews, responses, voting, consensus
-        def run_full():
-            consensus = orchestrator.run_full_debate(request.code, request.context)
-            return (
-                orchestrator.reviews,
-                orchestrator.responses,
-                orchestrator.votes,
-                consensus,
-                orchestrator.session_id,
-            )
-
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            reviews, responses, votes, consensus, session_id = await loop.run_in_executor(
-                executor, run_full
-            )
+        consensus = await orchestrator.arun_full_debate(request.code, request.context)
+        reviews = orchestrator.reviews
+        session_id = orchestrator.session_id
 
     # Convert reviews to dicts
     review_dicts = []
@@ -291,7 +283,7 @@ async def review_code(request: ReviewRequest):
     if consensus:
         vote_counts = consensus.vote_counts
         consensus_dict = {
-            "decision": consensus.final_decision.value if hasattr(consensus.final_decision, 'value') else str(consensus.final_decision),
+            "decision": consensus.final_decision.value,
             "vote_counts": consensus.vote_counts,
             "key_issues": consensus.key_issues,
             "accepted_suggestions": consensus.accepted_suggestions,
@@ -381,12 +373,9 @@ async def get_session(session_id: str) -> SessionDetail:
 
     # If not found, try partial match
     if not session:
-        sessions = storage.list_sessions(limit=100)
-        for s in sessions:
-            if s["session_id"].startswith(session_id):
-                session = storage.get_session(s["session_id"])
-                session_id = s["session_id"]
-                break
+        for match in storage.find_sessions_by_prefix(session_id, limit=1):
+            session = storage.get_session(match)
+            session_id = match
 
     if not session:
         raise HTTPException(status_code=404, detail=f"Session not found: {session_id}")
@@ -425,7 +414,7 @@ async def get_session(session_id: str) -> SessionDetail:
     vote_dicts = [
         {
             "agent_name": v.agent_name,
-            "decision": v.decision.value if hasattr(v.decision, 'value') else str(v.decision),
+            "decision": v.decision.value,
             "reasoning": v.reasoning,
         }
         for v in votes
@@ -434,7 +423,7 @@ async def get_session(session_id: str) -> SessionDetail:
     consensus_dict = None
     if consensus:
         consensus_dict = {
-            "decision": consensus.final_decision.value if hasattr(consensus.final_decision, 'value') else str(consensus.final_decision),
+            "decision": consensus.final_decision.value,
             "vote_counts": consensus.vote_counts,
             "key_issues": consensus.key_issues,
             "accepted_suggestions": consensus.accepted_suggestions,
@@ -482,14 +471,10 @@ async def get_share_link(session_id: str, request: Request) -> ShareLink:
     session = storage.get_session(session_id)
     if not session:
         # Try partial match
-        sessions = storage.list_sessions(limit=100)
-        found = False
-        for s in sessions:
-            if s["session_id"].startswith(session_id):
-                session_id = s["session_id"]
-                found = True
-                break
-        if not found:
+        matching = storage.find_sessions_by_prefix(session_id, limit=1)
+        if matching:
+            session_id = matching[0]
+        else:
             raise HTTPException(status_code=404, detail=f"Session not found: {session_id}")
 
     # Build share URL based on request
@@ -537,12 +522,9 @@ async def session_view(session_id: str, request: Request):
     # Verify session exists (with partial matching)
     session = storage.get_session(session_id)
     if not session:
-        sessions = storage.list_sessions(limit=100)
-        for s in sessions:
-            if s["session_id"].startswith(session_id):
-                session_id = s["session_id"]
-                session = storage.get_session(session_id)
-                break
+        for match in storage.find_sessions_by_prefix(session_id, limit=1):
+            session_id = match
+            session = storage.get_session(session_id)
 
     if not session:
         return HTMLResponse(content=f"""
@@ -612,13 +594,13 @@ async def session_view(session_id: str, request: Request):
         "votes": [
             {
                 "agent_name": v.agent_name,
-                "decision": v.decision.value if hasattr(v.decision, 'value') else str(v.decision),
+                "decision": v.decision.value,
                 "reasoning": v.reasoning,
             }
             for v in votes
         ],
         "consensus": {
-            "decision": consensus.final_decision.value if hasattr(consensus.final_decision, 'value') else str(consensus.final_decision),
+            "decision": consensus.final_decision.value,
             "vote_counts": consensus.vote_counts,
             "key_issues": consensus.key_issues,
             "accepted_suggestions": consensus.accepted_suggestions,
@@ -1007,7 +989,7 @@ async def websocket_review(websocket: WebSocket):
                         "type": "vote",
                         "data": {
                             "agent_name": vote.agent_name,
-                            "decision": vote.decision.value if hasattr(vote.decision, 'value') else str(vote.decision),
+                            "decision": vote.decision.value,
                             "reasoning": vote.reasoning,
                         }
                     })
@@ -1020,7 +1002,7 @@ async def websocket_review(websocket: WebSocket):
 
             # Send consensus
             consensus_data = {
-                "decision": consensus.final_decision.value if hasattr(consensus.final_decision, 'value') else str(consensus.final_decision),
+                "decision": consensus.final_decision.value,
                 "vote_counts": consensus.vote_counts,
                 "key_issues": consensus.key_issues,
                 "accepted_suggestions": consensus.accepted_suggestions,
@@ -6,11 +6,20 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.agents._client import get_client
 from src.agents.personas import Persona, PERSONAS, SecurityExpert, PerformanceEngineer
 from src.models.review import Review, Response, Vote, Consensus, VoteDecision
 from src.db.storage import Storage
 
 
+@pytest.fixture(autouse=True)
+def reset_shared_client():
+    """Drop the cached Anthropic client so per-test patches take effect."""
+    get_client.cache_clear()
+    yield
+    get_client.cache_clear()
+
+
 @pytest.fixture
 def temp_db_path():
     """Create a temporary database path for testing."""
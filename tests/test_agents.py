@@ -16,6 +16,8 @@ from src.agents.personas import (
     DEBATE_PERSONAS_BY_NAME,
 )
 from src.agents.agent import Agent, ReviewResult, ResponseResult, VoteResult, CodeFixer, FixResult
+from src.agents._client import close_client, get_client, is_api_error
+from src.agents._parsing import strip_code_fence
 from src.models.review import VoteDecision
 
 
@@ -95,25 +97,105 @@ class TestPersonaDataclass:
         assert custom.role == "Test Role"
         assert len(custom.priorities) == 2
 
+    def test_persona_is_immutable(self):
+        """Personas should be frozen and carry no per-instance __dict__."""
+        from dataclasses import FrozenInstanceError
+
+        with pytest.raises(FrozenInstanceError):
+            SecurityExpert.name = "Renamed"
+        assert not hasattr(SecurityExpert, "__dict__")
+
+    def test_persona_copy_and_pickle_round_trip(self):
+        """Personas should survive deepcopy and pickle despite being frozen and slotted."""
+        import copy
+        import pickle
+
+        for restored in (copy.deepcopy(SecurityExpert), pickle.loads(pickle.dumps(SecurityExpert))):
+            assert restored == SecurityExpert
+            assert restored is not SecurityExpert
+            assert restored.priorities is not SecurityExpert.priorities
+
+    def test_persona_name_is_interned(self):
+        """Persona names should be interned for identity-hit dict lookups."""
+        import sys
+
+        name = "".join(["Interned", "Expert"])
+        custom = Persona(
+            name=name,
+            role="Test Role",
+            system_prompt="Test prompt",
+            priorities=[],
+            review_style="test style",
+        )
+        assert custom.name is sys.intern("InternedExpert")
+
+
+class TestStripCodeFence:
+    """Tests for markdown fence removal."""
+
+    def test_unfenced_text_unchanged(self):
+        """Text without a fence should pass through untouched."""
+        assert strip_code_fence('{"a": 1}') == '{"a": 1}'
+
+    def test_fence_with_language_tag(self):
+        """Opening ```json and closing ``` lines should be removed."""
+        assert strip_code_fence('```json\n{"a": 1}\n```') == '{"a": 1}'
+
+    def test_unterminated_fence_keeps_body(self):
+        """A missing closing fence should still drop the opening line."""
+        assert strip_code_fence('```\n{"a": 1}') == '{"a": 1}'
+
+    def test_empty_fence(self):
+        """A bare fence should yield an empty string."""
+        assert strip_code_fence('```') == ''
+
 
 class TestAgent:
     """Tests for Agent wrapper class."""
 
-    @patch("src.agents.agent.Anthropic")
+    @patch("anthropic.Anthropic")
     def test_agent_creation(self, mock_anthropic):
         """Agent should initialize with a persona."""
         agent = Agent(SecurityExpert)
         assert agent.persona == SecurityExpert
         assert agent.persona.name == "SecurityExpert"
 
-    @patch("src.agents.agent.Anthropic")
+    @patch("anthropic.Anthropic")
+    def test_agents_share_client(self, mock_anthropic):
+        """All agents should reuse one process-wide Anthropic client."""
+        first = Agent(SecurityExpert)
+        second = Agent(PerformanceEngineer)
+        assert first.client is second.client
+        mock_anthropic.assert_called_once()
+
+    @patch("anthropic.Anthropic")
+    def test_close_client_releases_pool(self, mock_anthropic):
+        """close_client should close the shared client and drop it."""
+        client = get_client()
+        close_client()
+        client.close.assert_called_once()
+        assert get_client.cache_info().currsize == 0
+
+    def test_is_api_error(self):
+        """is_api_error should match Anthropic API errors only."""
+        import anthropic
+        request = MagicMock()
+        assert is_api_error(anthropic.APIConnectionError(request=request))
+        assert not is_api_error(ValueError("bad json"))
+
+    def test_close_client_without_client(self):
+        """close_client should be a no-op when no client was created."""
+        close_client()
+        assert get_client.cache_info().currsize == 0
+
+    @patch("anthropic.Anthropic")
     def test_agent_repr(self, mock_anthropic):
         """Agent __repr__ should include persona name."""
         agent = Agent(SecurityExpert)
         repr_str = repr(agent)
         assert "SecurityExpert" in repr_str
 
-    @patch("src.agents.agent.Anthropic")
+    @patch("anthropic.Anthropic")
     def test_build_system_prompt_review(self, mock_anthropic):
         """_build_system_prompt should include persona details for review task."""
         agent = Agent(SecurityExpert)
@@ -122,7 +204,7 @@ class TestAgent:
         assert "JSON" in prompt
         assert "issues" in prompt
 
-    @patch("src.agents.agent.Anthropic")
+    @patch("anthropic.Anthropic")
     def test_build_system_prompt_respond(self, mock_anthropic):
         """_build_system_prompt should include response instructions."""
         agent = Agent(SecurityExpert)
@@ -130,7 +212,7 @@ class TestAgent:
         assert "agreement_level" in prompt
         assert "AGREE" in prompt
 
-    @patch("src.agents.agent.Anthropic")
+    @patch("anthropic.Anthropic")
     def test_build_system_prompt_vote(self, mock_anthropic):
         """_build_system_prompt should include vote instructions."""
         agent = Agent(SecurityExpert)
@@ -139,14 +221,14 @@ class TestAgent:
         assert "APPROVE" in prompt
         assert "REJECT" in prompt
 
-    @patch("src.agents.agent.Anthropic")
+    @patch("anthropic.Anthropic")
     def test_parse_json_response_clean(self, mock_anthropic):
         """_parse_json_response should handle clean JSON."""
         agent = Agent(SecurityExpert)
         data = agent._parse_json_response('{"key": "value"}')
         assert data == {"key": "value"}
 
-    @patch("src.agents.agent.Anthropic")
+    @patch("anthropic.Anthropic")
     def test_parse_json_response_with_markdown(self, mock_anthropic):
         """_parse_json_response should strip markdown code blocks."""
         agent = Agent(SecurityExpert)
@@ -156,7 +238,7 @@ class TestAgent:
         data = agent._parse_json_response(response)
         assert data == {"key": "value"}
 
-    @patch("src.agents.agent.Anthropic")
+    @patch("anthropic.Anthropic")
     def test_review_returns_review_result(self, mock_anthropic, mock_anthropic_response):
         """review() should return a ReviewResult."""
         mock_anthropic.return_value.messages.create.return_value = mock_anthropic_response
@@ -168,7 +250,7 @@ class TestAgent:
         assert isinstance(result.issues, list)
         assert isinstance(result.suggestions, list)
 
-    @patch("src.agents.agent.Anthropic")
+    @patch("anthropic.Anthropic")
     def test_review_with_context(self, mock_anthropic, mock_anthropic_response):
         """review() should accept optional context."""
         mock_anthropic.return_value.messages.create.return_value = mock_anthropic_response
@@ -180,7 +262,7 @@ class TestAgent:
         call_args = mock_anthropic.return_value.messages.create.call_args
         assert "test code" in str(call_args)
 
-    @patch("src.agents.agent.Anthropic")
+    @patch("anthropic.Anthropic")
     def test_respond_to_returns_response_result(self, mock_anthropic, mock_anthropic_respond_response):
         """respond_to() should return a ResponseResult."""
         mock_anthropic.return_value.messages.create.return_value = mock_anthropic_respond_response
@@ -201,7 +283,7 @@ class TestAgent:
         assert result.agent_name == "PragmaticDev"
         assert result.responding_to == "SecurityExpert"
 
-    @patch("src.agents.agent.Anthropic")
+    @patch("anthropic.Anthropic")
     def test_vote_returns_vote_result(self, mock_anthropic, mock_anthropic_vote_response):
         """vote() should return a VoteResult."""
         mock_anthropic.return_value.messages.create.return_value = mock_anthropic_vote_response
@@ -224,7 +306,7 @@ class TestAgent:
         assert result.agent_name == "SecurityExpert"
         assert isinstance(result.decision, VoteDecision)
 
-    @patch("src.agents.agent.Anthropic")
+    @patch("anthropic.Anthropic")
     def test_vote_with_responses(self, mock_anthropic, mock_anthropic_vote_response):
         """vote() should accept optional responses."""
         mock_anthropic.return_value.messages.create.return_value = mock_anthropic_vote_response
@@ -309,13 +391,13 @@ class TestVoteResult:
 class TestCodeFixer:
     """Tests for CodeFixer class."""
 
-    @patch("src.agents.agent.Anthropic")
+    @patch("anthropic.Anthropic")
     def test_code_fixer_creation(self, mock_anthropic):
         """CodeFixer should initialize without errors."""
         fixer = CodeFixer()
         assert fixer.model is not None
 
-    @patch("src.agents.agent.Anthropic")
+    @patch("anthropic.Anthropic")
     def test_code_fixer_fix_code(self, mock_anthropic):
         """fix_code() should return FixResult."""
         mock_response = MagicMock()
@@ -1,10 +1,16 @@
 """Tests for CLI commands."""
+import io
+import json
+import os
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 from click.testing import CliRunner
+from rich.console import Console
 
 from src.cli import (
     cli,
@@ -12,8 +18,26 @@ from src.cli import (
     filter_issues_by_severity,
     check_fail_threshold,
     SEVERITY_ORDER,
+    DECISION_MARKUP,
+    SEVERITY_MARKUP,
+    SEVERITY_STYLES,
+    _build_pr_comment,
+    _code_panel,
+    _diff_panel,
+    _diff_syntax,
+    _edit_multiline,
+    CODE_PREVIEW_HEAD_CHARS,
+    CODE_PREVIEW_TAIL_CHARS,
+    DIFF_PREVIEW_EDGE_LINES,
+    DIFF_PREVIEW_MAX_LINE_CHARS,
+    _get_lexer,
+    _read_source,
+    _write_text_atomic,
+    _review_file_changes,
 )
-from src.models.review import Review, Consensus, VoteDecision
+from src.db.storage import Storage
+from src.git.helpers import ChangedFile, RepoInfo
+from src.models.review import Review, Response, Vote, Consensus, VoteDecision
 
 
 @pytest.fixture
@@ -22,6 +46,40 @@ def runner():
     return CliRunner()
 
 
+@pytest.fixture
+def populated_storage(tmp_path):
+    """Create a storage with one complete session whose text contains brackets."""
+    storage = Storage(db_path=tmp_path / "replay.db")
+    session_id = storage.create_session("items[0] = 1")
+    storage.save_review(Review(
+        agent_name="SecurityExpert",
+        issues=[{"description": "Index [bold] unchecked", "severity": "HIGH",
+                 "line": 1, "fix": "if items:\n    items[0] = 1"}],
+        suggestions=["Use items[-1]"],
+        severity="HIGH",
+        summary="Guard the list [access]",
+    ), session_id)
+    storage.save_response(Response(
+        agent_name="Architect",
+        responding_to="SecurityExpert",
+        agreement_level="AGREE",
+        points=["Bounds [check] needed"],
+    ), session_id)
+    storage.save_vote(Vote(
+        agent_name="Architect",
+        decision=VoteDecision.REJECT,
+        reasoning="Unsafe [index]",
+    ), session_id)
+    storage.save_consensus(Consensus(
+        final_decision=VoteDecision.REJECT,
+        vote_counts={"APPROVE": 0, "REJECT": 1, "ABSTAIN": 0},
+        key_issues=[{"description": "Index [bold] unchecked"}],
+        accepted_suggestions=["Use items[-1]"],
+        session_id=session_id,
+    ))
+    return storage, session_id
+
+
 class TestCLIGroup:
     """Tests for the main CLI group."""
 
@@ -38,6 +96,37 @@ class TestCLIGroup:
         assert "0.1.0" in result.output
 
 
+class TestCLIStartup:
+    """Tests for CLI import cost."""
+
+    def test_import_does_not_load_anthropic(self):
+        """Importing the CLI should not import the anthropic SDK."""
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, src.cli; print('anthropic' in sys.modules)"],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent.parent,
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_import_defers_debate_modules(self):
+        """Debate, storage, highlighting and progress modules load on first use."""
+        code = (
+            "import sys, src.cli; "
+            "print(sorted(m for m in ('src.orchestrator.debate', 'src.export.exporter', "
+            "'src.db.storage', 'sqlite3', 'rich.syntax', 'rich.progress', 'orjson') "
+            "if m in sys.modules)); "
+            "src.cli.DebateExporter; print('src.export.exporter' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent.parent,
+        )
+        assert result.stdout.split() == ["[]", "True"]
+
+
 class TestSeverityHelpers:
     """Tests for severity helper functions."""
 
@@ -102,6 +191,120 @@ class TestSeverityHelpers:
         assert len(filtered) == 2
 
 
+class TestStatusMarkup:
+    """Tests for pre-rendered status markup."""
+
+    def test_markup_matches_colors(self):
+        """Pre-rendered markup should wrap each value in its color."""
+        assert DECISION_MARKUP["APPROVE"] == "[green]APPROVE[/green]"
+        assert SEVERITY_MARKUP["CRITICAL"] == "[red]CRITICAL[/red]"
+
+    def test_styles_match_colors(self):
+        """Shared Style instances should use the same colors as the markup."""
+        assert SEVERITY_STYLES["MEDIUM"].color.name == "yellow"
+
+
+class TestCodePanel:
+    """Tests for the shared code panel helper."""
+
+    def test_lexer_is_cached(self):
+        """_get_lexer should return the same instance for repeated lookups."""
+        assert _get_lexer("python") is _get_lexer("python")
+
+    def test_unknown_language_falls_back_to_text(self):
+        """_get_lexer should fall back to a plain-text lexer for unknown aliases."""
+        assert _get_lexer("not-a-language").name == "Text only"
+
+    def test_code_panel_uses_shared_lexer(self):
+        """_code_panel should highlight with the cached lexer on a terminal."""
+        with patch("src.cli.console", Console(force_terminal=True)):
+            panel = _code_panel("x = 1", "python", title="Code", border_style="cyan")
+        assert panel.renderable.lexer is _get_lexer("python")
+        assert panel.title == "Code"
+
+    def test_code_panel_skips_highlighting_when_piped(self):
+        """_code_panel should not lex the language when output is not a terminal."""
+        with patch("src.cli.console", Console(file=io.StringIO())):
+            panel = _code_panel("x = 1", "python", title="Code", border_style="cyan")
+        assert panel.renderable.lexer is _get_lexer("text")
+
+    def test_code_panel_truncates_huge_code(self):
+        """Huge code should be shown as line-aligned head and tail with true line numbers."""
+        code = "".join(f"value_{n:07d} = {n}\n" for n in range(1, 30001))
+        head, marker, tail = _code_panel(code, "python", title="Code", border_style="cyan").renderable.renderables
+
+        assert head.code.startswith("value_0000001 = 1\n")
+        head_lines = head.code.count("\n") + 1
+        assert head.code.splitlines()[-1] == f"value_{head_lines:07d} = {head_lines}"
+        assert tail.code.splitlines()[0] == f"value_{tail.start_line:07d} = {tail.start_line}"
+        assert tail.code.endswith("value_0030000 = 30000\n")
+        assert f"{tail.start_line - head_lines - 1} lines not shown" in marker.plain
+
+    def test_code_panel_truncates_single_line(self):
+        """A huge one-line file should still be cut to head and tail characters."""
+        code = "x=1;" * 1_000_000
+        head, marker, tail = _code_panel(code, "javascript", title="Code", border_style="cyan").renderable.renderables
+
+        assert len(head.code) == CODE_PREVIEW_HEAD_CHARS
+        assert len(tail.code) == CODE_PREVIEW_TAIL_CHARS
+        assert tail.start_line == 1
+        hidden = len(code) - CODE_PREVIEW_HEAD_CHARS - CODE_PREVIEW_TAIL_CHARS
+        assert f"{hidden} characters not shown" in marker.plain
+
+
+class TestReadSource:
+    """Tests for reading source files."""
+
+    def test_read_source_utf8(self, tmp_path):
+        """_read_source should decode UTF-8 regardless of locale."""
+        path = tmp_path / "a.py"
+        path.write_bytes("name = 'caf\u00e9'\n".encode("utf-8"))
+        assert _read_source(path) == "name = 'caf\u00e9'\n"
+
+    def test_read_source_normalizes_newlines(self, tmp_path):
+        """_read_source should convert CRLF and CR line endings to LF."""
+        path = tmp_path / "a.py"
+        path.write_bytes(b"a = 1\r\nb = 2\rc = 3\n")
+        assert _read_source(path) == "a = 1\nb = 2\nc = 3\n"
+
+    def test_read_source_replaces_invalid_bytes(self, tmp_path):
+        """_read_source should not fail on invalid UTF-8."""
+        path = tmp_path / "a.py"
+        path.write_bytes(b"x = '\xff'\n")
+        assert _read_source(path) == "x = '\ufffd'\n"
+
+    def test_read_source_max_bytes(self, tmp_path):
+        """_read_source should stop at max_bytes on a line boundary."""
+        path = tmp_path / "big.py"
+        path.write_bytes(b"a = 1\nb = 2\nc = 3\n")
+        assert _read_source(path, max_bytes=9) == "a = 1\n"
+        assert _read_source(path, max_bytes=18) == "a = 1\nb = 2\nc = 3\n"
+
+    def test_write_text_atomic_replaces_file(self, tmp_path):
+        """_write_text_atomic should overwrite as UTF-8, keep the mode and leave no temp file."""
+        path = tmp_path / "script.py"
+        path.write_text("old\n")
+        path.chmod(0o755)
+
+        _write_text_atomic(path, "name = 'caf\u00e9'\n")
+
+        assert path.read_bytes() == "name = 'caf\u00e9'\n".encode("utf-8")
+        assert path.stat().st_mode & 0o777 == 0o755
+        assert [p.name for p in tmp_path.iterdir()] == ["script.py"]
+
+    def test_write_text_atomic_new_file_mode(self, tmp_path):
+        """A new file should get the umask's default mode, not the temp file's 0600."""
+        path = tmp_path / "new.py"
+        umask = os.umask(0o022)
+        try:
+            _write_text_atomic(path, "x = 1\n")
+        finally:
+            os.umask(umask)
+
+        assert path.read_text() == "x = 1\n"
+        assert path.stat().st_mode & 0o777 == 0o644
+
+
 class TestCheckFailThreshold:
     """Tests for check_fail_threshold function."""
 
@@ -216,6 +419,130 @@ class TestReviewCommand:
         # Quick review should be called
         assert mock_instance.run_quick_review.called or result.exit_code == 0
 
+    @patch("src.cli.DebateOrchestrator")
+    def test_review_refuses_fix_for_capped_file(self, mock_orchestrator, runner, tmp_path, monkeypatch):
+        """A file reviewed from its first part only must not be written back."""
+        original = "a = 1\n" * 10
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "big.py").write_text(original)
+        with patch("src.cli.SOURCE_MAX_BYTES", 20):
+            result = runner.invoke(cli, ["review", "big.py", "--fix", "--output", "big.py"])
+
+        assert (tmp_path / "big.py").read_text() == original
+
+        assert result.exit_code == 2
+        assert "--fix/--output" in result.output
+        mock_orchestrator.assert_not_called()
+
+    @patch("src.cli.DebateOrchestrator")
+    def test_review_builds_orchestrator_once(self, mock_orchestrator, runner):
+        """review should build one orchestrator and run the debate on it."""
+        mock_instance = MagicMock()
+        mock_orchestrator.return_value = mock_instance
+        mock_instance.run_full_debate.return_value = Consensus(
+            final_decision=VoteDecision.APPROVE,
+            vote_counts={"APPROVE": 4, "REJECT": 0, "ABSTAIN": 0},
+        )
+        mock_instance.reviews = []
+
+        result = runner.invoke(cli, ["review", "--code", "x = 1", "--no-cache"])
+
+        assert result.exit_code == 0
+        mock_orchestrator.assert_called_once()
+        assert mock_orchestrator.call_args.kwargs["use_cache"] is False
+        mock_instance.run_full_debate.assert_called_once()
+
+    @patch("src.agents.agent.CodeFixer")
+    @patch("src.cli.DebateOrchestrator")
+    def test_review_fix_dedupes_findings(self, mock_orchestrator, mock_fixer, runner):
+        """review --fix should send each issue and suggestion to the fixer once."""
+        from src.agents.agent import FixResult
+
+        mock_instance = MagicMock()
+        mock_orchestrator.return_value = mock_instance
+        mock_instance.run_full_debate.return_value = Consensus(
+            final_decision=VoteDecision.REJECT,
+            vote_counts={"APPROVE": 0, "REJECT": 2, "ABSTAIN": 0},
+            accepted_suggestions=["Validate input"],
+        )
+        issue = {"description": "Missing check", "severity": "HIGH"}
+        mock_instance.reviews = [
+            Review(agent_name=name, issues=[dict(issue)], suggestions=["validate input"],
+                   severity="HIGH", confidence=0.9, summary="s")
+            for name in ("SecurityExpert", "PragmaticDev")
+        ]
+        mock_fixer.return_value.fix_code.return_value = FixResult(
+            original_code="x = 1", fixed_code="x = 2", changes_made=[], explanation="",
+        )
+
+        result = runner.invoke(cli, ["review", "--code", "x = 1", "--fix", "--no-cache"])
+
+        assert result.exit_code == 0
+        kwargs = mock_fixer.return_value.fix_code.call_args.kwargs
+        assert kwargs["issues"] == [issue]
+        assert kwargs["suggestions"] == ["validate input"]
+
+    @patch("src.agents.agent.CodeFixer")
+    @patch("src.cli.DebateOrchestrator")
+    def test_review_fix_dedupe_keeps_highest_severity(self, mock_orchestrator, mock_fixer, runner):
+        """Duplicate issues should keep the most severe report, not the first one."""
+        from src.agents.agent import FixResult
+
+        mock_instance = MagicMock()
+        mock_orchestrator.return_value = mock_instance
+        mock_instance.run_full_debate.return_value = Consensus(
+            final_decision=VoteDecision.REJECT,
+            vote_counts={"APPROVE": 0, "REJECT": 2, "ABSTAIN": 0},
+        )
+        mock_instance.reviews = [
+            Review(agent_name="PragmaticDev", severity="LOW", confidence=0.9, summary="s", issues=[
+                {"description": "SQL injection", "severity": "LOW"},
+                {"description": "Unused import", "severity": "LOW"},
+            ]),
+            Review(agent_name="SecurityExpert", severity="CRITICAL", confidence=0.9, summary="s", issues=[
+                {"description": "SQL Injection", "severity": "CRITICAL"},
+            ]),
+        ]
+        mock_fixer.return_value.fix_code.return_value = FixResult(
+            original_code="x = 1", fixed_code="x = 2", changes_made=[], explanation="",
+        )
+
+        result = runner.invoke(cli, ["review", "--code", "x = 1", "--fix", "--no-cache"])
+
+        assert result.exit_code == 0
+        assert mock_fixer.return_value.fix_code.call_args.kwargs["issues"] == [
+            {"description": "SQL Injection", "severity": "CRITICAL"},
+            {"description": "Unused import", "severity": "LOW"},
+        ]
+
+    @patch("src.agents.agent.CodeFixer")
+    @patch("src.cli.DebateOrchestrator")
+    def test_review_fix_reuses_cached_fix(self, mock_orchestrator, mock_fixer, runner, tmp_path):
+        """A repeated --fix on the same code and findings should not call the fixer again."""
+        from src.agents.agent import FixResult
+        from src.cache import ReviewCache
+
+        mock_instance = MagicMock()
+        mock_orchestrator.return_value = mock_instance
+        mock_instance.run_full_debate.return_value = Consensus(
+            final_decision=VoteDecision.REJECT,
+            vote_counts={"APPROVE": 0, "REJECT": 1, "ABSTAIN": 0},
+            accepted_suggestions=["Validate input"],
+        )
+        mock_instance.reviews = []
+        mock_fixer.return_value.fix_code.return_value = FixResult(
+            original_code="x = 1", fixed_code="x = 2", changes_made=["renamed"], explanation="",
+        )
+
+        with patch("src.cache.get_cache", return_value=ReviewCache(db_path=tmp_path / "cache.db")):
+            first = runner.invoke(cli, ["review", "--code", "x = 1", "--fix"])
+            second = runner.invoke(cli, ["review", "--code", "x = 1", "--fix"])
+
+        assert first.exit_code == 0 and second.exit_code == 0
+        assert mock_fixer.return_value.fix_code.call_count == 1
+        assert "Using cached fix" in second.output
+        assert "renamed" in second.output
+
     def test_review_file_not_found(self, runner):
         """review should error for non-existent file."""
         result = runner.invoke(cli, ["review", "/nonexistent/file.py"])
@@ -228,11 +555,12 @@ class TestHistoryCommand:
     @patch("src.cli.Storage")
     def test_history_command(self, mock_storage, runner):
         """history command should list sessions."""
-        mock_storage.return_value.list_sessions.return_value = [
+        mock_storage.return_value.list_sessions_preview.return_value = [
             {
                 "session_id": "test-123",
-                "code_snippet": "x = 1",
+                "preview": "x = 1",
                 "created_at": "2024-01-01T00:00:00",
+                "created_at_short": "2024-01-01 00:00",
                 "final_decision": "APPROVE",
             }
         ]
@@ -241,6 +569,62 @@ class TestHistoryCommand:
         # Should complete or show output
         assert result.exit_code == 0 or mock_storage.called
 
+    @patch("src.cli.Storage")
+    def test_history_json(self, mock_storage, runner):
+        """history --json should print the sessions as JSON."""
+        sessions = [
+            {
+                "session_id": "test-123",
+                "code_snippet": "x = 1",
+                "created_at": "2024-01-01T00:00:00",
+                "final_decision": "APPROVE",
+            }
+        ]
+        mock_storage.return_value.list_sessions.return_value = sessions
+
+        result = runner.invoke(cli, ["history", "--json"])
+        assert result.exit_code == 0
+        assert json.loads(result.output) == sessions
+
+
+class TestReplayCommand:
+    """Tests for the replay command."""
+
+    def test_replay_renders_text_literally(self, runner, populated_storage):
+        """replay should show stored text verbatim rather than parsing it as markup."""
+        storage, session_id = populated_storage
+        with patch("src.cli.Storage", return_value=storage), \
+                patch("src.cli.console", Console(width=200)):
+            result = runner.invoke(cli, ["replay", session_id[:8]])
+
+        assert result.exit_code == 0
+        assert "Index [bold] unchecked (line 1)" in result.output
+        assert "Bounds [check] needed" in result.output
+        assert "Unsafe [index]" in result.output
+        assert "REJECT: 1" in result.output
+
+    def test_replay_json(self, runner, populated_storage):
+        """replay --json should emit the full session bundle as JSON."""
+        storage, session_id = populated_storage
+        with patch("src.cli.Storage", return_value=storage):
+            result = runner.invoke(cli, ["replay", session_id[:8], "--json"])
+
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["session"]["session_id"] == session_id
+        assert data["reviews"][0]["agent_name"] == "SecurityExpert"
+        assert data["votes"][0]["decision"] == "REJECT"
+        assert data["consensus"]["final_decision"] == "REJECT"
+
+    def test_replay_json_not_found(self, runner, populated_storage):
+        """replay --json should fail with a non-zero exit for unknown sessions."""
+        storage, _ = populated_storage
+        with patch("src.cli.Storage", return_value=storage):
+            result = runner.invoke(cli, ["replay", "zzzz", "--json"])
+
+        assert result.exit_code != 0
+        assert "Session not found: zzzz" in result.output
+
 
 class TestStatsCommand:
     """Tests for the stats command."""
@@ -270,6 +654,205 @@ class TestExportCommand:
         # Should fail or prompt
         assert result.exit_code != 0 or "Usage" in result.output
 
+    def test_export_resolves_prefix(self, runner, populated_storage, tmp_path):
+        """export should resolve a session ID prefix and write the file."""
+        from src.export.exporter import DebateExporter
+
+        storage, session_id = populated_storage
+        output = tmp_path / "review.md"
+        with patch("src.cli.Storage", return_value=storage), \
+                patch("src.cli.DebateExporter", return_value=DebateExporter(storage)):
+            result = runner.invoke(cli, ["export", session_id[:8], "-o", str(output)])
+
+        assert result.exit_code == 0
+        assert session_id in output.read_text()
+
+    def test_export_html_writes_document(self, runner, populated_storage, tmp_path):
+        """export --format html should stream a complete, escaped HTML document."""
+        from src.export.exporter import DebateExporter
+
+        storage, session_id = populated_storage
+        output = tmp_path / "review.html"
+        with patch("src.cli.Storage", return_value=storage), \
+                patch("src.cli.DebateExporter", return_value=DebateExporter(storage)):
+            result = runner.invoke(cli, ["export", session_id, "-f", "html", "-o", str(output)])
+
+        assert result.exit_code == 0
+        document = output.read_text(encoding="utf-8")
+        assert document.startswith("<!DOCTYPE html>")
+        assert document.rstrip().endswith("</html>")
+        assert "items[0] = 1" in document
+
+
+class TestDiffPanel:
+    """Tests for the changed-file diff preview."""
+
+    def _render(self, panel):
+        test_console = Console(record=True, width=120)
+        test_console.print(panel)
+        return test_console.export_text()
+
+    def test_small_diff_rendered_in_full(self):
+        """Short diffs should be shown completely."""
+        output = self._render(_diff_panel("a.py", "+one\n+two\n"))
+        assert "Diff: a.py" in output
+        assert "+two" in output
+        assert "omitted" not in output
+
+    def test_huge_diff_shows_head_and_tail(self):
+        """Long diffs should keep their edges and real line numbers."""
+        diff = "\n".join(f"+line {n}" for n in range(1, 1001))
+        output = self._render(_diff_panel("big.py", diff))
+        assert f"+line {DIFF_PREVIEW_EDGE_LINES}" in output
+        assert "+line 500" not in output
+        assert "600 lines omitted" in output
+        assert "1000 +line 1000" in output
+
+    def test_long_diff_lines_clipped(self):
+        """Minified lines should be clipped before highlighting."""
+        syntax = _diff_syntax("+" + "x" * 50_000 + "\n+short")
+        first, second = syntax.code.splitlines()
+        assert len(first) == DIFF_PREVIEW_MAX_LINE_CHARS + len(" ...")
+        assert second == "+short"
+
+
+class TestPRComment:
+    """Tests for the PR summary comment."""
+
+    def test_comment_layout(self, sample_consensus):
+        """The comment should list the decision, votes, issues and suggestions."""
+        comment = _build_pr_comment(sample_consensus)
+
+        assert comment.startswith("## Consensys Code Review\n\n**Decision:** REJECT\n")
+        assert "- APPROVE: 1\n- REJECT: 3\n- ABSTAIN: 0\n" in comment
+        assert "**Key Issues:**\n- Command injection\n\n" in comment
+        assert "**Agreed Suggestions:**\n- Use subprocess with shell=False\n\n---\n" in comment
+
+    def test_comment_caps_items(self, sample_consensus):
+        """Only the first max_items issues should be listed."""
+        sample_consensus.key_issues = [{"description": f"issue {n}"} for n in range(10)]
+        sample_consensus.accepted_suggestions = []
+
+        comment = _build_pr_comment(sample_consensus, max_items=3)
+        assert "- issue 2\n" in comment
+        assert "issue 3" not in comment
+        assert "Agreed Suggestions" not in comment
+
+
+class TestGitCommands:
+    """Tests for the diff and commit commands' repository checks."""
+
+    @patch("src.cli.get_repo_info", return_value=None)
+    def test_diff_outside_repo(self, mock_info, runner):
+        """diff should fail cleanly outside a git repository."""
+        result = runner.invoke(cli, ["diff"])
+        assert result.exit_code == 1
+        assert "Not in a git repository" in result.output
+
+    @patch("src.cli.get_staged_changes", return_value=[])
+    @patch("src.cli.get_repo_info", return_value=RepoInfo(root="/repo", branch="feature"))
+    def test_commit_shows_repo_and_branch(self, mock_info, mock_staged, runner):
+        """commit should show the root and branch from a single lookup."""
+        result = runner.invoke(cli, ["commit"])
+        assert result.exit_code == 0
+        assert "/repo" in result.output
+        assert "feature" in result.output
+        assert "No staged changes" in result.output
+        mock_info.assert_called_once_with()
+
+
+class TestReviewFileChanges:
+    """Tests for per-file debates over changed files."""
+
+    @staticmethod
+    def _orchestrator_factory(created):
+        def make(*args, **kwargs):
+            orchestrator = MagicMock()
+            orchestrator.session_id = f"session-{len(created)}"
+            orchestrator.run_full_debate.side_effect = (
+                lambda code, context: kwargs["console"].print(f"debated {context}")
+            )
+            created.append(orchestrator)
+            return orchestrator
+        return make
+
+    @pytest.mark.parametrize("concurrency", [1, 4])
+    def test_each_file_gets_its_own_debate(self, concurrency):
+        """Every file should be debated by a fresh orchestrator, output kept per file."""
+        files = [
+            ChangedFile(path="a.py", status="M", diff="+a = 1\n"),
+            ChangedFile(path="b.py", status="M", diff="+b = 2\n"),
+            ChangedFile(path="empty.py", status="M", diff=""),
+        ]
+        created = []
+        test_console = Console(record=True, width=120)
+        with patch("src.cli.DebateOrchestrator", side_effect=self._orchestrator_factory(created)), \
+                patch("src.cli.get_team_personas", return_value=[]), \
+                patch("src.cli.Storage"), \
+                patch("src.cli.console", test_console):
+            session_id = _review_file_changes(files, context_prefix="Staged: ", concurrency=concurrency)
+
+        output = test_console.export_text()
+        assert len(created) == 2
+        assert session_id in {"session-0", "session-1"}
+        assert "debated Staged: File: a.py (Status: M)" in output
+        assert "debated Staged: File: b.py (Status: M)" in output
+        assert "Skipping empty.py" in output
+        # Blocks are flushed in input order regardless of completion order
+        assert output.index("Diff: a.py") < output.index("Diff: b.py") < output.index("Skipping empty.py")
+        # Each debated file's session is listed, not only the returned one
+        assert "session-0" in output and "session-1" in output
+
+    def test_parallel_buffers_are_not_terminals(self):
+        """Buffered per-file consoles keep colour but skip transient live frames."""
+        files = [
+            ChangedFile(path="a.py", status="M", diff="+a = 1\n"),
+            ChangedFile(path="b.py", status="M", diff="+b = 2\n"),
+        ]
+        consoles = []
+
+        def make(*args, **kwargs):
+            consoles.append(kwargs["console"])
+            orchestrator = MagicMock()
+            orchestrator.session_id = "session"
+            return orchestrator
+
+        test_console = Console(file=io.StringIO(), force_terminal=True, color_system="truecolor", width=120)
+        with patch("src.cli.DebateOrchestrator", side_effect=make), \
+                patch("src.cli.get_team_personas", return_value=[]), \
+                patch("src.cli.Storage"), \
+                patch("src.cli.console", test_console):
+            _review_file_changes(files, concurrency=2)
+
+        assert len(consoles) == 2
+        assert all(not c.is_terminal and c.color_system == "truecolor" for c in consoles)
+
+    def test_failed_file_does_not_stop_others(self):
+        """An error in one file's debate should be reported without aborting the rest."""
+        files = [
+            ChangedFile(path="bad.py", status="M", diff="+x\n"),
+            ChangedFile(path="good.py", status="M", diff="+y\n"),
+        ]
+
+        def make(*args, **kwargs):
+            orchestrator = MagicMock()
+            orchestrator.session_id = "good-session"
+            if len(made) == 0:
+                orchestrator.run_full_debate.side_effect = RuntimeError("boom")
+            made.append(orchestrator)
+            return orchestrator
+
+        made = []
+        test_console = Console(record=True, width=120)
+        with patch("src.cli.DebateOrchestrator", side_effect=make), \
+                patch("src.cli.get_team_personas", return_value=[]), \
+                patch("src.cli.Storage"), \
+                patch("src.cli.console", test_console):
+            session_id = _review_file_changes(files, concurrency=1)
+
+        assert session_id == "good-session"
+        assert "Error reviewing bad.py: boom" in test_console.export_text()
+
 
 class TestTeamsCommand:
     """Tests for the teams command."""
@@ -281,6 +864,53 @@ class TestTeamsCommand:
         assert result.exit_code == 0 or "team" in result.output.lower() or "Teams" in result.output
 
 
+class TestAddPersonaCommand:
+    """Tests for the add-persona command."""
+
+    @patch("src.cli.save_custom_persona")
+    @patch("src.cli.get_persona_by_name", return_value=None)
+    def test_add_persona_prompts_without_terminal(self, mock_get, mock_save, runner):
+        """Without a terminal, the prompt and priorities are read line by line."""
+        result = runner.invoke(
+            cli,
+            ["add-persona", "-n", "DBExpert", "-r", "DBA", "-s", "terse"],
+            input="Checks queries.\nLooks at indexes.\n\nIndexes\nLocks\n\n",
+        )
+
+        assert result.exit_code == 0
+        persona = mock_save.call_args[0][0]
+        assert persona.system_prompt == "Checks queries.\nLooks at indexes."
+        assert persona.priorities == ["Indexes", "Locks"]
+
+    @patch("src.cli.save_custom_persona")
+    @patch("src.cli.get_persona_by_name", return_value=None)
+    def test_add_persona_uses_editor(self, mock_get, mock_save, runner):
+        """Editor input replaces the prompts, capped at five priorities."""
+        edited = ["Checks queries.\nLooks at indexes.", "a\nb\n\nc\nd\ne\nf"]
+        with patch("src.cli._edit_multiline", side_effect=edited):
+            result = runner.invoke(cli, ["add-persona", "-n", "DBExpert", "-r", "DBA", "-s", "terse"])
+
+        assert result.exit_code == 0
+        persona = mock_save.call_args[0][0]
+        assert persona.system_prompt == "Checks queries.\nLooks at indexes."
+        assert persona.priorities == ["a", "b", "c", "d", "e"]
+
+    def test_edit_multiline_drops_comment_lines(self):
+        """Instruction lines and surrounding blank lines are removed."""
+        with patch("src.cli.sys.stdin") as mock_stdin, \
+                patch("src.cli.click.edit", return_value="# hint\n\nline one\n  line two\n\n") as mock_edit:
+            mock_stdin.isatty.return_value = True
+            assert _edit_multiline("hint") == "line one\n  line two"
+        assert mock_edit.call_args[0][0].startswith("# hint\n")
+
+    def test_edit_multiline_needs_terminal(self):
+        """No editor is launched when stdin is not a terminal."""
+        with patch("src.cli.sys.stdin") as mock_stdin, patch("src.cli.click.edit") as mock_edit:
+            mock_stdin.isatty.return_value = False
+            assert _edit_multiline("hint") is None
+        mock_edit.assert_not_called()
+
+
 class TestCLIIntegration:
     """Integration tests for CLI commands."""
 
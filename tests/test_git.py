@@ -0,0 +1,76 @@
+"""Tests for git helper functions."""
+import dataclasses
+import shutil
+import subprocess
+
+import pytest
+
+from src.git.helpers import ChangedFile, get_staged_changes, get_uncommitted_changes
+
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(repo, *args):
+    """Run a git command in a test repository."""
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=repo, check=True, capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create a repository with one committed file."""
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "keep.py").write_text("a = 1\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-qm", "init")
+    return tmp_path
+
+
+class TestChangeDiffs:
+    """Tests for collecting per-file diffs of changes."""
+
+    def test_non_utf8_file_does_not_break_diffs(self, repo):
+        """A latin-1 file should get a replaced-character diff, not an error."""
+        (repo / "latin.py").write_bytes(b"name = 'caf\xe9'\n")
+        _git(repo, "add", "latin.py")
+        _git(repo, "commit", "-qm", "add latin")
+        (repo / "latin.py").write_bytes(b"name = 'caf\xe9s'\n")
+        (repo / "keep.py").write_text("a = 2\n")
+
+        diffs = {f.path: f.diff for f in get_uncommitted_changes(str(repo))}
+
+        assert "+name = 'caf�s'" in diffs["latin.py"]
+        assert "+a = 2" in diffs["keep.py"]
+
+    def test_staged_non_utf8_file(self, repo):
+        """Staged changes should also decode non-UTF-8 content with replacement."""
+        (repo / "latin.py").write_bytes(b"x = '\xff'\n")
+        _git(repo, "add", "latin.py")
+
+        diffs = {f.path: f.diff for f in get_staged_changes(str(repo))}
+
+        assert "+x = '�'" in diffs["latin.py"]
+
+
+class TestChangedFile:
+    """Tests for the ChangedFile dataclass."""
+
+    def test_content_read_lazily(self, repo):
+        """Content should come from disk on first access, not on comparison."""
+        changed = ChangedFile(path="keep.py", status="M", diff="", _repo_root=str(repo))
+
+        assert changed == ChangedFile(path="keep.py", status="M", diff="")
+        assert "content" not in vars(changed)
+        assert changed.content == "a = 1\n"
+        assert dataclasses.asdict(changed)["path"] == "keep.py"
+
+    def test_untracked_file_content(self, repo):
+        """Untracked files should expose their contents."""
+        (repo / "new.py").write_text("b = 2\n")
+
+        files = {f.path: f for f in get_uncommitted_changes(str(repo))}
+
+        assert files["new.py"].content == "b = 2\n"
@@ -1,4 +1,5 @@
 """Tests for DebateOrchestrator - multi-agent debate coordination."""
+import asyncio
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch, PropertyMock
@@ -6,7 +7,7 @@ from io import StringIO
 
 import pytest
 
-from src.orchestrator.debate import DebateOrchestrator
+from src.orchestrator.debate import STREAM_TAIL_CHARS, DebateOrchestrator, canonical, majority
 from src.agents.personas import PERSONAS, SecurityExpert, PragmaticDev
 from src.agents.agent import Agent, ReviewResult, ResponseResult, VoteResult
 from src.models.review import Review, Response, Vote, Consensus, VoteDecision
@@ -186,6 +187,36 @@ class TestDebateOrchestratorReview:
 
         assert orchestrator.context == "Test context"
 
+    @patch.object(Agent, 'review_streaming')
+    def test_streaming_review_stores_reviews(self, mock_stream, storage, quiet_console, mock_agent_review):
+        """run_streaming_review should stream long output and store each review."""
+        tokens = [f"t{n:04d} " for n in range(1000)]
+
+        def fake_stream(code, context, on_token, language=None):
+            for token in tokens:
+                on_token(token)
+            return mock_agent_review
+
+        mock_stream.side_effect = fake_stream
+
+        orchestrator = DebateOrchestrator(
+            personas=[SecurityExpert],
+            storage=storage,
+            console=quiet_console,
+            use_cache=False,
+        )
+        with patch("src.orchestrator.debate.Live") as mock_live:
+            orchestrator.run_streaming_review("x = 1")
+
+        assert len(storage.get_reviews(orchestrator.session_id)) == 1
+
+        # The final frame shows only the last STREAM_TAIL_CHARS of the stream
+        final_frame = mock_live.return_value.__enter__.return_value.update.call_args[0][0]
+        panel = final_frame.renderables[0].renderables[0]
+        shown, _, status = panel.renderable.plain.rpartition("\n\n")
+        assert shown == "..." + "".join(tokens)[-STREAM_TAIL_CHARS:]
+        assert status == "✓ Complete"
+
 
 class TestDebateOrchestratorResponses:
     """Tests for the response round."""
@@ -376,6 +407,38 @@ class TestDebateOrchestratorConsensus:
         # Tie-breaker: REJECT wins
         assert consensus.final_decision == VoteDecision.REJECT
 
+    @patch.object(Agent, 'review')
+    @patch.object(Agent, 'vote')
+    def test_build_consensus_merges_near_duplicate_issues(
+        self,
+        mock_vote,
+        mock_review,
+        storage,
+        quiet_console,
+    ):
+        """Issues differing only in case/whitespace count as one shared issue."""
+        mock_review.side_effect = [
+            ReviewResult("A", [{"description": "Missing  input validation", "severity": "LOW"}],
+                         ["Add tests"], "LOW", 0.9, ""),
+            ReviewResult("B", [{"description": "missing input validation ", "severity": "LOW"}],
+                         ["add   tests"], "LOW", 0.9, ""),
+        ]
+        mock_vote.return_value = VoteResult("Test", VoteDecision.APPROVE, "Good")
+
+        orchestrator = DebateOrchestrator(
+            personas=[SecurityExpert, PragmaticDev],
+            storage=storage,
+            console=quiet_console,
+            use_cache=False,
+        )
+
+        orchestrator.start_review("x = 1")
+        orchestrator.run_voting()
+        consensus = orchestrator.build_consensus()
+
+        assert len(consensus.key_issues) == 1
+        assert len(consensus.accepted_suggestions) == 1
+
 
 class TestDebateOrchestratorQuickReview:
     """Tests for quick review mode."""
@@ -507,6 +570,105 @@ class TestDebateOrchestratorFullDebate:
         assert len(orchestrator.reviews) == 1
         assert len(orchestrator.votes) == 1
 
+    @patch.object(Agent, 'review')
+    @patch.object(Agent, 'respond_to')
+    @patch.object(Agent, 'vote')
+    def test_run_full_debate_early_exit(
+        self,
+        mock_vote,
+        mock_respond,
+        mock_review,
+        storage,
+        quiet_console,
+        mock_agent_review,
+    ):
+        """run_full_debate(early_exit=True) should skip debate on a Round 1 majority."""
+        mock_review.return_value = mock_agent_review
+
+        orchestrator = DebateOrchestrator(
+            personas=[SecurityExpert],
+            storage=storage,
+            console=quiet_console,
+            use_cache=False,
+        )
+
+        consensus = orchestrator.run_full_debate("x = 1", early_exit=True)
+
+        assert consensus is not None
+        mock_respond.assert_not_called()
+        mock_vote.assert_not_called()
+        assert orchestrator.votes == []
+
+    @patch.object(Agent, 'review')
+    @patch.object(Agent, 'respond_to')
+    @patch.object(Agent, 'vote')
+    def test_arun_full_debate(
+        self,
+        mock_vote,
+        mock_respond,
+        mock_review,
+        storage,
+        quiet_console,
+        mock_agent_review,
+        mock_agent_response,
+        mock_agent_vote,
+    ):
+        """arun_full_debate should complete all rounds from an event loop."""
+        mock_review.return_value = mock_agent_review
+        mock_respond.return_value = mock_agent_response
+        mock_vote.return_value = mock_agent_vote
+
+        orchestrator = DebateOrchestrator(
+            personas=[SecurityExpert],
+            storage=storage,
+            console=quiet_console,
+            use_cache=False,
+        )
+
+        consensus = asyncio.run(orchestrator.arun_full_debate("x = 1"))
+
+        assert consensus is orchestrator.consensus
+        assert len(orchestrator.votes) == 1
+
+    def test_max_parallel_agents_bounds_pool(self, storage, quiet_console):
+        """max_parallel_agents should cap the per-round worker count."""
+        orchestrator = DebateOrchestrator(
+            storage=storage, console=quiet_console, max_parallel_agents=2
+        )
+        assert orchestrator._pool_size == 2
+
+        unbounded = DebateOrchestrator(storage=storage, console=quiet_console)
+        assert unbounded._pool_size == len(unbounded.agents)
+
+
+class TestCanonical:
+    """Tests for issue text canonicalization."""
+
+    def test_canonical_normalizes_case_whitespace_and_quotes(self):
+        """Cosmetic differences should not affect the canonical form."""
+        assert canonical("  Use \u201cparams\u201d\n  here ") == canonical('use "params" here')
+
+
+class TestMajority:
+    """Tests for the strict-majority helper."""
+
+    def test_majority_found(self):
+        """A candidate held by more than half the voters wins."""
+        assert majority(["A", "A", "B"]) == "A"
+
+    def test_no_majority_on_tie(self):
+        """A tie is not a strict majority."""
+        assert majority(["A", "A", "B", "B"]) is None
+
+    def test_missing_voters_count_against(self):
+        """Voters without a candidate still count toward n."""
+        assert majority(["A", "A"], n=4) is None
+        assert majority(["A", "A", "A"], n=4) == "A"
+
+    def test_empty(self):
+        """No candidates means no majority."""
+        assert majority([]) is None
+
 
 class TestDebateOrchestratorDisplay:
     """Tests for display methods."""
@@ -529,6 +691,19 @@ class TestDebateOrchestratorDisplay:
         # Should not raise
         orchestrator._display_vote(sample_vote)
 
+    def test_display_review_renders_text_literally(self, storage, sample_review):
+        """Review text containing brackets should not be parsed as markup."""
+        console = Console(record=True, width=120)
+        orchestrator = DebateOrchestrator(storage=storage, console=console)
+        sample_review.issues = [{"description": "items[0] may be [red]", "severity": "HIGH",
+                                 "fix": "check len(items)"}]
+        orchestrator._display_review(sample_review)
+
+        output = console.export_text()
+        assert "Severity: CRITICAL" in output
+        assert "\u2022 items[0] may be [red]" in output
+        assert "Fix: check len(items)" in output
+
 
 class TestAgentReviewTask:
     """Tests for _agent_review_task with caching."""
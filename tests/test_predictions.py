@@ -294,6 +294,25 @@ class TestPredictionStorage:
         assert len(unresolved) == 1
         assert unresolved[0].prediction_id == pred2.prediction_id
 
+    def test_resolve_prediction_id(self, storage):
+        """Test resolving ID prefixes to unresolved predictions."""
+        for prediction_id in ("abc111", "abc222", "abd333"):
+            storage.save_prediction(Prediction(
+                prediction_id=prediction_id,
+                code_hash="hash",
+                file_path="/file.py",
+                prediction_type=PredictionType.BUG_WILL_OCCUR,
+            ))
+        storage.save_outcome(Outcome(
+            prediction_id="abc222",
+            actual_result=OutcomeResult.SAFE,
+        ))
+
+        assert storage.resolve_prediction_id("abc") == [("abc111", "/file.py")]
+        assert [m[0] for m in storage.resolve_prediction_id("ab")] == ["abc111", "abd333"]
+        assert [m[0] for m in storage.resolve_prediction_id("ab", limit=1)] == ["abc111"]
+        assert storage.resolve_prediction_id("zzz") == []
+
     def test_save_and_get_bet(self, storage):
         """Test saving and retrieving bets."""
         # Create prediction first
@@ -42,6 +42,20 @@ class TestExploitResult:
         assert "PoC" in result.poc_warning
         assert "authorized" in result.poc_warning.lower()
 
+    def test_exploit_result_is_frozen(self):
+        """Test ExploitResult cannot be mutated after creation."""
+        from dataclasses import FrozenInstanceError
+
+        result = ExploitResult(
+            vulnerability_type="xss",
+            exploit_code="<script>alert(1)</script>",
+            payload="<script>alert(1)</script>",
+            curl_command="N/A",
+            explanation="XSS attack",
+        )
+        with pytest.raises(FrozenInstanceError):
+            result.payload = "changed"
+
     def test_exploit_result_success_indicators(self):
         """Test ExploitResult can have success indicators."""
         result = ExploitResult(
@@ -143,7 +157,7 @@ class TestRedTeamAgent:
     @pytest.fixture
     def agent(self):
         """Create a RedTeamAgent instance."""
-        with patch('src.agents.redteam.Anthropic'):
+        with patch('anthropic.Anthropic'):
             return RedTeamAgent(session_id="test-session")
 
     def test_agent_creation(self, agent):
@@ -157,6 +171,26 @@ class TestRedTeamAgent:
         assert "RedTeamAgent" in repr_str
         assert "RedTeam" in repr_str
 
+    def test_client_created_lazily(self):
+        """Test the Anthropic client is only built on first access."""
+        with patch('anthropic.Anthropic') as mock_anthropic:
+            agent = RedTeamAgent()
+            mock_anthropic.assert_not_called()
+            assert agent.client is mock_anthropic.return_value
+            assert agent.client is mock_anthropic.return_value
+            mock_anthropic.assert_called_once()
+
+    def test_call_api_joins_streamed_text(self):
+        """Test _call_api assembles the streamed response chunks."""
+        agent = RedTeamAgent()
+        stream = MagicMock()
+        stream.text_stream = iter(['{"payload": ', '"x"}'])
+        agent.client = MagicMock()
+        agent.client.messages.stream.return_value.__enter__.return_value = stream
+
+        assert agent._call_api("system", "user") == '{"payload": "x"}'
+        agent.client.messages.stream.assert_called_once()
+
     def test_generate_exploit_validates_vulnerability_type(self, agent):
         """Test generate_exploit validates vulnerability type."""
         with pytest.raises(ValueError) as exc_info:
@@ -262,6 +296,25 @@ class TestRedTeamAgent:
         assert "+" in result.diff
         assert "-" in result.diff
 
+    def test_analyze_returns_exploit_and_patch(self, agent, mock_patch_response):
+        """Test analyze generates an exploit followed by its patch."""
+        exploit_response = json.dumps({
+            "exploit_code": "' OR 1=1 --",
+            "payload": "admin'--",
+            "curl_command": "N/A",
+            "explanation": "SQL injection",
+        })
+        agent._call_api = MagicMock(side_effect=[exploit_response, mock_patch_response])
+
+        exploit, patch_result = agent.analyze(
+            code="query = f'SELECT * FROM users WHERE id={user_id}'",
+            vulnerability="sql_injection",
+        )
+
+        assert exploit.payload == "admin'--"
+        assert isinstance(patch_result, PatchResult)
+        assert agent._call_api.call_count == 2
+
     def test_parse_json_response_handles_markdown_blocks(self, agent):
         """Test JSON parsing handles markdown code blocks."""
         markdown_response = '''```json
@@ -282,6 +335,12 @@ class TestRedTeamAgent:
         result = agent._parse_json_response(plain_response)
         assert result["key"] == "value"
 
+    def test_parse_json_response_repairs_raw_control_chars(self, agent):
+        """Test JSON parsing escapes raw newlines/tabs inside strings."""
+        raw_response = '{"exploit_code": "line1\nline2\tend\x01"}'
+        result = agent._parse_json_response(raw_response)
+        assert result["exploit_code"] == "line1\nline2\tend"
+
     def test_build_exploit_prompt_includes_vulnerability_instructions(self, agent):
         """Test exploit prompt includes vulnerability-specific instructions."""
         prompt = agent._build_exploit_prompt("sql_injection")
@@ -291,6 +350,11 @@ class TestRedTeamAgent:
         prompt = agent._build_exploit_prompt("xss")
         assert "XSS" in prompt or "Cross-Site" in prompt
 
+    def test_build_exploit_prompt_is_cached(self, agent):
+        """Test exploit prompts are prebuilt once per vulnerability type."""
+        first = agent._build_exploit_prompt("path_traversal")
+        assert agent._build_exploit_prompt("path_traversal") is first
+
     def test_build_patch_prompt_includes_fix_instructions(self, agent):
         """Test patch prompt includes fix instructions."""
         prompt = agent._build_patch_prompt("sql_injection")
@@ -307,7 +371,7 @@ class TestEdgeCases:
     @pytest.fixture
     def agent(self):
         """Create a RedTeamAgent instance."""
-        with patch('src.agents.redteam.Anthropic'):
+        with patch('anthropic.Anthropic'):
             return RedTeamAgent()
 
     def test_empty_code_still_works(self, agent):
@@ -1,7 +1,9 @@
 """Tests for SQLite storage layer."""
+import sqlite3
 import tempfile
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -43,6 +45,113 @@ class TestStorageInit:
         storage2 = Storage(db_path=temp_db_path)
         # Should not raise
 
+    def test_connection_reused_per_thread(self, temp_db_path):
+        """Storage should keep one connection per thread across calls."""
+        import threading
+
+        storage = Storage(db_path=temp_db_path)
+        conn = storage._get_connection()
+        storage.create_session("code")
+        assert storage._get_connection() is conn
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(storage._get_connection()))
+        thread.start()
+        thread.join()
+        assert other[0] is not conn
+
+        storage.close()
+        assert storage._get_connection() is not conn
+
+    def test_instances_share_connection_and_schema_setup(self, temp_db_path):
+        """Storage instances for one path should share a connection and init once."""
+        first = Storage(db_path=temp_db_path)
+        with patch.object(Storage, "_init_db") as init_db:
+            second = Storage(db_path=temp_db_path)
+
+        init_db.assert_not_called()
+        assert second._get_connection() is first._get_connection()
+
+    def test_recreates_deleted_database(self, temp_db_path):
+        """A new Storage should write to a fresh file if the old one was deleted."""
+        first = Storage(db_path=temp_db_path)
+        first.create_session("old")
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{temp_db_path}{suffix}").unlink(missing_ok=True)
+
+        second = Storage(db_path=temp_db_path)
+        session_id = second.create_session("new")
+
+        assert temp_db_path.exists()
+        reader = sqlite3.connect(str(temp_db_path))
+        rows = reader.execute("SELECT session_id FROM sessions").fetchall()
+        reader.close()
+        assert rows == [(session_id,)]
+
+    def test_failed_write_rolls_back(self, temp_db_path):
+        """An error inside a write should not leave a pending transaction behind."""
+        storage = Storage(db_path=temp_db_path)
+        session_id = storage.create_session("code")
+
+        with pytest.raises(sqlite3.IntegrityError):
+            with storage._get_connection() as conn:
+                conn.execute("UPDATE sessions SET final_decision = 'APPROVE'")
+                conn.execute(
+                    "INSERT INTO sessions (session_id, code_snippet, created_at) VALUES (?, 'x', 'now')",
+                    (session_id,),
+                )
+        storage.create_session("other")
+
+        assert storage.get_session(session_id)["final_decision"] is None
+
+    def test_transaction_commits_once(self, temp_db_path, sample_review):
+        """Writes inside transaction() should become visible together at the end."""
+        storage = Storage(db_path=temp_db_path)
+        session_id = storage.create_session("code")
+        reader = sqlite3.connect(str(temp_db_path))
+
+        with storage.transaction():
+            storage.save_review(sample_review, session_id)
+            with storage.transaction():
+                storage.save_review(sample_review, session_id)
+            storage.get_reviews(session_id)
+            assert reader.execute("SELECT COUNT(*) FROM reviews").fetchone()[0] == 0
+
+        assert reader.execute("SELECT COUNT(*) FROM reviews").fetchone()[0] == 2
+        reader.close()
+
+    def test_transaction_rolls_back_on_error(self, temp_db_path, sample_review):
+        """An error inside transaction() should discard all of its writes."""
+        storage = Storage(db_path=temp_db_path)
+        session_id = storage.create_session("code")
+
+        with pytest.raises(RuntimeError):
+            with storage.transaction():
+                storage.save_review(sample_review, session_id)
+                raise RuntimeError("boom")
+
+        assert storage.get_reviews(session_id) == []
+        storage.save_review(sample_review, session_id)
+        assert len(storage.get_reviews(session_id)) == 1
+
+    def test_storage_uses_wal(self, temp_db_path):
+        """Storage should put the database in WAL journal mode."""
+        storage = Storage(db_path=temp_db_path)
+
+        conn = storage._get_connection()
+        try:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            indexes = {
+                row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='index'"
+                )
+            }
+        finally:
+            storage.close()
+
+        assert mode == "wal"
+        assert "idx_sessions_created" in indexes
+
 
 class TestStorageSessions:
     """Tests for session operations."""
@@ -102,6 +211,79 @@ class TestStorageSessions:
         # Most recent should be first
         assert sessions[0]["code_snippet"] == "second"
 
+    def test_list_sessions_before(self, storage):
+        """list_sessions(before=...) should page through older sessions."""
+        for i in range(5):
+            storage.create_session(f"code{i}")
+
+        first_page = storage.list_sessions(limit=2)
+        second_page = storage.list_sessions(limit=2, before=first_page[-1]["created_at"])
+
+        assert [s["code_snippet"] for s in first_page] == ["code4", "code3"]
+        assert [s["code_snippet"] for s in second_page] == ["code2", "code1"]
+
+    def test_list_sessions_preview(self, storage):
+        """list_sessions_preview should truncate and flatten snippets in SQL."""
+        storage.create_session("short\ncode")
+        storage.create_session("x" * 500, context="ctx")
+
+        long_row, short_row = storage.list_sessions_preview(width=40)
+        assert long_row["preview"] == "x" * 37 + "..."
+        assert short_row["preview"] == "short code"
+        assert "code_snippet" not in long_row
+        assert long_row["created_at_short"] == long_row["created_at"][:16].replace("T", " ")
+
+    def test_list_sessions_preview_before(self, storage):
+        """list_sessions_preview should page with the same cursor as list_sessions."""
+        for i in range(3):
+            storage.create_session(f"code{i}")
+
+        first_page = storage.list_sessions_preview(limit=2)
+        second_page = storage.list_sessions_preview(limit=2, before=first_page[-1]["created_at"])
+        assert [s["preview"] for s in first_page + second_page] == ["code2", "code1", "code0"]
+
+    def test_find_sessions_by_prefix(self, storage):
+        """find_sessions_by_prefix should match on the leading ID characters."""
+        session_id = storage.create_session("code")
+        storage.create_session("other")
+
+        assert storage.find_sessions_by_prefix(session_id[:8]) == [session_id]
+
+    def test_find_sessions_by_prefix_treats_wildcards_literally(self, storage):
+        """Wildcard characters in the prefix should not match arbitrary characters."""
+        storage.create_session("code")
+
+        assert storage.find_sessions_by_prefix("%") == []
+        assert storage.find_sessions_by_prefix("_") == []
+
+    def test_find_sessions_by_prefix_full_id(self, storage):
+        """A complete session ID should match exactly that session."""
+        session_id = storage.create_session("code")
+
+        assert storage.find_sessions_by_prefix(session_id) == [session_id]
+
+    def test_find_sessions_by_prefix_limit(self, storage):
+        """Matches should come back in ID order, capped at the limit."""
+        ids = [storage.create_session("code") for _ in range(3)]
+
+        assert storage.find_sessions_by_prefix("", limit=2) == sorted(ids)[:2]
+        assert storage.find_sessions_by_prefix("zzz-no-such-id") == []
+
+    def test_find_sessions_by_prefix_uses_index(self, storage):
+        """The prefix lookup should be an index range scan, not a table scan."""
+        conn = storage._get_connection()
+        statements = []
+        conn.set_trace_callback(statements.append)
+        try:
+            storage.find_sessions_by_prefix("ab")
+            conn.set_trace_callback(None)
+            (query,) = [sql for sql in statements if sql.lstrip().startswith("SELECT")]
+            plan = " ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}"))
+        finally:
+            conn.set_trace_callback(None)
+            storage.close()
+        assert "SEARCH sessions USING" in plan and "INDEX" in plan
+
 
 class TestStorageReviews:
     """Tests for review operations."""
@@ -240,6 +422,14 @@ class TestStorageVotes:
         assert VoteDecision.REJECT in decisions
         assert VoteDecision.ABSTAIN in decisions
 
+    def test_save_vote_with_string_decision(self, storage):
+        """Votes built with a plain string decision should round-trip as VoteDecision."""
+        session_id = storage.create_session("test code")
+        storage.save_vote(Vote(agent_name="Test", decision="REJECT"), session_id)
+
+        votes = storage.get_votes(session_id)
+        assert votes[0].decision is VoteDecision.REJECT
+
     def test_get_votes_empty(self, storage):
         """get_votes should return empty list if no votes."""
         session_id = storage.create_session("test code")
@@ -304,6 +494,46 @@ class TestStorageConsensus:
         assert session["completed_at"] is not None
 
 
+class TestStorageFullSession:
+    """Tests for loading a whole session at once."""
+
+    def test_get_full_session(
+        self, storage, sample_review, sample_response, sample_vote, sample_consensus
+    ):
+        """get_full_session should return the session and every artifact."""
+        session_id = storage.create_session("test code", "ctx")
+        storage.save_review(sample_review, session_id)
+        storage.save_response(sample_response, session_id)
+        storage.save_vote(sample_vote, session_id)
+        sample_consensus.session_id = session_id
+        storage.save_consensus(sample_consensus)
+
+        bundle = storage.get_full_session(session_id)
+
+        assert bundle.session["code_snippet"] == "test code"
+        assert [r.agent_name for r in bundle.reviews] == ["SecurityExpert"]
+        assert len(bundle.responses) == 1
+        assert bundle.votes[0].decision == VoteDecision.REJECT
+        assert bundle.consensus.context == "ctx"
+        created_at = bundle.session["created_at"]
+        assert bundle.session["created_at_full"] == created_at[:19].replace("T", " ")
+
+    def test_get_full_session_not_found(self, storage):
+        """get_full_session should return None for unknown ID."""
+        assert storage.get_full_session("nonexistent-id") is None
+
+    def test_get_full_session_inside_transaction(self, storage, sample_review):
+        """get_full_session should see uncommitted writes of an open transaction()."""
+        with storage.transaction():
+            session_id = storage.create_session("test code")
+            storage.save_review(sample_review, session_id)
+
+            bundle = storage.get_full_session(session_id)
+
+        assert bundle.session["code_snippet"] == "test code"
+        assert len(bundle.reviews) == 1
+
+
 class TestStorageStats:
     """Tests for aggregate statistics."""
 
@@ -369,6 +599,21 @@ class TestStorageStats:
         assert stats["agreement_breakdown"]["PARTIAL"] == 1
         assert stats["agreement_breakdown"]["DISAGREE"] == 1
 
+    def test_get_stats_cached_until_new_rows(self, storage, sample_consensus):
+        """get_stats should reuse its result until rows are added."""
+        session_id = storage.create_session("test code")
+        first = storage.get_stats()
+        first["vote_breakdown"]["APPROVE"] = 99
+        cached = storage._stats_cache
+
+        assert storage.get_stats()["vote_breakdown"] == {}
+        assert storage._stats_cache is cached
+
+        sample_consensus.session_id = session_id
+        storage.save_consensus(sample_consensus)
+        stats = storage.get_stats()
+        assert stats["completed_sessions"] == 1
+
 
 class TestStorageConnectionManagement:
     """Tests for database connection management."""